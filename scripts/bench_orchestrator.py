@@ -0,0 +1,385 @@
+#!/usr/bin/env python3
+"""End-to-end orchestrator benchmark driven by `fake_codex.py`.
+
+For every (depth, age) pair it scaffolds a run with `rbd_run.sh --skip-exec`,
+ages it to `age` iterations with fake-codex artifacts, then measures:
+
+- snapshot: `copy_tree` per snapshot mode (one worker workspace),
+- records: `collect_records` cold (cache off) and warm (cache on, primed),
+- merge: `merge_worker_iteration` of one fresh ACCEPT worker iteration,
+- epoch: one `rbd_parallel_links.py --max-epochs 1` epoch against fake codex
+  deciding ACCEPT.
+
+The merge and epoch phases exit non-zero if nothing was merged, so a gate
+change that silently blocks merges fails the benchmark instead of speeding it up.
+
+Each measurement prints one `orchestrator_benchmark=` JSON line; `--markdown`
+adds a summary table.
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import os
+import shutil
+import subprocess
+import sys
+import tempfile
+import time
+from pathlib import Path
+from typing import Any
+
+import fake_codex
+import rbd_parallel_links as links
+from rbd_api import StabilizerAPI, load_stabilizer
+
+SCRIPT_DIR = Path(__file__).resolve().parent
+REPO_ROOT = SCRIPT_DIR.parent
+PHASES = ("snapshot", "records", "merge", "epoch")
+BENCH_PROMPT = """Build a command-line todo manager in Python.
+
+Requirements:
+1. Provide add, list and complete commands in todo.py.
+2. Persist tasks to a JSON file named tasks.json.
+3. Document usage in README.md with examples.
+"""
+
+
+def parse_int_list(raw: str, flag: str) -> list[int]:
+    values: list[int] = []
+    for part in raw.split(","):
+        part = part.strip()
+        if not part:
+            continue
+        if "-" in part:
+            lo, _, hi = part.partition("-")
+            values.extend(range(int(lo), int(hi) + 1))
+        else:
+            values.append(int(part))
+    if not values or min(values) < 1:
+        raise SystemExit(f"{flag} must list integers >= 1")
+    return sorted(set(values))
+
+
+def parse_args() -> argparse.Namespace:
+    p = argparse.ArgumentParser(
+        description="Benchmark orchestrator overhead against the fake codex stand-in."
+    )
+    p.add_argument("--depths", default="1-10", help="Depths, e.g. `1-10` or `1,3,5` (default: 1-10).")
+    p.add_argument(
+        "--ages",
+        default="10,50,100,500",
+        help="Run ages in iterations, e.g. `10,100` (default: 10,50,100,500).",
+    )
+    p.add_argument(
+        "--phases",
+        default=",".join(PHASES),
+        help=f"Comma-separated subset of: {', '.join(PHASES)} (default: all).",
+    )
+    p.add_argument(
+        "--snapshot-modes",
+        default="copy,hardlink,auto",
+        help="Snapshot modes timed by the snapshot phase (default: copy,hardlink,auto).",
+    )
+    p.add_argument(
+        "--work-dir",
+        default="",
+        help="Scratch directory for generated runs (default: a temporary directory, removed on exit).",
+    )
+    p.add_argument(
+        "--epoch-timeout-seconds",
+        type=int,
+        default=600,
+        help="Wall-clock limit for one benchmark epoch (default: 600).",
+    )
+    p.add_argument("--markdown", action="store_true", help="Also print a markdown summary table.")
+    return p.parse_args()
+
+
+def elapsed_ms(start: float) -> float:
+    return round((time.perf_counter() - start) * 1000.0, 2)
+
+
+def scaffold_run(work_dir: Path, depth: int) -> Path:
+    prompt_path = work_dir / "prompt.txt"
+    prompt_path.write_text(BENCH_PROMPT, encoding="utf-8")
+    name = f"bench_depth_{depth}"
+    out_root = work_dir / "scaffolds"
+    run_dir = out_root / name
+    if run_dir.exists():
+        return run_dir
+    subprocess.run(
+        [
+            str(SCRIPT_DIR / "rbd_run.sh"),
+            "--prompt",
+            str(prompt_path),
+            "--depth",
+            str(depth),
+            "--name",
+            name,
+            "--out-root",
+            str(out_root),
+            "--skip-exec",
+        ],
+        cwd=REPO_ROOT,
+        check=True,
+        stdout=subprocess.DEVNULL,
+    )
+    return run_dir
+
+
+def write_fake_iteration(
+    rbd: StabilizerAPI,
+    run_root: Path,
+    depth: int,
+    number: int,
+    upper: int,
+    decision: str = "PROVISIONAL_ACCEPT",
+) -> Path:
+    label = f"{number:03d}"
+    chain = f"Rubric_{upper} -> Rubric_{upper - 1}"
+    rbd.module.bootstrap_iteration_scaffold(
+        project_root=run_root,
+        iterations_dir=run_root / "iterations",
+        iteration_label=label,
+        chain=chain,
+        lower=upper - 1,
+        depth=depth,
+    )
+    files = fake_codex.iteration_files(
+        chain=chain,
+        lower=upper - 1,
+        label=label,
+        decision=decision,
+        destabilize=False,
+        requirements=[
+            (f"RQ-{i:02d}", text)
+            for i, text in enumerate(
+                rbd.module.parse_prompt_requirements(run_root / "prompt.txt"), start=1
+            )
+        ],
+    )
+    for rel, text in files.items():
+        fake_codex.write(run_root, rel, text)
+    iteration_dir = run_root / "iterations" / f"iteration_{label}"
+    # What run_autonomous_iteration does once codex exits.
+    rbd.module.snapshot_run_level_outputs_for_iteration(iteration_dir, run_root)
+    return iteration_dir
+
+
+def age_run(rbd: StabilizerAPI, scaffold: Path, dst: Path, depth: int, age: int) -> None:
+    if dst.exists():
+        shutil.rmtree(dst)
+    shutil.copytree(scaffold, dst, symlinks=True)
+    for number in range(1, age + 1):
+        # Walk the chains top-down, as a converging run would.
+        upper = depth - ((number - 1) % depth)
+        write_fake_iteration(rbd, dst, depth, number, upper)
+
+
+def bench_snapshot(run_root: Path, scratch: Path, age: int, modes: list[str]) -> dict[str, Any]:
+    result: dict[str, Any] = {}
+    for mode in modes:
+        dst = scratch / f"snapshot_{mode}"
+        start = time.perf_counter()
+        stats = links.copy_tree(
+            run_root, dst, Path("parallel_epochs"), mode=mode, link_below=age + 1
+        )
+        result[f"{mode}_ms"] = elapsed_ms(start)
+        result[f"{mode}_bytes_copied"] = stats.bytes_copied
+        result["files"] = stats.files
+        result["bytes_total"] = stats.bytes_total
+        shutil.rmtree(dst, ignore_errors=True)
+    return result
+
+
+def bench_records(rbd: StabilizerAPI, run_root: Path) -> dict[str, Any]:
+    iterations_dir = run_root / "iterations"
+    (iterations_dir / rbd.module.RECORD_CACHE_FILE).unlink(missing_ok=True)
+    start = time.perf_counter()
+    records = rbd.collect_records(iterations_dir, cache_mode="off")
+    cold_ms = elapsed_ms(start)
+    rbd.collect_records(iterations_dir, cache_mode="on")
+    start = time.perf_counter()
+    rbd.collect_records(iterations_dir, cache_mode="on")
+    warm_ms = elapsed_ms(start)
+    if not check_identity_invalidation(rbd, run_root):
+        raise SystemExit(
+            "orchestrator_benchmark: record cache kept a stale identity_lock after "
+            "LIQUID_STATE_IDENTITY.md was created at the run root"
+        )
+    return {"records": len(records), "cold_ms": cold_ms, "warm_ms": warm_ms}
+
+
+def check_identity_invalidation(rbd: StabilizerAPI, run_root: Path) -> bool:
+    """Creating a probed-but-missing identity file must invalidate cached records."""
+    iterations_dir = run_root / "iterations"
+    latest = sorted(iterations_dir.glob("iteration_*"))[-1]
+    scoped = latest / "LIQUID_STATE_IDENTITY.md"
+    root_identity = run_root / "LIQUID_STATE_IDENTITY.md"
+    saved = {path: path.read_bytes() for path in (scoped, root_identity) if path.is_file()}
+    try:
+        for path in saved:
+            path.unlink()
+        rbd.collect_records(iterations_dir, cache_mode="on")
+        root_identity.write_text("You are a Liquid State Machine on the Edge of Chaos.\n", encoding="utf-8")
+        cached = rbd.collect_records(iterations_dir, cache_mode="on")
+        fresh = rbd.collect_records(iterations_dir, cache_mode="off")
+        return cached == fresh
+    finally:
+        root_identity.unlink(missing_ok=True)
+        for path, data in saved.items():
+            path.write_bytes(data)
+
+
+def bench_merge(
+    rbd: StabilizerAPI, run_root: Path, scratch: Path, depth: int, age: int
+) -> dict[str, Any]:
+    main_root = scratch / "merge_main"
+    worker_root = scratch / "merge_worker"
+    for path in (main_root, worker_root):
+        links.copy_tree(run_root, path, Path("parallel_epochs"), mode="copy")
+    upper = depth
+    iteration_dir = write_fake_iteration(rbd, worker_root, depth, age + 1, upper, "ACCEPT")
+    record = rbd.resolve_record(iteration_dir)
+    worker = links.WorkerResult(
+        chain=f"Rubric_{upper} -> Rubric_{upper - 1}",
+        worker_root=worker_root,
+        rc=0,
+        iteration_dir=iteration_dir,
+        record=record,
+        stdout_log=scratch / "merge_worker.stdout.log",
+        stderr_log=scratch / "merge_worker.stderr.log",
+    )
+    start = time.perf_counter()
+    merged = links.merge_worker_iteration(rbd=rbd, main_root=main_root, worker=worker)
+    merge_ms = elapsed_ms(start)
+    shutil.rmtree(main_root, ignore_errors=True)
+    shutil.rmtree(worker_root, ignore_errors=True)
+    if merged is None:
+        raise SystemExit(
+            f"merge benchmark did not merge (depth={depth}, age={age}): "
+            f"{links.classify_non_merge_reason(worker)}"
+        )
+    return {"merge_ms": merge_ms, "merged": True}
+
+
+def bench_epoch(run_root: Path, scratch: Path, depth: int, timeout_seconds: int) -> dict[str, Any]:
+    epoch_root = scratch / "epoch_run"
+    links.copy_tree(run_root, epoch_root, Path("parallel_epochs"), mode="copy")
+    env = dict(os.environ)
+    env.update(
+        {"FAKE_CODEX_LATENCY": "0", "FAKE_CODEX_JITTER": "0", "FAKE_CODEX_DECISION": "ACCEPT"}
+    )
+    cmd = [
+        sys.executable,
+        str(SCRIPT_DIR / "rbd_parallel_links.py"),
+        "--project-root",
+        str(epoch_root),
+        "--depth",
+        str(depth),
+        "--max-epochs",
+        "1",
+        "--codex-bin",
+        str(SCRIPT_DIR / "fake_codex.py"),
+        "--worker-max-attempts",
+        "1",
+    ]
+    start = time.perf_counter()
+    proc = subprocess.run(
+        cmd, env=env, capture_output=True, text=True, timeout=timeout_seconds
+    )
+    epoch_ms = elapsed_ms(start)
+    merged = 0
+    for line in proc.stdout.splitlines():
+        if line.startswith("parallel_merge_yield="):
+            merged += int(json.loads(line.partition("=")[2]).get("actual", 0))
+    shutil.rmtree(epoch_root, ignore_errors=True)
+    # rc 2 (max epochs reached before stability) is expected after one epoch.
+    if merged < 1:
+        raise SystemExit(
+            f"epoch benchmark merged no iterations (rc={proc.returncode}, depth={depth})"
+        )
+    return {"epoch_ms": epoch_ms, "rc": proc.returncode, "merged": merged}
+
+
+def emit(row: dict[str, Any]) -> None:
+    print("orchestrator_benchmark=" + json.dumps(row, sort_keys=True), flush=True)
+
+
+def render_markdown(rows: list[dict[str, Any]]) -> str:
+    lines = [
+        "| depth | age | snapshot copy ms | snapshot hardlink ms | records cold ms | records warm ms | merge ms | epoch ms |",
+        "| ---: | ---: | ---: | ---: | ---: | ---: | ---: | ---: |",
+    ]
+    by_key: dict[tuple[int, int], dict[str, Any]] = {}
+    for row in rows:
+        by_key.setdefault((row["depth"], row["age"]), {})[row["phase"]] = row
+    for (depth, age), phases in sorted(by_key.items()):
+        snap = phases.get("snapshot", {})
+        rec = phases.get("records", {})
+        cells = [
+            snap.get("copy_ms", "-"),
+            snap.get("hardlink_ms", "-"),
+            rec.get("cold_ms", "-"),
+            rec.get("warm_ms", "-"),
+            phases.get("merge", {}).get("merge_ms", "-"),
+            phases.get("epoch", {}).get("epoch_ms", "-"),
+        ]
+        lines.append(f"| {depth} | {age} | " + " | ".join(str(c) for c in cells) + " |")
+    return "\n".join(lines)
+
+
+def main() -> int:
+    args = parse_args()
+    depths = parse_int_list(args.depths, "--depths")
+    ages = parse_int_list(args.ages, "--ages")
+    phases = [p.strip() for p in args.phases.split(",") if p.strip()]
+    if not phases or any(p not in PHASES for p in phases):
+        raise SystemExit(f"--phases must be a subset of: {', '.join(PHASES)}")
+    modes = [m.strip() for m in args.snapshot_modes.split(",") if m.strip()]
+    if not modes or any(m not in links.SNAPSHOT_MODES for m in modes):
+        raise SystemExit(f"--snapshot-modes must be a subset of: {', '.join(links.SNAPSHOT_MODES)}")
+    if args.epoch_timeout_seconds < 1:
+        raise SystemExit("--epoch-timeout-seconds must be >= 1")
+
+    rbd = load_stabilizer()
+    owned_tmp = not args.work_dir
+    work_dir = Path(args.work_dir or tempfile.mkdtemp(prefix="rbd_bench_")).resolve()
+    work_dir.mkdir(parents=True, exist_ok=True)
+    print(f"orchestrator_benchmark_work_dir={work_dir}")
+    rows: list[dict[str, Any]] = []
+    try:
+        for depth in depths:
+            scaffold = scaffold_run(work_dir, depth)
+            for age in ages:
+                run_root = work_dir / "aged" / f"depth_{depth}_age_{age}"
+                scratch = work_dir / "scratch"
+                scratch.mkdir(parents=True, exist_ok=True)
+                start = time.perf_counter()
+                age_run(rbd, scaffold, run_root, depth, age)
+                print(f"orchestrator_benchmark_aged=depth_{depth}_age_{age} ms={elapsed_ms(start)}")
+                for phase in phases:
+                    if phase == "snapshot":
+                        data = bench_snapshot(run_root, scratch, age, modes)
+                    elif phase == "records":
+                        data = bench_records(rbd, run_root)
+                    elif phase == "merge":
+                        data = bench_merge(rbd, run_root, scratch, depth, age)
+                    else:
+                        data = bench_epoch(run_root, scratch, depth, args.epoch_timeout_seconds)
+                    row = {"depth": depth, "age": age, "phase": phase, **data}
+                    rows.append(row)
+                    emit(row)
+                shutil.rmtree(run_root, ignore_errors=True)
+    finally:
+        if owned_tmp:
+            shutil.rmtree(work_dir, ignore_errors=True)
+    if args.markdown:
+        print(render_markdown(rows))
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -0,0 +1,211 @@
+#!/usr/bin/env python3
+"""Benchmark prompt-satisfaction requirement matching on large prompts.
+
+Builds a synthetic run whose prompt has `--requirements` numbered requirements,
+each with a primary artifact, an evidence file and a PROMPT_SATISFACTION.md
+entry (shuffled, so entry order does not follow requirement order). It then
+times:
+
+- candidate selection with the all-pairs `requirement_matches_entry` filter
+  against `requirement_candidates` on the inverted index (and checks both
+  return the same entries),
+- `run_level_prompt_satisfaction_complete` cold (empty caches) and warm.
+
+Prints one `prompt_satisfaction_benchmark=` JSON line.
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import random
+import shutil
+import tempfile
+import time
+from pathlib import Path
+from typing import Any
+
+from rbd_api import StabilizerAPI, load_stabilizer
+
+VOCABULARY = (
+    "archive audit billing cache calendar checkout cluster compliance config dashboard "
+    "export feature filter gateway history import inventory invoice ledger locale "
+    "metrics migration notify onboarding payment permission pipeline profile quota "
+    "refund report retention review schedule search session settings shipment "
+    "signup snapshot storage subscription summary support tenant ticket timeline "
+    "token upload usage vendor webhook workflow"
+).split()
+
+
+def parse_args() -> argparse.Namespace:
+    p = argparse.ArgumentParser(
+        description="Benchmark indexed prompt-satisfaction matching against all-pairs matching."
+    )
+    p.add_argument(
+        "--requirements",
+        type=int,
+        default=200,
+        help="Numbered prompt requirements to generate (default: 200).",
+    )
+    p.add_argument("--repeat", type=int, default=5, help="Timed repetitions per measurement (default: 5).")
+    p.add_argument("--seed", type=int, default=0, help="Seed for generated requirement text (default: 0).")
+    p.add_argument(
+        "--work-dir",
+        default="",
+        help="Directory for the generated run (default: a temporary directory, removed on exit).",
+    )
+    return p.parse_args()
+
+
+def requirement_text(rng: random.Random, idx: int) -> str:
+    words = rng.sample(VOCABULARY, 5)
+    return f"Document {' '.join(words)} in `docs/section_{idx:03d}.md`."
+
+
+def build_run(root: Path, count: int, seed: int) -> Path:
+    rng = random.Random(seed)
+    requirements = [requirement_text(rng, idx) for idx in range(1, count + 1)]
+    (root / "prompt.txt").write_text(
+        "Write a documentation set for the operations portal.\n\nRequirements:\n"
+        + "".join(f"{idx}. {req}\n" for idx, req in enumerate(requirements, start=1)),
+        encoding="utf-8",
+    )
+    for sub in ("docs", "evidence", "iterations/iteration_001"):
+        (root / sub).mkdir(parents=True, exist_ok=True)
+    entries: list[str] = []
+    for idx, req in enumerate(requirements, start=1):
+        doc = f"docs/section_{idx:03d}.md"
+        evidence = f"evidence/requirement_{idx:03d}.md"
+        body = req.split(" in `", 1)[0].removeprefix("Document ")
+        (root / doc).write_text(
+            f"# Section {idx}\n\nThis section documents the {body}.\n" * 3, encoding="utf-8"
+        )
+        (root / evidence).write_text(
+            f"# Evidence RQ-{idx:02d}\n\nReviewed `{doc}`: it covers the {body}.\n",
+            encoding="utf-8",
+        )
+        entries.append(
+            "\n".join(
+                [
+                    f"- requirement: {req}",
+                    "  - status: satisfied",
+                    f"  - implementation_artifacts: `{doc}`",
+                    f"  - verification: reviewed {doc} against the requirement text and examples",
+                    f"  - evidence: `{evidence}`",
+                ]
+            )
+        )
+    rng.shuffle(entries)
+    (root / "PROMPT_SATISFACTION.md").write_text(
+        "# Prompt Satisfaction\n" + "\n".join(entries) + "\n", encoding="utf-8"
+    )
+    outputs = {
+        "ARTIFACT_MANIFEST.md": "# Artifact Manifest\n"
+        + "".join(f"- artifact: `docs/section_{idx:03d}.md`\n" for idx in range(1, count + 1)),
+        "RUBRIC_SCORECARD_SUMMARY.md": "# Rubric Scorecard Summary\n- rubric_0_mean: 91.0\n",
+        "FINAL_STATUS.md": "# Final Status\n- documentation set reviewed section by section\n",
+        "OBJECTIVE_SPEC.md": "# Objective Spec\n- every requirement has a reviewed section\n",
+        "BEST_KNOWN_FRONTIER.md": "# Best Known Frontier\n- current documentation set\n",
+    }
+    for name, text in outputs.items():
+        (root / name).write_text(text, encoding="utf-8")
+    return root / "iterations" / "iteration_001"
+
+
+def reset_caches(rbd: StabilizerAPI) -> None:
+    rbd.module.FILE_READ_CACHE.clear()
+    rbd.module.normalize_text.cache_clear()
+    rbd.module.semantic_token_set.cache_clear()
+
+
+def best_ms(samples: list[float]) -> float:
+    return round(min(samples) * 1000.0, 2)
+
+
+def run_benchmark(rbd: StabilizerAPI, root: Path, count: int, seed: int, repeat: int) -> dict[str, Any]:
+    module = rbd.module
+    iter_dir = build_run(root, count, seed)
+    requirements = module.parse_prompt_requirements(root / "prompt.txt")
+    entries = module.parse_prompt_satisfaction_entries(root / "PROMPT_SATISFACTION.md")
+
+    def ids_for(idx: int) -> set[str]:
+        return {f"RQ-{idx}", f"RQ-{idx:02d}", f"REQ-{idx}", f"REQ-{idx:02d}"}
+
+    def all_pairs() -> list[list[Any]]:
+        return [
+            [
+                e
+                for e in entries
+                if module.requirement_matches_entry(req, e)
+                or module.normalize_scalar(e.requirement).strip().upper() in ids_for(idx)
+            ]
+            for idx, req in enumerate(requirements, start=1)
+        ]
+
+    def indexed() -> list[list[Any]]:
+        index = module.build_requirement_match_index(entries)
+        return [
+            module.requirement_candidates(index, req, ids_for(idx))
+            for idx, req in enumerate(requirements, start=1)
+        ]
+
+    pairs_samples: list[float] = []
+    index_samples: list[float] = []
+    for _ in range(repeat):
+        reset_caches(rbd)
+        start = time.perf_counter()
+        expected = all_pairs()
+        pairs_samples.append(time.perf_counter() - start)
+        reset_caches(rbd)
+        start = time.perf_counter()
+        actual = indexed()
+        index_samples.append(time.perf_counter() - start)
+    if actual != expected:
+        raise SystemExit("indexed candidates differ from all-pairs candidates")
+
+    cold_samples: list[float] = []
+    warm_samples: list[float] = []
+    satisfied = False
+    for _ in range(repeat):
+        reset_caches(rbd)
+        start = time.perf_counter()
+        satisfied = module.run_level_prompt_satisfaction_complete(iter_dir)
+        cold_samples.append(time.perf_counter() - start)
+        start = time.perf_counter()
+        module.run_level_prompt_satisfaction_complete(iter_dir)
+        warm_samples.append(time.perf_counter() - start)
+
+    return {
+        "requirements": len(requirements),
+        "entries": len(entries),
+        "candidates": sum(len(c) for c in actual),
+        "all_pairs_match_ms": best_ms(pairs_samples),
+        "indexed_match_ms": best_ms(index_samples),
+        "match_speedup": round(min(pairs_samples) / min(index_samples), 1),
+        "gate_cold_ms": best_ms(cold_samples),
+        "gate_warm_ms": best_ms(warm_samples),
+        "prompt_satisfied": satisfied,
+    }
+
+
+def main() -> int:
+    args = parse_args()
+    if args.requirements < 1:
+        raise SystemExit("--requirements must be >= 1")
+    if args.repeat < 1:
+        raise SystemExit("--repeat must be >= 1")
+    rbd = load_stabilizer()
+    owned_tmp = not args.work_dir
+    root = Path(args.work_dir or tempfile.mkdtemp(prefix="rbd_ps_bench_")).resolve()
+    root.mkdir(parents=True, exist_ok=True)
+    try:
+        result = run_benchmark(rbd, root, args.requirements, args.seed, args.repeat)
+    finally:
+        if owned_tmp:
+            shutil.rmtree(root, ignore_errors=True)
+    print("prompt_satisfaction_benchmark=" + json.dumps(result))
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
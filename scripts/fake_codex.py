@@ -0,0 +1,477 @@
+#!/usr/bin/env python3
+"""Deterministic stand-in for `codex exec` used by local benchmarks and smoke runs.
+
+Honours the contract `run_autonomous_iteration` relies on:
+
+    fake_codex.py exec [-c k=v] [-m model] -C <run-root> --full-auto \
+        --skip-git-repo-check -o <last-message> -  < prompt
+
+It reads the chain and iteration from the prompt and writes a complete
+iteration (judge files, FINAL_DECISION.md, STATUS.md, rubric JSON, scorecard,
+collateral, evidence, deltas, contradictions) under the run root, and rewrites
+the files the prompt requirements name (e.g. `todo.py`). An ACCEPT also
+writes the run-level PROMPT_SATISFACTION.md (one satisfied entry per RQ id),
+OBJECTIVE_SPEC.md, BEST_KNOWN_FRONTIER.md and the other required run outputs,
+so it clears the objective and prompt-satisfaction gates and can be merged.
+
+Behaviour is scripted with environment variables:
+
+- FAKE_CODEX_LATENCY: seconds to sleep before writing (default 0).
+- FAKE_CODEX_JITTER: extra uniform random latency in seconds (default 0).
+- FAKE_CODEX_DECISION: ACCEPT, PROVISIONAL_ACCEPT or REJECT
+  (default PROVISIONAL_ACCEPT).
+- FAKE_CODEX_FAILURE: none, exit, hang, partial, midway, unparseable or
+  policy (default none). midway finishes the baseline judge and author
+  phases, then hangs.
+- FAKE_CODEX_RESUME_FAILURE: failure used instead when the prompt is a
+  continuation of an interrupted session (default none). Continuations
+  only rewrite the phases the prompt lists as remaining.
+- FAKE_CODEX_SEED: seed for jitter (default 0).
+- FAKE_CODEX_SCRIPT: path to a JSON file shaped like
+  {"default": {...}, "chains": {"Rubric_2 -> Rubric_1": {...}},
+   "iterations": {"007": {...}}}. Its keys are latency, jitter, decision,
+  failure, resume_failure and exit_code. Iteration entries override chain entries, and chain
+  entries override defaults.
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import os
+import random
+import re
+import sys
+import time
+from pathlib import Path
+from typing import Any
+
+CHAIN_RE = re.compile(r"chain `Rubric_(\d+) -> Rubric_(\d+)`")
+ITERATION_RE = re.compile(r"iterations/iteration_(\d+)")
+REQUIREMENT_RE = re.compile(r"^\s*-\s*(RQ-\d+):\s*(.+?)\s*$", re.MULTILINE)
+ARTIFACT_REF_RE = re.compile(r"\b[\w-]+(?:/[\w-]+)*\.(?:py|json|md|txt|toml|ya?ml|sh|js|ts|html|css)\b")
+DESTABILIZE_MARKER = "Prompt-coupled destabilization requirement"
+CONTINUATION_MARKER = "Continuation of an interrupted session"
+FINISHED_PHASE_RE = re.compile(r"^\s*-\s*`(judge_baseline|author_deltas|judge_recheck)`:", re.MULTILINE)
+DECISIONS = ("ACCEPT", "PROVISIONAL_ACCEPT", "REJECT")
+FAILURES = ("none", "exit", "hang", "partial", "midway", "unparseable", "policy")
+
+
+def parse_args(argv: list[str]) -> argparse.Namespace:
+    p = argparse.ArgumentParser(description="Deterministic codex exec stand-in.")
+    p.add_argument("command", choices=("exec",), help="Only `exec` is supported.")
+    p.add_argument("-c", dest="config", action="append", default=[], help="Ignored.")
+    p.add_argument("-m", dest="model", default="", help="Ignored.")
+    p.add_argument("-C", dest="cwd", default=".", help="Run root to write into.")
+    p.add_argument("-o", dest="last_message", default="", help="Last message output path.")
+    p.add_argument("--full-auto", action="store_true", help="Ignored.")
+    p.add_argument("--skip-git-repo-check", action="store_true", help="Ignored.")
+    args, extra = p.parse_known_args(argv)
+    # The trailing `-` (prompt on stdin) would otherwise be swallowed as a positional.
+    if [arg for arg in extra if arg != "-"]:
+        p.error("unrecognized arguments: " + " ".join(extra))
+    return args
+
+
+def load_behaviour(chain: str, iteration_label: str) -> dict[str, Any]:
+    behaviour: dict[str, Any] = {
+        "latency": float(os.environ.get("FAKE_CODEX_LATENCY", "0") or 0),
+        "jitter": float(os.environ.get("FAKE_CODEX_JITTER", "0") or 0),
+        "decision": os.environ.get("FAKE_CODEX_DECISION", "PROVISIONAL_ACCEPT"),
+        "failure": os.environ.get("FAKE_CODEX_FAILURE", "none"),
+        "resume_failure": os.environ.get("FAKE_CODEX_RESUME_FAILURE", "none"),
+        "exit_code": 0,
+    }
+    script_path = os.environ.get("FAKE_CODEX_SCRIPT", "")
+    if script_path:
+        script = json.loads(Path(script_path).read_text(encoding="utf-8"))
+        behaviour.update(script.get("default", {}))
+        behaviour.update(script.get("chains", {}).get(chain, {}))
+        behaviour.update(script.get("iterations", {}).get(iteration_label, {}))
+    behaviour["decision"] = str(behaviour["decision"]).upper()
+    behaviour["failure"] = str(behaviour["failure"]).lower()
+    behaviour["resume_failure"] = str(behaviour["resume_failure"]).lower()
+    if behaviour["decision"] not in DECISIONS:
+        raise SystemExit(f"fake_codex: decision must be one of: {', '.join(DECISIONS)}")
+    if {behaviour["failure"], behaviour["resume_failure"]} - set(FAILURES):
+        raise SystemExit(f"fake_codex: failure must be one of: {', '.join(FAILURES)}")
+    return behaviour
+
+
+def write(root: Path, rel: str, text: str) -> None:
+    path = root / rel
+    path.parent.mkdir(parents=True, exist_ok=True)
+    # Replace rather than truncate so hardlinked snapshot files stay intact.
+    tmp = path.with_name(path.name + ".fake_codex.tmp")
+    tmp.write_text(text, encoding="utf-8")
+    os.replace(tmp, path)
+
+
+def file_phase(rel: str) -> str:
+    """Iteration phase a generated file belongs to (see ITERATION_PHASES in rbd_stabilize.py)."""
+    if rel.endswith("/SNAPSHOT.md") or "/judge_baseline/" in rel:
+        return "judge_baseline"
+    if "/judge_recheck/" in rel:
+        return "judge_recheck"
+    if "/author_deltas/" in rel or not rel.startswith("iterations/"):
+        return "author_deltas"
+    return "final_decision"
+
+
+def bullets(title: str, items: list[tuple[str, Any]]) -> str:
+    return "\n".join([f"# {title}", *(f"- {key}: {value}" for key, value in items)]) + "\n"
+
+
+def primary_artifact_refs(requirements: list[tuple[str, str]]) -> list[str]:
+    """Files the prompt requirements name; the fake author edits these in place."""
+    refs: list[str] = []
+    for _, text in requirements:
+        for ref in ARTIFACT_REF_RE.findall(text):
+            if ref not in refs and ref != "prompt.txt":
+                refs.append(ref)
+    return refs
+
+
+def primary_artifact_text(ref: str, label: str, requirements: list[tuple[str, str]]) -> str:
+    covered = [(rq, text) for rq, text in requirements if ref in text] or requirements
+    if ref.endswith(".json"):
+        payload = {
+            "revision": label,
+            "entries": [{"id": rq, "title": text, "done": False} for rq, text in covered],
+        }
+        return json.dumps(payload, indent=2) + "\n"
+    if ref.endswith(".py"):
+        return (
+            f'"""Revision {label}; covers {", ".join(rq for rq, _ in covered)}."""\n\n'
+            "import json\nimport sys\n\n\n"
+            "def main(argv: list[str]) -> int:\n"
+            "    command = argv[0] if argv else \"list\"\n"
+            "    print(json.dumps({\"command\": command, \"args\": argv[1:]}))\n"
+            "    return 0\n\n\n"
+            'if __name__ == "__main__":\n'
+            "    raise SystemExit(main(sys.argv[1:]))\n"
+        )
+    return "\n".join(
+        [f"# {Path(ref).stem} (revision {label})", ""]
+        + [f"- {rq}: {text}" for rq, text in covered]
+    ) + "\n"
+
+
+def iteration_files(
+    *,
+    chain: str,
+    lower: int,
+    label: str,
+    decision: str,
+    destabilize: bool,
+    requirements: list[tuple[str, str]],
+) -> dict[str, str]:
+    rq_ids = ", ".join(rq for rq, _ in requirements) or "none"
+    baseline_mean = 62.0 if destabilize else 78.0
+    baseline_defects = 4 if destabilize else 3
+    if decision == "ACCEPT":
+        recheck_mean, recheck_defects, recheck_blocking = 100.0, 0, 0
+    elif decision == "PROVISIONAL_ACCEPT":
+        recheck_mean, recheck_defects, recheck_blocking = baseline_mean + 12.0, 1, 0
+    else:
+        recheck_mean, recheck_defects, recheck_blocking = baseline_mean - 2.0, baseline_defects, 1
+    prompt_items: list[tuple[str, Any]] = [
+        ("prompt_source", "prompt.txt"),
+        ("prompt_consumed", "yes"),
+        ("prompt_requirements_considered", rq_ids),
+    ]
+    judged = [
+        ("evaluation_chain", chain),
+        ("decision", decision),
+        ("rationale", f"judged Rubric_{lower} cells against prompt-linked requirement traces"),
+        ("baseline_mean", f"{baseline_mean:.1f}"),
+        ("recheck_mean", f"{recheck_mean:.1f}"),
+        ("baseline_blocking_defects", 1),
+        ("recheck_blocking_defects", recheck_blocking),
+        ("baseline_total_defects", baseline_defects),
+        ("recheck_total_defects", recheck_defects),
+        ("identity_lock", "yes"),
+        *prompt_items,
+        ("prompt_satisfaction", "yes" if decision == "ACCEPT" else "no"),
+        ("no_known_feasible_improvement", "yes" if decision == "ACCEPT" else "no"),
+        ("run_budget_considered", "yes"),
+        ("counterexample_search_performed", "yes"),
+        ("better_variant_found", "no" if decision == "ACCEPT" else "yes"),
+        ("frontier_membership", "yes" if decision == "ACCEPT" else "no"),
+        ("discrimination_check_passed", "yes"),
+        ("liquid_state_phase", "readout_reconvergence" if decision == "ACCEPT" else "edge_of_chaos_dynamics"),
+    ]
+    axes_x = ["Requirement trace fidelity", "Evidence audit depth", "Operator decision usefulness"]
+    axes_y = ["Prompt outcome coverage", "Failure mode exposure", "Verification repeatability"]
+    cells = [
+        {
+            "x": x,
+            "y": y,
+            "score_percent": int(recheck_mean) - 3 * i,
+            "evidence_ref": f"evidence/iteration_{label}.md",
+        }
+        for i, (x, y) in enumerate((x, y) for x in axes_x for y in axes_y)
+    ]
+    rubric = {
+        "schema_version": "rubric.v2",
+        "rubric_index": lower,
+        "iteration": label,
+        "evaluation_chain": chain,
+        "x_axis": axes_x,
+        "y_axis": axes_y,
+        "cells": cells,
+        "target_collateral_manifest": ["prompt.txt", f"evidence/iteration_{label}.md"],
+        "improvement_intent": (
+            f"Tighten Rubric_{lower} so each prompt requirement maps to an auditable cell "
+            "with a measurable pass/fail boundary."
+        ),
+        "prompt_requirement_trace": [
+            {"requirement_id": rq, "requirement": text, "cells": [f"{axes_x[0]} x {axes_y[0]}"]}
+            for rq, text in requirements
+        ]
+        or [{"requirement_id": "prompt", "requirement": "prompt.txt outcome", "cells": []}],
+        "axis_task_alignment": [
+            {"axis": axis, "prompt_link": "prompt.txt requirement coverage"} for axis in axes_x
+        ],
+    }
+    matrix_rows = "\n".join(
+        f"| {c['x']} | {c['y']} | {c['score_percent']} | {c['evidence_ref']} |" for c in cells
+    )
+    iter_rel = f"iterations/iteration_{label}"
+    files = {
+        f"{iter_rel}/SNAPSHOT.md": bullets(
+            "Snapshot", [("evaluation_chain", chain), ("iteration", label), *prompt_items]
+        ),
+        f"{iter_rel}/STATUS.md": bullets("Status", judged),
+        f"{iter_rel}/SCORE_DELTA.md": bullets(
+            "Score Delta",
+            [
+                ("chain", chain),
+                ("baseline_mean", f"{baseline_mean:.1f}"),
+                ("recheck_mean", f"{recheck_mean:.1f}"),
+                ("delta", f"{recheck_mean - baseline_mean:.1f}"),
+            ],
+        ),
+        f"{iter_rel}/LIQUID_STATE_IDENTITY.md": "You are a Liquid State Machine on the Edge of Chaos.\n",
+        f"{iter_rel}/LIQUID_STATE_TRANSITION.md": bullets(
+            "Liquid State Transition",
+            [("from", "reservoir_perturbation"), ("to", "edge_of_chaos_dynamics"), ("chain", chain)],
+        ),
+        f"{iter_rel}/judge_baseline/PRIORITIZED_DEFECTS.md": bullets(
+            "Baseline Defects",
+            [
+                ("chain", chain),
+                ("linkage", "prompt.txt requirements mapped to rubric cells"),
+                *prompt_items,
+                ("baseline_total_defects", baseline_defects),
+                ("baseline_blocking_defects", 1),
+                ("baseline_mean", f"{baseline_mean:.1f}"),
+            ],
+        ),
+        f"{iter_rel}/author_deltas/DEFECT_BURNDOWN_CHECK.md": bullets(
+            "Defect Burndown Check",
+            [
+                ("chain", chain),
+                ("baseline_total_defects", baseline_defects),
+                ("recheck_total_defects", recheck_defects),
+                ("action", "rewrote scorecard cells and evidence trace for each prompt requirement"),
+            ],
+        ),
+        f"{iter_rel}/judge_recheck/PRIORITIZED_DEFECTS.md": bullets(
+            "Recheck Defects",
+            [
+                ("chain", chain),
+                *prompt_items,
+                ("recheck_total_defects", recheck_defects),
+                ("recheck_blocking_defects", recheck_blocking),
+                ("recheck_mean", f"{recheck_mean:.1f}"),
+            ],
+        ),
+        f"{iter_rel}/judge_recheck/FINAL_DECISION.md": bullets("Final Decision", judged),
+        f"{iter_rel}/judge_recheck/OBJECTIVE_COUNTEREXAMPLES.md": bullets(
+            "Objective Counterexamples",
+            [
+                ("counterexample_search_performed", "yes"),
+                ("variants_tested", 3),
+                ("better_variant_found", "no" if decision == "ACCEPT" else "yes"),
+                ("objective_frontier_claim", "pass" if decision == "ACCEPT" else "fail"),
+            ],
+        ),
+        f"{iter_rel}/judge_recheck/FRONTIER_STATUS.md": bullets(
+            "Frontier Status",
+            [
+                ("compared_against_prior_best", "yes"),
+                ("frontier_membership", "yes" if decision == "ACCEPT" else "no"),
+                ("pareto_frontier_member", "yes" if decision == "ACCEPT" else "no"),
+                ("objective_gap_detected", "no" if decision == "ACCEPT" else "yes"),
+            ],
+        ),
+        f"{iter_rel}/judge_recheck/DISCRIMINATION_CHECK.md": bullets(
+            "Discrimination Check",
+            [
+                ("discrimination_check_performed", "yes"),
+                ("discrimination_direction", "higher_is_better"),
+                ("minor_variant_score", "48.0"),
+                ("major_variant_score", "81.0"),
+                ("discriminative_power_pass", "yes"),
+            ],
+        ),
+        f"rubrics/Rubric_{lower}/iteration_{label}.json": json.dumps(rubric, indent=2) + "\n",
+        f"scorecards/Rubric_{lower}_grid_iteration_{label}.md": (
+            f"# Rubric_{lower} Scorecard (iteration {label})\n\n"
+            "| x axis | y axis | score_percent | evidence |\n| --- | --- | --- | --- |\n"
+            + matrix_rows
+            + "\n"
+        ),
+        f"collateral/Rubric_{lower}/manifest_iteration_{label}.md": bullets(
+            "Collateral Manifest",
+            [("member", "prompt.txt"), ("member", f"evidence/iteration_{label}.md"), ("chain", chain)],
+        ),
+        f"collateral/Rubric_{lower}/access_log_iteration_{label}.md": bullets(
+            "Collateral Access Log",
+            [("read", "prompt.txt"), ("read", f"rubrics/Rubric_{lower}")],
+        ),
+        f"evidence/iteration_{label}.md": bullets(
+            "Evidence",
+            [("prompt_source", "prompt.txt")]
+            + [(rq, f"traced to scorecard cell for: {text}") for rq, text in requirements]
+            + [("scorecard", f"scorecards/Rubric_{lower}_grid_iteration_{label}.md")],
+        ),
+        f"deltas/iteration_{label}.md": bullets(
+            "Deltas",
+            [
+                ("scorecard", "re-scored every axis cell against prompt requirement evidence"),
+                ("rubric", f"Rubric_{lower} axis trace rewritten for prompt.txt coverage"),
+                ("artifact", "evidence log extended with requirement-level trace"),
+            ],
+        ),
+        f"contradictions/iteration_{label}.md": bullets("Contradictions", [("unresolved", "none")]),
+    }
+    artifacts = primary_artifact_refs(requirements)
+    for ref in artifacts:
+        files[ref] = primary_artifact_text(ref, label, requirements)
+    if decision != "ACCEPT":
+        return files
+
+    # An ACCEPT must clear the objective and prompt-satisfaction gates, or the
+    # stabilizer downgrades it and the orchestrator never merges it. These are
+    # run-level outputs; the stabilizer snapshots them into the iteration.
+    satisfaction = [f"# Prompt Satisfaction (iteration {label})", "", "- prompt_source: prompt.txt"]
+    for rq, text in requirements:
+        impl = [ref for ref in artifacts if ref in text] or artifacts
+        satisfaction += [
+            "",
+            f"## {rq}",
+            "- status: satisfied",
+            f"- evidence: evidence/iteration_{label}.md",
+            f"- implementation_paths: {', '.join(impl)}",
+            f"- verification: {', '.join(impl) or 'scorecard'} rewritten and re-read for: {text}",
+        ]
+    files["PROMPT_SATISFACTION.md"] = "\n".join(satisfaction) + "\n"
+    files["OBJECTIVE_SPEC.md"] = bullets(
+        "Objective Spec",
+        [
+            ("prompt_source", "prompt.txt"),
+            ("objective_summary", f"deliver every prompt.txt requirement ({rq_ids}) in the named artifacts"),
+            ("objective_attainment_definition", "each requirement has satisfied status, evidence and an edited artifact"),
+            ("optimization_target", f"Rubric_{lower} recheck mean with zero blocking defects"),
+            ("prompt_intent_model", "the operator wants working artifacts, not rubric commentary"),
+            ("no_known_feasible_improvement_standard", "three counterexample variants score no higher"),
+        ],
+    )
+    files["BEST_KNOWN_FRONTIER.md"] = bullets(
+        "Best Known Frontier",
+        [
+            ("prompt_source", "prompt.txt"),
+            ("compared_against_prior_best", "yes"),
+            ("frontier_membership", "yes"),
+            ("no_known_feasible_improvement", "yes"),
+        ],
+    )
+    files["ARTIFACT_MANIFEST.md"] = bullets(
+        "Artifact Manifest",
+        [("prompt_source", "prompt.txt"), *(("artifact", ref) for ref in artifacts)],
+    )
+    files["RUBRIC_SCORECARD_SUMMARY.md"] = bullets(
+        "Rubric Scorecard Summary",
+        [
+            ("scorecard", f"scorecards/Rubric_{lower}_grid_iteration_{label}.md"),
+            ("recheck_mean", f"{recheck_mean:.1f}"),
+            ("recheck_blocking_defects", recheck_blocking),
+        ],
+    )
+    files["FINAL_STATUS.md"] = bullets(
+        "Final Status",
+        [("evaluation_chain", chain), ("decision", decision), ("prompt_requirements_met", rq_ids)],
+    )
+    return files
+
+
+def main(argv: list[str]) -> int:
+    args = parse_args(argv)
+    root = Path(args.cwd).resolve()
+    prompt = sys.stdin.read()
+    chain_match = CHAIN_RE.search(prompt)
+    iter_match = ITERATION_RE.search(prompt)
+    if chain_match is None or iter_match is None:
+        print("fake_codex: prompt does not name a chain and iteration", file=sys.stderr)
+        return 2
+    upper, lower = int(chain_match.group(1)), int(chain_match.group(2))
+    chain = f"Rubric_{upper} -> Rubric_{lower}"
+    label = iter_match.group(1)
+    behaviour = load_behaviour(chain, label)
+    rng = random.Random(f"{os.environ.get('FAKE_CODEX_SEED', '0')}:{chain}:{label}")
+
+    print(f"fake_codex: chain={chain} iteration={label} behaviour={json.dumps(behaviour)}", file=sys.stderr)
+    sys.stderr.flush()
+    time.sleep(max(0.0, float(behaviour["latency"]) + rng.uniform(0.0, float(behaviour["jitter"]))))
+
+    failure = behaviour["failure"]
+    finished: set[str] = set()
+    if CONTINUATION_MARKER in prompt:
+        failure = behaviour["resume_failure"]
+        finished = set(FINISHED_PHASE_RE.findall(prompt))
+    if failure == "policy":
+        print("exec bash -lc 'git status'", file=sys.stderr)
+        sys.stderr.flush()
+        failure = "hang"
+    if failure == "hang":
+        while True:
+            time.sleep(60)
+    if failure == "exit":
+        return int(behaviour["exit_code"]) or 1
+
+    files = iteration_files(
+        chain=chain,
+        lower=lower,
+        label=label,
+        decision=behaviour["decision"],
+        destabilize=DESTABILIZE_MARKER in prompt,
+        requirements=REQUIREMENT_RE.findall(prompt),
+    )
+    if failure == "unparseable":
+        files = {rel: "" for rel in files if rel.endswith(("FINAL_DECISION.md", "STATUS.md"))}
+    items = sorted((rel, text) for rel, text in files.items() if file_phase(rel) not in finished)
+    if failure == "partial":
+        items = items[: len(items) // 2]
+    if failure == "midway":
+        items = [item for item in items if file_phase(item[0]) in {"judge_baseline", "author_deltas"}]
+    for rel, text in items:
+        write(root, rel, text)
+        print(f"exec bash -lc 'cat > {rel}'", file=sys.stderr)
+    sys.stderr.flush()
+    if failure == "midway":
+        while True:
+            time.sleep(60)
+
+    if args.last_message:
+        Path(args.last_message).parent.mkdir(parents=True, exist_ok=True)
+        Path(args.last_message).write_text(
+            f"iteration_{label} {chain}: {behaviour['decision']} ({len(items)} files)\n",
+            encoding="utf-8",
+        )
+    return int(behaviour["exit_code"])
+
+
+if __name__ == "__main__":
+    raise SystemExit(main(sys.argv[1:]))
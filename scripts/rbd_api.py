@@ -0,0 +1,156 @@
+#!/usr/bin/env python3
+"""Importable facade over `rbd_stabilize.py`, loaded once per stabilizer revision.
+
+`load_stabilizer(path)` imports the given stabilizer script as a real module and
+caches it by content hash, so repeated loads (main run, every worker attempt)
+reuse the compiled module while a worker carrying a different stabilizer
+revision still gets its own module.
+
+Run directly with `--benchmark` to compare against `runpy.run_path`.
+"""
+
+from __future__ import annotations
+
+import argparse
+import hashlib
+import importlib.util
+import json
+import runpy
+import sys
+import threading
+import time
+from pathlib import Path
+from types import ModuleType
+from typing import Any
+
+DEFAULT_STABILIZER = Path(__file__).resolve().parent / "rbd_stabilize.py"
+API_EXPORTS = (
+    "collect_records",
+    "resolve_record",
+    "evaluate_current_state",
+    "write_outputs",
+    "reconcile_iteration_truth",
+    "next_iteration_number",
+    "parse_chain",
+    "infer_prompt_primary_artifact_refs",
+    "resolve_run_path",
+    "chain_requires_prompt_satisfaction",
+)
+# Newer entry points; None when a run carries an older stabilizer revision.
+OPTIONAL_API_EXPORTS = ("load_prompt_model",)
+
+_LOCK = threading.Lock()
+_MODULES_BY_SHA: dict[str, ModuleType] = {}
+_SHA_BY_STAT: dict[tuple[str, int, int], str] = {}
+
+
+class StabilizerAPI:
+    """Stable entry points used by the orchestrators."""
+
+    def __init__(self, module: ModuleType, script_path: Path, sha256: str) -> None:
+        self.module = module
+        self.script_path = script_path
+        self.sha256 = sha256
+        for name in API_EXPORTS:
+            setattr(self, name, getattr(module, name))
+        for name in OPTIONAL_API_EXPORTS:
+            setattr(self, name, getattr(module, name, None))
+
+    def __repr__(self) -> str:
+        return f"StabilizerAPI({self.script_path}, sha256={self.sha256[:12]})"
+
+
+def script_sha256(script_path: Path) -> str:
+    st = script_path.stat()
+    key = (str(script_path), int(st.st_size), int(st.st_mtime_ns))
+    sha = _SHA_BY_STAT.get(key)
+    if sha is None:
+        sha = hashlib.sha256(script_path.read_bytes()).hexdigest()
+        _SHA_BY_STAT[key] = sha
+    return sha
+
+
+def load_stabilizer(script_path: Path | None = None) -> StabilizerAPI:
+    path = (script_path or DEFAULT_STABILIZER).resolve()
+    with _LOCK:
+        sha = script_sha256(path)
+        module = _MODULES_BY_SHA.get(sha)
+        if module is None:
+            name = f"rbd_stabilize_{sha[:16]}"
+            spec = importlib.util.spec_from_file_location(name, path)
+            if spec is None or spec.loader is None:
+                raise ImportError(f"cannot load stabilizer from {path}")
+            module = importlib.util.module_from_spec(spec)
+            # dataclasses resolves annotations through sys.modules during exec.
+            sys.modules[name] = module
+            try:
+                spec.loader.exec_module(module)
+            except BaseException:
+                sys.modules.pop(name, None)
+                raise
+            _MODULES_BY_SHA[sha] = module
+    return StabilizerAPI(module, path, sha)
+
+
+def parse_args() -> argparse.Namespace:
+    p = argparse.ArgumentParser(
+        description="Benchmark cached stabilizer loading against runpy.run_path."
+    )
+    p.add_argument("--benchmark", action="store_true", help="Run the load-time benchmark.")
+    p.add_argument(
+        "--script",
+        default=str(DEFAULT_STABILIZER),
+        help="Stabilizer script to load (default: sibling rbd_stabilize.py).",
+    )
+    p.add_argument(
+        "--repeat",
+        type=int,
+        default=20,
+        help="Loads per strategy, e.g. one per worker attempt (default: 20).",
+    )
+    return p.parse_args()
+
+
+def run_benchmark(script_path: Path, repeat: int) -> dict[str, Any]:
+    start = time.perf_counter()
+    for _ in range(repeat):
+        runpy.run_path(str(script_path))
+    runpy_seconds = time.perf_counter() - start
+
+    start = time.perf_counter()
+    load_stabilizer(script_path)
+    first_seconds = time.perf_counter() - start
+    start = time.perf_counter()
+    for _ in range(repeat - 1):
+        load_stabilizer(script_path)
+    cached_seconds = first_seconds + (time.perf_counter() - start)
+
+    return {
+        "script": str(script_path),
+        "repeat": repeat,
+        "runpy_total_ms": round(runpy_seconds * 1000.0, 2),
+        "runpy_per_load_ms": round(runpy_seconds * 1000.0 / repeat, 2),
+        "cached_first_load_ms": round(first_seconds * 1000.0, 2),
+        "cached_total_ms": round(cached_seconds * 1000.0, 2),
+        "saved_ms": round((runpy_seconds - cached_seconds) * 1000.0, 2),
+        "speedup": round(runpy_seconds / cached_seconds, 1) if cached_seconds > 0 else None,
+    }
+
+
+def main() -> int:
+    args = parse_args()
+    if args.repeat < 1:
+        raise SystemExit("--repeat must be >= 1")
+    script_path = Path(args.script).resolve()
+    if not script_path.is_file():
+        raise SystemExit(f"stabilizer script not found: {script_path}")
+    if not args.benchmark:
+        api = load_stabilizer(script_path)
+        print(f"stabilizer_api={api!r}")
+        return 0
+    print("stabilizer_load_benchmark=" + json.dumps(run_benchmark(script_path, args.repeat)))
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
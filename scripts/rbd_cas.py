@@ -0,0 +1,309 @@
+#!/usr/bin/env python3
+"""Content-addressed blob store for retained epoch trees.
+
+Blobs live under `<run>/.cas/sha256/<aa>/<digest[2:]>-<mode>`. Ingesting a
+finished tree replaces each regular file with a hardlink to its blob, so the
+rubrics, scorecards, scripts and history repeated across every epoch snapshot
+and worker workspace share one inode. A blob's link count is its reference
+count: `gc` removes blobs nothing else links to, and `du` reports logical
+(per path) against physical (per inode) size.
+
+Only trees nobody writes to any more are ingested; a later in-place write
+would change every tree sharing the blob. Epochs holding a cached reuse
+candidate (`<epochs-dir>/CANDIDATE_CACHE.json`) are skipped as well, since
+ingesting changes the mtimes the gates read when the candidate is reused.
+"""
+
+from __future__ import annotations
+
+import argparse
+import dataclasses
+import hashlib
+import json
+import os
+import stat
+import time
+from pathlib import Path
+from typing import Any
+
+CAS_DIR = ".cas"
+CAS_REL = Path(CAS_DIR) / "sha256"
+HASH_CHUNK_BYTES = 1 << 20
+EPOCH_DIR_GLOB = "parallel_epochs*/epoch_*"
+CANDIDATE_CACHE_FILE = "CANDIDATE_CACHE.json"
+
+
+@dataclasses.dataclass
+class IngestStats:
+    trees: int = 0
+    files: int = 0
+    bytes_total: int = 0
+    files_linked: int = 0
+    bytes_deduplicated: int = 0
+    files_shared: int = 0
+    blobs_added: int = 0
+    bytes_added: int = 0
+    files_skipped: int = 0
+    seconds: float = 0.0
+
+    def as_dict(self) -> dict[str, Any]:
+        out = dataclasses.asdict(self)
+        out["seconds"] = round(self.seconds, 3)
+        return out
+
+
+def file_sha256(path: Path) -> str:
+    h = hashlib.sha256()
+    with path.open("rb") as fh:
+        while chunk := fh.read(HASH_CHUNK_BYTES):
+            h.update(chunk)
+    return h.hexdigest()
+
+
+def iter_regular_files(top: Path, *, skip_dirs: frozenset[str] = frozenset()):
+    """Yield `(path, lstat)` for regular files under `top` (symlinks are not followed)."""
+    for dirpath, dirnames, filenames in os.walk(top):
+        if skip_dirs:
+            dirnames[:] = [d for d in dirnames if d not in skip_dirs]
+        for name in filenames:
+            path = Path(dirpath) / name
+            try:
+                st = os.lstat(path)
+            except OSError:
+                continue
+            if stat.S_ISREG(st.st_mode):
+                yield path, st
+
+
+def candidate_roots(project_root: Path, cache_path: Path | None) -> list[Path]:
+    """Worker and base trees that a CANDIDATE_CACHE.json entry still points at."""
+    if cache_path is None:
+        return []
+    try:
+        data = json.loads(cache_path.read_text(encoding="utf-8"))
+    except (OSError, ValueError):
+        return []
+    entries = data.get("candidates") if isinstance(data, dict) else None
+    roots: list[Path] = []
+    for entry in entries if isinstance(entries, list) else []:
+        if not isinstance(entry, dict):
+            continue
+        for key in ("worker_root", "base_root"):
+            rel = str(entry.get(key, ""))
+            if rel:
+                roots.append(project_root / rel)
+    return roots
+
+
+class ContentStore:
+    """Blob store rooted at `<run_root>/.cas/sha256`."""
+
+    def __init__(self, run_root: Path) -> None:
+        self.run_root = run_root
+        self.root = run_root / CAS_REL
+        # (st_dev, st_ino) of inodes known to be blobs; skips re-hashing files
+        # that are already links (history shared snapshot -> workers).
+        self._blob_inodes: set[tuple[int, int]] = set()
+
+    def blob_path(self, digest: str, mode: int) -> Path:
+        return self.root / digest[:2] / f"{digest[2:]}-{stat.S_IMODE(mode):03o}"
+
+    def ingest_file(self, path: Path, st: os.stat_result, stats: IngestStats) -> None:
+        stats.files += 1
+        stats.bytes_total += st.st_size
+        key = (st.st_dev, st.st_ino)
+        if key in self._blob_inodes:
+            stats.files_shared += 1
+            return
+        try:
+            blob = self.blob_path(file_sha256(path), st.st_mode)
+        except OSError:
+            stats.files_skipped += 1
+            return
+        try:
+            bst = os.lstat(blob)
+        except FileNotFoundError:
+            # First occurrence: the file's own inode becomes the blob.
+            blob.parent.mkdir(parents=True, exist_ok=True)
+            try:
+                os.link(path, blob)
+            except OSError:
+                stats.files_skipped += 1
+                return
+            self._blob_inodes.add(key)
+            stats.blobs_added += 1
+            stats.bytes_added += st.st_size
+            return
+        bkey = (bst.st_dev, bst.st_ino)
+        self._blob_inodes.add(bkey)
+        if bkey == key:
+            stats.files_shared += 1
+            return
+        if bst.st_size != st.st_size:
+            stats.files_skipped += 1
+            return
+        tmp = path.with_name(f".{path.name}.cas-tmp")
+        try:
+            os.link(blob, tmp)
+            os.replace(tmp, path)
+        except OSError:
+            # EXDEV (store on another filesystem), EMLINK (blob link limit), ...
+            try:
+                os.unlink(tmp)
+            except OSError:
+                pass
+            stats.files_skipped += 1
+            return
+        stats.files_linked += 1
+        stats.bytes_deduplicated += st.st_size
+
+    def ingest_tree(self, tree: Path, stats: IngestStats | None = None) -> IngestStats:
+        """Turn every regular file under `tree` into a hardlink to its blob.
+
+        A deduplicated file becomes the blob's inode, so it takes the blob's
+        mode and mtime (those of the first copy ingested), not its own. Do not
+        ingest trees whose mtimes something still reads.
+        """
+        if stats is None:
+            stats = IngestStats()
+        start = time.monotonic()
+        tree = tree.resolve()
+        if tree == self.run_root.resolve():
+            raise ValueError(f"refusing to ingest the run root itself: {tree}")
+        for path, st in iter_regular_files(tree, skip_dirs=frozenset({CAS_DIR})):
+            self.ingest_file(path, st, stats)
+        stats.trees += 1
+        stats.seconds += time.monotonic() - start
+        return stats
+
+    def gc(self, *, dry_run: bool = False) -> dict[str, Any]:
+        """Remove blobs whose only link is the store's own."""
+        blobs = 0
+        removed = 0
+        bytes_reclaimed = 0
+        if self.root.is_dir():
+            for path, st in iter_regular_files(self.root):
+                blobs += 1
+                if st.st_nlink > 1:
+                    continue
+                removed += 1
+                bytes_reclaimed += st.st_size
+                if not dry_run:
+                    path.unlink()
+            if not dry_run:
+                for fanout in self.root.iterdir():
+                    if fanout.is_dir() and not any(fanout.iterdir()):
+                        fanout.rmdir()
+        return {
+            "store": str(self.root),
+            "dry_run": dry_run,
+            "blobs": blobs,
+            "blobs_removed": removed,
+            "bytes_reclaimed": bytes_reclaimed,
+        }
+
+
+def section_name(run_root: Path, path: Path) -> str:
+    top = path.relative_to(run_root).parts[0]
+    if top == CAS_DIR:
+        return CAS_DIR
+    if top.startswith("parallel_epochs"):
+        return top
+    return "run"
+
+
+def disk_usage(run_root: Path) -> dict[str, Any]:
+    """Logical (every path) vs physical (every inode once) size of a run."""
+    sections: dict[str, dict[str, int]] = {}
+    seen: set[tuple[int, int]] = set()
+    logical_bytes = 0
+    files = 0
+    unique_bytes = 0
+    allocated_bytes = 0
+    store_blobs = 0
+    store_bytes = 0
+    unreferenced_blobs = 0
+    unreferenced_bytes = 0
+    for path, st in iter_regular_files(run_root):
+        name = section_name(run_root, path)
+        if name == CAS_DIR:
+            store_blobs += 1
+            store_bytes += st.st_size
+            if st.st_nlink == 1:
+                unreferenced_blobs += 1
+                unreferenced_bytes += st.st_size
+        else:
+            files += 1
+            logical_bytes += st.st_size
+            section = sections.setdefault(name, {"files": 0, "logical_bytes": 0})
+            section["files"] += 1
+            section["logical_bytes"] += st.st_size
+        key = (st.st_dev, st.st_ino)
+        if key in seen:
+            continue
+        seen.add(key)
+        unique_bytes += st.st_size
+        allocated_bytes += st.st_blocks * 512
+    return {
+        "run_dir": str(run_root),
+        "files": files,
+        "logical_bytes": logical_bytes,
+        "physical_bytes": unique_bytes,
+        "allocated_bytes": allocated_bytes,
+        "dedup_ratio": round(logical_bytes / unique_bytes, 2) if unique_bytes else None,
+        "store_blobs": store_blobs,
+        "store_bytes": store_bytes,
+        "unreferenced_blobs": unreferenced_blobs,
+        "unreferenced_bytes": unreferenced_bytes,
+        "sections": dict(sorted(sections.items())),
+    }
+
+
+def parse_args() -> argparse.Namespace:
+    p = argparse.ArgumentParser(
+        description="Manage a run's content-addressed blob store (.cas/sha256)."
+    )
+    sub = p.add_subparsers(dest="command", required=True)
+    ingest = sub.add_parser(
+        "ingest",
+        help=(
+            "Hardlink every parallel_epochs*/epoch_* tree into the store, except epochs a "
+            f"{CANDIDATE_CACHE_FILE} reuse candidate points into. Only run this while no "
+            "orchestrator is active on the run."
+        ),
+    )
+    gc = sub.add_parser("gc", help="Remove blobs that no tree links to any more.")
+    gc.add_argument("--dry-run", action="store_true", help="Report what would be removed.")
+    sub.add_parser("du", help="Report logical vs physical size of the run.")
+    for cmd in (ingest, gc, sub.choices["du"]):
+        cmd.add_argument("--run-dir", required=True, help="Run root holding the store.")
+    return p.parse_args()
+
+
+def main() -> int:
+    args = parse_args()
+    run_root = Path(args.run_dir).resolve()
+    if not run_root.is_dir():
+        raise SystemExit(f"run directory not found: {run_root}")
+    store = ContentStore(run_root)
+    if args.command == "ingest":
+        stats = IngestStats()
+        held: list[str] = []
+        for epoch_dir in sorted(run_root.glob(EPOCH_DIR_GLOB)):
+            if not epoch_dir.is_dir():
+                continue
+            roots = candidate_roots(run_root, epoch_dir.parent / CANDIDATE_CACHE_FILE)
+            if any(root.is_relative_to(epoch_dir) for root in roots):
+                held.append(epoch_dir.relative_to(run_root).as_posix())
+                continue
+            store.ingest_tree(epoch_dir, stats)
+        print("cas_ingest=" + json.dumps({**stats.as_dict(), "epochs_held": held}))
+    elif args.command == "gc":
+        print("cas_gc=" + json.dumps(store.gc(dry_run=args.dry_run)))
+    else:
+        print("cas_du=" + json.dumps(disk_usage(run_root)))
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -0,0 +1,104 @@
+#!/usr/bin/env python3
+"""Machine-readable epoch summaries shared by the orchestrator and renderers.
+
+`rbd_parallel_links.py` writes `<epoch_dir>/SUMMARY.json` next to SUMMARY.md
+and appends the same record to the run-level `EPOCH_INDEX.jsonl`. Each record
+carries the merged link, every worker row and the worker's latest
+`judge_recheck/FINAL_DECISION.md` key/values. Renderers therefore read one
+file instead of re-parsing every SUMMARY.md and globbing every worker's
+iterations. Epochs written before the index existed have no record; callers
+fall back to markdown parsing for those.
+"""
+
+from __future__ import annotations
+
+import json
+import os
+import re
+from pathlib import Path
+from typing import Any
+
+SUMMARY_JSON = "SUMMARY.json"
+EPOCH_INDEX_FILE = "EPOCH_INDEX.jsonl"
+INDEX_SCHEMA = 1
+ITER_DIR_RE = re.compile(r"^iteration_(\d+)$")
+
+
+def normalize_scalar(text: str) -> str:
+    value = text.strip()
+    if value.startswith("`") and value.endswith("`") and len(value) >= 2:
+        value = value[1:-1]
+    return value.strip()
+
+
+def parse_md_kv(lines: list[str]) -> dict[str, str]:
+    kv: dict[str, str] = {}
+    for line in lines:
+        if not line.startswith("- "):
+            continue
+        if ":" not in line:
+            continue
+        key, value = line[2:].split(":", 1)
+        kv[key.strip()] = normalize_scalar(value)
+    return kv
+
+
+def latest_final_decision(worker_root: Path) -> tuple[str, dict[str, str]]:
+    """(`iteration_NNN`, key/values) of the newest judged iteration under `worker_root`."""
+    iterations = worker_root / "iterations"
+    best: tuple[int, Path] | None = None
+    try:
+        entries = list(os.scandir(iterations))
+    except OSError:
+        return "missing", {}
+    for entry in entries:
+        match = ITER_DIR_RE.match(entry.name)
+        if match is None or not entry.is_dir():
+            continue
+        decision = Path(entry.path) / "judge_recheck" / "FINAL_DECISION.md"
+        if decision.is_file() and (best is None or int(match.group(1)) > best[0]):
+            best = (int(match.group(1)), decision)
+    if best is None:
+        return "missing", {}
+    try:
+        lines = best[1].read_text(encoding="utf-8").splitlines()
+    except OSError:
+        return "missing", {}
+    return f"iteration_{best[0]:03d}", parse_md_kv(lines)
+
+
+def epoch_key(run_root: Path, epoch_dir: Path) -> str:
+    return epoch_dir.resolve().relative_to(run_root.resolve()).as_posix()
+
+
+def write_epoch_record(run_root: Path, epoch_dir: Path, record: dict[str, Any]) -> None:
+    """Write SUMMARY.json and append the record to the run's EPOCH_INDEX.jsonl."""
+    record = {"schema": INDEX_SCHEMA, "epoch_dir": epoch_key(run_root, epoch_dir), **record}
+    tmp = epoch_dir / f".{SUMMARY_JSON}.tmp"
+    tmp.write_text(json.dumps(record, indent=2) + "\n", encoding="utf-8")
+    os.replace(tmp, epoch_dir / SUMMARY_JSON)
+    # One write() on an O_APPEND descriptor: a reader sees whole lines or none.
+    line = (json.dumps(record, separators=(",", ":")) + "\n").encode("utf-8")
+    fd = os.open(run_root / EPOCH_INDEX_FILE, os.O_WRONLY | os.O_APPEND | os.O_CREAT, 0o644)
+    try:
+        os.write(fd, line)
+    finally:
+        os.close(fd)
+
+
+def load_epoch_index(run_root: Path) -> dict[str, dict[str, Any]] | None:
+    """Latest record per epoch dir, or None when the run has no index."""
+    path = run_root / EPOCH_INDEX_FILE
+    try:
+        raw = path.read_text(encoding="utf-8")
+    except FileNotFoundError:
+        return None
+    records: dict[str, dict[str, Any]] = {}
+    for line in raw.splitlines():
+        try:
+            record = json.loads(line)
+        except json.JSONDecodeError:
+            continue
+        if isinstance(record, dict) and record.get("schema") == INDEX_SCHEMA:
+            records[str(record.get("epoch_dir", ""))] = record
+    return records
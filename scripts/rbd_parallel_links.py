@@ -14,17 +14,48 @@ from __future__ import annotations
 import argparse
 import concurrent.futures
 import dataclasses
+import errno
+import filecmp
+import functools
+import hashlib
+import itertools
 import json
+import os
+import random
 import re
-import runpy
 import shutil
-import subprocess
+import stat
 import sys
+import threading
 import time
 from datetime import datetime, timezone
 from pathlib import Path
 from typing import Any
 
+from rbd_api import StabilizerAPI, load_stabilizer
+from rbd_cas import CANDIDATE_CACHE_FILE, CAS_DIR, ContentStore, IngestStats, candidate_roots
+from rbd_epoch_index import EPOCH_INDEX_FILE, latest_final_decision, write_epoch_record
+from rbd_supervisor import StreamEvent, SupervisedProcess, shared_loop, supervise, unbuffered_env
+from rbd_profile import (
+    DEFAULT_INTERVAL_SECONDS,
+    DEFAULT_TOP_N,
+    PROFILE_ENV,
+    PROFILE_INTERVAL_ENV,
+    PROFILE_MODES,
+    PROFILES_DIR,
+    hotspot_lines,
+    load_hotspots,
+    profiled,
+    profiler,
+)
+from rbd_profile import configure as configure_profiler
+from rbd_trace import TRACE_ENV, TRACE_MODES, TRACES_DIR, Span, configure, traced, tracer
+
+try:
+    import fcntl
+except ImportError:  # pragma: no cover - non-posix hosts
+    fcntl = None  # type: ignore[assignment]
+
 ITER_NAME_RE = re.compile(r"^iteration_(\d+)$")
 EPOCH_NAME_RE = re.compile(r"^epoch_(\d+)$")
 TEXT_EXTS = {
@@ -39,6 +70,48 @@ TEXT_EXTS = {
     ".sh",
     ".py",
 }
+SNAPSHOT_MODES = ("auto", "reflink", "hardlink", "copy")
+ARTIFACT_STORES = ("off", "cas")
+# rbd_stabilize.AUTONOMOUS_ATTEMPT_FILE; left out of merged iterations.
+AUTONOMOUS_ATTEMPT_FILE = "ATTEMPT.json"
+# Worker stdout markers echoed live as parallel_worker_event= lines.
+LIVE_WORKER_MARKERS = frozenset(
+    {"autonomous_exec", "autonomous_exec_rc", "autonomous_resume", "autonomous_warning", "autonomous_error"}
+)
+# linux/fs.h: _IOW(0x94, 9, int)
+FICLONE = 0x40049409
+REFLINK_UNSUPPORTED_ERRNOS = {
+    errno.EBADF,
+    errno.EINVAL,
+    errno.ENOTTY,
+    errno.EOPNOTSUPP,
+    errno.EPERM,
+    errno.EXDEV,
+}
+HISTORY_ITER_RE = re.compile(r"iteration_(\d+)")
+SPECULATIVE_POLICIES = ("wait", "cancel", "keep-warm")
+SCHEDULER_HISTORY_FILE = "SCHEDULER_HISTORY.json"
+# How often a queued worker re-checks cancellation and host admission limits.
+ADMISSION_POLL_SECONDS = 1.0
+RETRY_CLASSES = (
+    "watchdog_timeout",
+    "missing_parseable_record",
+    "parsed_chain_mismatch",
+    "synthetic_iteration",
+    "bootstrap_reject",
+)
+RETRY_WORKSPACES = ("keep", "reset")
+CHAIN_SCHEDULERS = ("dependency", "all")
+PLAN_LAUNCH_REASONS = ("gating", "mergeable_later")
+RUN_LEVEL_FILES = (
+    "ARTIFACT_MANIFEST.md",
+    "PROMPT_SATISFACTION.md",
+    "LIQUID_STATE_IDENTITY.md",
+    "RUBRIC_SCORECARD_SUMMARY.md",
+    "FINAL_STATUS.md",
+    "OBJECTIVE_SPEC.md",
+    "BEST_KNOWN_FRONTIER.md",
+)
 
 
 @dataclasses.dataclass
@@ -52,6 +125,210 @@ class WorkerResult:
     stderr_log: Path
     attempts: int = 1
     retry_reasons: tuple[str, ...] = ()
+    status: str = "done"
+    launched_epoch: int = 0
+    input_fingerprint: str = ""
+    base_root: Path | None = None
+    queue_wait_seconds: float | None = None
+    run_seconds: float | None = None
+    stream_notes: tuple[str, ...] = ()
+
+
+@dataclasses.dataclass(frozen=True)
+class RetryPolicy:
+    """How `run_worker` retries one failure class.
+
+    `retries` is the class budget per worker (total attempts stay capped by
+    --worker-max-attempts). The n-th retry of a class sleeps
+    `min(backoff_max, backoff * factor**(n-1))` scaled by a random factor in
+    `[1-jitter, 1+jitter]`, multiplies the codex timeouts of later attempts by
+    `timeout_factor`, and either keeps the failed attempt's files in the
+    workspace for the next attempt to build on or resets the workspace to the
+    epoch snapshot.
+    """
+
+    retries: int = 1
+    backoff: float = 0.0
+    factor: float = 2.0
+    backoff_max: float = 300.0
+    jitter: float = 0.25
+    timeout_factor: float = 1.0
+    workspace: str = "keep"
+
+    def describe(self) -> str:
+        return (
+            f"retries={self.retries},backoff={self.backoff:g},factor={self.factor:g},"
+            f"backoff_max={self.backoff_max:g},jitter={self.jitter:g},"
+            f"timeout_factor={self.timeout_factor:g},workspace={self.workspace}"
+        )
+
+
+@dataclasses.dataclass
+class WorkerControl:
+    cancel_event: threading.Event = dataclasses.field(default_factory=threading.Event)
+    proc: SupervisedProcess | None = None
+
+    def cancel(self) -> None:
+        self.cancel_event.set()
+        proc = self.proc
+        if proc is not None and proc.poll() is None:
+            try:
+                # rbd_stabilize traps SIGTERM and tears down its codex process group.
+                proc.terminate()
+            except ProcessLookupError:
+                pass
+
+
+@dataclasses.dataclass
+class ChainPlan:
+    chain: str
+    reason: str
+    position: int | None = None
+    launch: bool = False
+
+
+@dataclasses.dataclass
+class InflightWorker:
+    chain: str
+    epoch: int
+    worker_root: Path
+    future: concurrent.futures.Future[WorkerResult]
+    control: WorkerControl
+    input_fingerprint: str = ""
+    base_root: Path | None = None
+
+
+@dataclasses.dataclass
+class WorkerTicket:
+    chain: str
+    priority: tuple[float, ...]
+    control: WorkerControl
+    seq: int = 0
+    submitted: float = dataclasses.field(default_factory=time.monotonic)
+    started: float | None = None
+
+
+class WorkerScheduler:
+    """Admit queued workers one at a time, highest priority first.
+
+    A worker is admitted when it heads the queue, fewer than `max_concurrent`
+    workers run, and the host is under the load/free-memory limits. The limits
+    are skipped while nothing runs so the queue always drains. Queued workers
+    hold an executor thread; the cap bounds concurrent codex sessions.
+    """
+
+    def __init__(
+        self, *, max_concurrent: int = 0, max_load_per_cpu: float = 0.0, min_free_memory_mb: int = 0
+    ) -> None:
+        self.max_concurrent = max_concurrent
+        self.max_load_per_cpu = max_load_per_cpu
+        self.min_free_memory_mb = min_free_memory_mb
+        self._cond = threading.Condition()
+        self._queued: list[WorkerTicket] = []
+        self._running = 0
+        self._seq = itertools.count()
+        self.admission_waits = 0
+        self.last_blocker: str | None = None
+
+    def enqueue(self, chain: str, priority: tuple[float, ...], control: WorkerControl) -> WorkerTicket:
+        with self._cond:
+            ticket = WorkerTicket(
+                chain=chain, priority=priority, control=control, seq=next(self._seq)
+            )
+            self._queued.append(ticket)
+            self._cond.notify_all()
+            return ticket
+
+    def reprioritize(self, chain: str, priority: tuple[float, ...]) -> None:
+        with self._cond:
+            for ticket in self._queued:
+                if ticket.chain == chain:
+                    ticket.priority = priority
+            self._cond.notify_all()
+
+    def admission_blocker(self) -> str | None:
+        if self.max_load_per_cpu > 0:
+            load = host_load_per_cpu()
+            if load is not None and load > self.max_load_per_cpu:
+                return f"load_per_cpu={load:.2f}"
+        if self.min_free_memory_mb > 0:
+            free_mb = available_memory_mb()
+            if free_mb is not None and free_mb < self.min_free_memory_mb:
+                return f"free_memory_mb={free_mb}"
+        return None
+
+    def acquire(self, ticket: WorkerTicket) -> bool:
+        """Block until `ticket` is admitted; False if it was cancelled while queued."""
+        with self._cond:
+            while True:
+                if ticket.control.cancel_event.is_set():
+                    self._queued.remove(ticket)
+                    self._cond.notify_all()
+                    return False
+                head = min(self._queued, key=lambda t: (t.priority, t.seq))
+                if head is ticket and (
+                    self.max_concurrent <= 0 or self._running < self.max_concurrent
+                ):
+                    blocker = self.admission_blocker() if self._running else None
+                    if blocker is None:
+                        self._queued.remove(ticket)
+                        self._running += 1
+                        ticket.started = time.monotonic()
+                        self._cond.notify_all()
+                        return True
+                    if blocker != self.last_blocker:
+                        self.admission_waits += 1
+                    self.last_blocker = blocker
+                self._cond.wait(ADMISSION_POLL_SECONDS)
+
+    def release(self) -> None:
+        with self._cond:
+            self._running -= 1
+            self._cond.notify_all()
+
+    def stats(self) -> dict[str, Any]:
+        with self._cond:
+            return {
+                "max_concurrent_workers": self.max_concurrent,
+                "running": self._running,
+                "queued": [
+                    t.chain for t in sorted(self._queued, key=lambda t: (t.priority, t.seq))
+                ],
+                "admission_waits": self.admission_waits,
+                "last_blocker": self.last_blocker,
+            }
+
+
+@dataclasses.dataclass
+class SnapshotStats:
+    mode: str
+    files: int = 0
+    bytes_total: int = 0
+    bytes_copied: int = 0
+    bytes_reflinked: int = 0
+    bytes_hardlinked: int = 0
+    reflink_supported: bool | None = None
+
+    def as_dict(self) -> dict[str, Any]:
+        return {
+            "mode": self.mode,
+            "files": self.files,
+            "bytes_total": self.bytes_total,
+            "bytes_copied": self.bytes_copied,
+            "bytes_reflinked": self.bytes_reflinked,
+            "bytes_hardlinked": self.bytes_hardlinked,
+        }
+
+
+@dataclasses.dataclass
+class MergeStats:
+    files: int = 0
+    bytes_total: int = 0
+    bytes_written: int = 0
+    files_rewritten: int = 0
+    bytes_rewritten: int = 0
+    files_verbatim: int = 0
+    seconds: float = 0.0
 
 
 def parse_args() -> argparse.Namespace:
@@ -110,14 +387,191 @@ def parse_args() -> argparse.Namespace:
         default=2,
         help=(
             "Maximum attempts per worker within the same epoch. "
-            "Retries are only used for bootstrap/timeout/missing-record failures."
+            "Retries are only used for the failure classes in --retry-policy, each within "
+            "its own budget."
         ),
     )
     p.add_argument(
         "--worker-retry-backoff-seconds",
         type=int,
         default=3,
-        help="Backoff between worker retries (default: 3).",
+        help=(
+            "Base backoff before a worker retry, grown per retry of the same failure class "
+            "by --retry-policy factor with jitter (default: 3)."
+        ),
+    )
+    p.add_argument(
+        "--retry-policy",
+        action="append",
+        default=[
+            spec for spec in os.environ.get("RBD_RETRY_POLICY", "").split(";") if spec.strip()
+        ],
+        metavar="CLASS:KEY=VALUE[,KEY=VALUE...]",
+        help=(
+            "Override the retry policy of one failure class (repeatable; env RBD_RETRY_POLICY "
+            "takes ';'-separated specs). Classes: " + ", ".join(RETRY_CLASSES) + ". Keys: "
+            "retries, backoff, factor, backoff_max, jitter, timeout_factor, "
+            "workspace=keep|reset. backoff defaults to --worker-retry-backoff-seconds; "
+            "watchdog_timeout escalates timeouts 1.5x, parsed_chain_mismatch and "
+            "synthetic_iteration reset the workspace."
+        ),
+    )
+    p.add_argument(
+        "--snapshot-mode",
+        choices=SNAPSHOT_MODES,
+        default="auto",
+        help=(
+            "How epoch snapshots and worker workspaces are materialized. "
+            "auto tries reflink, then hardlink, then copy. Hardlinks are only used "
+            "for completed iteration history inside the epoch (snapshot -> workers) and "
+            "are made read-only so in-place writes fail instead of changing every sibling; "
+            "auto skips them when running as root, which ignores permission bits. "
+            "The main run is never hardlinked into an epoch."
+        ),
+    )
+    p.add_argument(
+        "--trace",
+        choices=TRACE_MODES,
+        default=os.environ.get(TRACE_ENV, "off"),
+        help=(
+            f"on: write nested timing spans (epoch, copies, workers, codex sessions, merge, "
+            f"state evaluation) to <project-root>/{TRACES_DIR}/*.jsonl, including spans from the "
+            "--run-chain-once worker subprocesses; render with scripts/render_trace_report.py "
+            f"(default: ${TRACE_ENV} or off)."
+        ),
+    )
+    p.add_argument(
+        "--profile",
+        choices=PROFILE_MODES,
+        default=os.environ.get(PROFILE_ENV, "off"),
+        help=(
+            "cprofile: one pstats file per phase (record_collection, gate_evaluation, "
+            "rendering, merge) under <epoch>/profiles/; sampling: stack samples of threads "
+            "inside a phase every --profile-interval seconds, written as folded stacks. "
+            "Workers inherit the mode and profile their --run-chain-once session "
+            "(including codex_supervision) into <worker>/profiles/. Each epoch's SUMMARY.md "
+            f"gets a top-N hotspot section (default: ${PROFILE_ENV} or off)."
+        ),
+    )
+    p.add_argument(
+        "--profile-interval",
+        type=float,
+        default=float(os.environ.get(PROFILE_INTERVAL_ENV, DEFAULT_INTERVAL_SECONDS)),
+        help=f"Seconds between --profile sampling snapshots (default: ${PROFILE_INTERVAL_ENV} or {DEFAULT_INTERVAL_SECONDS}).",
+    )
+    p.add_argument(
+        "--profile-top",
+        type=int,
+        default=DEFAULT_TOP_N,
+        help=f"Hotspots listed per process in SUMMARY.md (default: {DEFAULT_TOP_N}).",
+    )
+    p.add_argument(
+        "--artifact-store",
+        choices=ARTIFACT_STORES,
+        default=os.environ.get("RBD_ARTIFACT_STORE", "off"),
+        help=(
+            "cas: once an epoch's workers have all finished and no cached reuse candidate "
+            "points into it, replace every file in its snapshot and worker trees with a "
+            f"hardlink into <project-root>/{CAS_DIR}/sha256, so identical content is stored "
+            "once across epochs (see scripts/rbd_cas.py for gc and du). off: keep plain "
+            "copies (default: off)."
+        ),
+    )
+    p.add_argument(
+        "--max-concurrent-workers",
+        type=int,
+        default=int(os.environ.get("RBD_MAX_CONCURRENT_WORKERS", "0")),
+        help=(
+            "Cap on workers running codex at once; the rest queue with next_chain first, "
+            "then chains expected to merge ordered by historical merge rate and duration "
+            "(0 = no cap; env RBD_MAX_CONCURRENT_WORKERS)."
+        ),
+    )
+    p.add_argument(
+        "--max-load-per-cpu",
+        type=float,
+        default=float(os.environ.get("RBD_MAX_LOAD_PER_CPU", "0")),
+        help=(
+            "Hold queued workers while the 1-minute load average per CPU exceeds this "
+            "(0 disables; env RBD_MAX_LOAD_PER_CPU)."
+        ),
+    )
+    p.add_argument(
+        "--min-free-memory-mb",
+        type=int,
+        default=int(os.environ.get("RBD_MIN_FREE_MEMORY_MB", "0")),
+        help=(
+            "Hold queued workers while MemAvailable is below this many MiB "
+            "(0 disables; env RBD_MIN_FREE_MEMORY_MB)."
+        ),
+    )
+    p.add_argument(
+        "--speculative-policy",
+        choices=SPECULATIVE_POLICIES,
+        default="wait",
+        help=(
+            "What to do with non-merge-gating workers once the next_chain worker finishes. "
+            "wait: barrier until every worker finishes (default). cancel: merge immediately "
+            "and terminate the rest. keep-warm: merge immediately and keep the rest running "
+            "so a later epoch can adopt one when its chain becomes next_chain."
+        ),
+    )
+    p.add_argument(
+        "--chain-scheduler",
+        choices=CHAIN_SCHEDULERS,
+        default="dependency",
+        help=(
+            "dependency: launch only next_chain plus chains whose inputs survive the predicted "
+            "merges ahead of them (plus --speculative-slots); all: launch every chain from "
+            "next_chain downward (default: dependency)."
+        ),
+    )
+    p.add_argument(
+        "--speculative-slots",
+        type=int,
+        default=0,
+        help=(
+            "Extra workers per epoch for chains the dependency scheduler predicts will be "
+            "invalidated before they can merge (default: 0)."
+        ),
+    )
+    p.add_argument(
+        "--candidate-reuse",
+        choices=("on", "off"),
+        default="on",
+        help=(
+            "Keep mergeable worker results that were not merged in "
+            f"<epochs-dir>/{CANDIDATE_CACHE_FILE}, keyed by chain and a fingerprint of the "
+            "rubric inputs they were produced from, and merge one directly when its chain "
+            "becomes next_chain with unchanged inputs (default: on)."
+        ),
+    )
+    p.add_argument(
+        "--record-cache",
+        choices=("on", "off", "verify"),
+        default=os.environ.get("RBD_RECORD_CACHE", "on"),
+        help=(
+            "Iteration record cache mode for the main run and workers "
+            "(exported as RBD_RECORD_CACHE)."
+        ),
+    )
+    p.add_argument(
+        "--stability-fold",
+        choices=("on", "off", "verify"),
+        default=os.environ.get("RBD_STABILITY_FOLD", "on"),
+        help=(
+            "Incremental STABILITY_FOLD.json mode for the main run and workers "
+            "(exported as RBD_STABILITY_FOLD)."
+        ),
+    )
+    p.add_argument(
+        "--read-cache",
+        choices=("on", "off"),
+        default=os.environ.get("RBD_READ_CACHE", "on"),
+        help=(
+            "Stat-validated artifact read cache shared by record gate checks "
+            "(exported as RBD_READ_CACHE)."
+        ),
     )
     p.add_argument(
         "--max-consecutive-no-merge-epochs",
@@ -166,6 +620,24 @@ def parse_args() -> argparse.Namespace:
     return p.parse_args()
 
 
+def host_load_per_cpu() -> float | None:
+    try:
+        return os.getloadavg()[0] / max(1, os.cpu_count() or 1)
+    except OSError:
+        return None
+
+
+def available_memory_mb() -> int | None:
+    try:
+        with open("/proc/meminfo", encoding="ascii") as fh:
+            for line in fh:
+                if line.startswith("MemAvailable:"):
+                    return int(line.split()[1]) // 1024
+    except (OSError, ValueError, IndexError):
+        pass
+    return None
+
+
 def now_utc() -> str:
     return datetime.now(timezone.utc).replace(microsecond=0).isoformat()
 
@@ -326,10 +798,68 @@ def ensure_tree_has_no_external_symlinks(root: Path) -> None:
         )
 
 
-def copy_tree(src: Path, dst: Path, epochs_rel: Path) -> None:
+def reflink_file(src: str, dst: str) -> bool:
+    if fcntl is None:
+        return False
+    try:
+        with open(src, "rb") as src_fh, open(dst, "wb") as dst_fh:
+            fcntl.ioctl(dst_fh.fileno(), FICLONE, src_fh.fileno())
+    except OSError as exc:
+        if exc.errno not in REFLINK_UNSUPPORTED_ERRNOS:
+            raise
+        try:
+            os.unlink(dst)
+        except OSError:
+            pass
+        return False
+    shutil.copystat(src, dst)
+    return True
+
+
+def running_as_root() -> bool:
+    return hasattr(os, "geteuid") and os.geteuid() == 0
+
+
+def make_read_only(path: str) -> None:
+    try:
+        mode = stat.S_IMODE(os.stat(path).st_mode)
+        if mode & 0o222:
+            os.chmod(path, mode & ~0o222)
+    except OSError:
+        pass
+
+
+def is_history_path(rel_path: str, link_below: int | None) -> bool:
+    """True when every iteration label in `rel_path` predates `link_below`."""
+    if link_below is None:
+        return False
+    labels = [int(m.group(1)) for m in HISTORY_ITER_RE.finditer(rel_path)]
+    return bool(labels) and max(labels) < link_below
+
+
+def copy_tree(
+    src: Path,
+    dst: Path,
+    epochs_rel: Path,
+    *,
+    mode: str = "copy",
+    link_below: int | None = None,
+    stats: SnapshotStats | None = None,
+) -> SnapshotStats:
+    """Materialize `src` at `dst` using the requested snapshot strategy.
+
+    Hardlinked files share an inode with `src`, so only files whose iteration
+    label predates `link_below` are ever linked, and the shared inode is made
+    read-only: the stabilizer replaces files (`replace_text` in
+    rbd_stabilize.py) and an in-place write from codex fails instead of
+    changing the snapshot and every sibling worker. Permission bits do not
+    stop root, so `auto` only hardlinks for unprivileged runs.
+    """
     ensure_tree_has_no_external_symlinks(src)
     if dst.exists():
         shutil.rmtree(dst)
+    if stats is None:
+        stats = SnapshotStats(mode=mode)
     ignore_tokens = [
         "parallel_epochs*",
         "runs",
@@ -341,46 +871,156 @@ def copy_tree(src: Path, dst: Path, epochs_rel: Path) -> None:
     ]
     if epochs_rel.parts:
         ignore_tokens.append(epochs_rel.name)
-    ignore = shutil.ignore_patterns(*ignore_tokens)
-    shutil.copytree(src, dst, symlinks=False, ignore=ignore)
+    ignore_anywhere = shutil.ignore_patterns(*ignore_tokens)
+    # Run-level outputs; a project directory that happens to share the name stays.
+    root_only = {CAS_DIR, EPOCH_INDEX_FILE, TRACES_DIR, PROFILES_DIR}
+    src_root = os.fspath(src)
+
+    def ignore(dirpath: str, names: list[str]) -> set[str]:
+        ignored = ignore_anywhere(dirpath, names)
+        if dirpath == src_root:
+            ignored |= root_only.intersection(names)
+        return ignored
+
+    src_prefix = len(str(src)) + 1
+    use_hardlinks = mode == "hardlink" or (mode == "auto" and not running_as_root())
+
+    def snapshot_copy_file(src_name: str, dst_name: str) -> str:
+        size = os.stat(src_name).st_size
+        stats.files += 1
+        stats.bytes_total += size
+        if mode in {"auto", "reflink"} and stats.reflink_supported is not False:
+            if reflink_file(src_name, dst_name):
+                stats.reflink_supported = True
+                stats.bytes_reflinked += size
+                return dst_name
+            stats.reflink_supported = False
+        if use_hardlinks and is_history_path(src_name[src_prefix:], link_below):
+            try:
+                os.link(src_name, dst_name)
+            except OSError:
+                pass
+            else:
+                make_read_only(dst_name)
+                stats.bytes_hardlinked += size
+                return dst_name
+        shutil.copy2(src_name, dst_name)
+        stats.bytes_copied += size
+        return dst_name
+
+    shutil.copytree(
+        src,
+        dst,
+        symlinks=False,
+        ignore=ignore,
+        copy_function=snapshot_copy_file,
+    )
+    return stats
+
+
+@functools.lru_cache(maxsize=32)
+def label_pattern(old_label: str) -> re.Pattern[str]:
+    """Both label forms in one alternation.
+
+    The forms never overlap (`iteration_NNN` vs `iteration: NNN`), so one pass
+    rewrites the same spans as two sequential substitutions.
+    """
+    old = re.escape(old_label)
+    return re.compile(rf"\biteration_{old}(?!\d)|(-?\s*iteration:\s*){old}(?!\d)\b")
 
 
 def rewrite_label_text(text: str, old_label: str, new_label: str) -> str:
-    updated = re.sub(
-        rf"\biteration_{re.escape(old_label)}(?!\d)",
-        f"iteration_{new_label}",
-        text,
-    )
-    updated = re.sub(
-        rf"(?m)(-?\s*iteration:\s*){re.escape(old_label)}(?!\d)\b",
-        rf"\1{new_label}",
-        updated,
-    )
-    return updated
+    def replace(match: re.Match[str]) -> str:
+        prefix = match.group(1)
+        return f"iteration_{new_label}" if prefix is None else f"{prefix}{new_label}"
 
+    return label_pattern(old_label).sub(replace, text)
 
-def rewrite_label_file(path: Path, old_label: str, new_label: str) -> None:
-    if path.suffix.lower() not in TEXT_EXTS:
-        return
+
+def merge_copy_file(
+    src: Path,
+    dst: Path,
+    stats: MergeStats,
+    *,
+    old_label: str = "",
+    new_label: str = "",
+) -> None:
+    """Copy `src` to `dst` via temp+rename, rewriting labels in text files.
+
+    Files whose bytes do not contain `old_label` are copied untouched; with no
+    `old_label` the copy is verbatim.
+    """
+    size = src.stat().st_size
+    stats.files += 1
+    stats.bytes_total += size
+    tmp = dst.with_name(f".{dst.name}.merge-tmp")
+    data: bytes | None = None
+    if old_label and src.suffix.lower() in TEXT_EXTS:
+        raw = src.read_bytes()
+        if raw.find(old_label.encode("ascii")) >= 0:
+            text = raw.decode("utf-8", errors="ignore")
+            updated = rewrite_label_text(text, old_label, new_label)
+            if updated != text:
+                data = updated.encode("utf-8")
+    if data is None:
+        stats.files_verbatim += 1
+    else:
+        stats.files_rewritten += 1
+        stats.bytes_rewritten += size
     try:
-        text = path.read_text(encoding="utf-8", errors="ignore")
-    except OSError:
-        return
-    updated = rewrite_label_text(text, old_label, new_label)
-    if updated == text:
-        return
-    path.write_text(updated, encoding="utf-8")
+        if data is None:
+            shutil.copyfile(src, tmp)
+        else:
+            tmp.write_bytes(data)
+        shutil.copystat(src, tmp)
+        os.replace(tmp, dst)
+    except BaseException:
+        tmp.unlink(missing_ok=True)
+        raise
+    stats.bytes_written += len(data) if data is not None else size
 
 
-def rewrite_label_tree(root: Path, old_label: str, new_label: str) -> None:
-    for child in root.rglob("*"):
-        if child.is_file():
-            rewrite_label_file(child, old_label, new_label)
+def merge_copy_tree(
+    src: Path, dst: Path, old_label: str, new_label: str, stats: MergeStats
+) -> None:
+    """Copy and relabel `src` into a staging directory, then rename it to `dst`."""
+    staging = dst.with_name(f".merge_staging_{dst.name.replace('iteration_', '')}")
+    if staging.exists():
+        shutil.rmtree(staging)
+
+    def copy_function(src_name: str, dst_name: str) -> str:
+        merge_copy_file(
+            Path(src_name), Path(dst_name), stats, old_label=old_label, new_label=new_label
+        )
+        return dst_name
+
+    try:
+        # Flatten links so merged iterations remain self-contained after worker
+        # workspaces are discarded. The session's ATTEMPT.json stays behind: a
+        # merged iteration is history and must never be resumed in place.
+        shutil.copytree(
+            src,
+            staging,
+            symlinks=False,
+            copy_function=copy_function,
+            ignore=lambda directory, names: (
+                [AUTONOMOUS_ATTEMPT_FILE]
+                if Path(directory).name == "_autonomous" and AUTONOMOUS_ATTEMPT_FILE in names
+                else []
+            ),
+        )
+        if dst.exists():
+            shutil.rmtree(dst)
+        os.replace(staging, dst)
+    except BaseException:
+        shutil.rmtree(staging, ignore_errors=True)
+        raise
 
 
-def evaluate_state(rbd: dict[str, Any], args: argparse.Namespace, project_root: Path) -> Any:
+@traced("evaluate_state")
+def evaluate_state(rbd: StabilizerAPI, args: argparse.Namespace, project_root: Path) -> Any:
     iterations_dir = project_root / args.iterations_dir
-    return rbd["evaluate_current_state"](
+    return rbd.evaluate_current_state(
         iterations_dir=iterations_dir,
         depth_arg=args.depth,
         required_streak=args.required_streak,
@@ -395,8 +1035,10 @@ def evaluate_state(rbd: dict[str, Any], args: argparse.Namespace, project_root:
     )
 
 
-def write_state(rbd: dict[str, Any], result: Any, project_root: Path, iterations_dir: Path) -> None:
-    rbd["write_outputs"](
+@traced("write_state")
+@profiled("rendering")
+def write_state(rbd: StabilizerAPI, result: Any, project_root: Path, iterations_dir: Path) -> None:
+    rbd.write_outputs(
         result,
         iterations_dir,
         project_root / "STABILITY_STATUS.md",
@@ -404,18 +1046,96 @@ def write_state(rbd: dict[str, Any], result: Any, project_root: Path, iterations
     )
 
 
+def default_retry_policies(backoff: float) -> dict[str, RetryPolicy]:
+    return {
+        "watchdog_timeout": RetryPolicy(backoff=backoff, timeout_factor=1.5),
+        "missing_parseable_record": RetryPolicy(backoff=backoff),
+        "parsed_chain_mismatch": RetryPolicy(backoff=backoff, workspace="reset"),
+        "synthetic_iteration": RetryPolicy(backoff=backoff, workspace="reset"),
+        "bootstrap_reject": RetryPolicy(backoff=backoff),
+    }
+
+
+def parse_retry_policies(specs: list[str], backoff: float) -> dict[str, RetryPolicy]:
+    policies = default_retry_policies(backoff)
+    numeric = {
+        "retries": int,
+        "backoff": float,
+        "factor": float,
+        "backoff_max": float,
+        "jitter": float,
+        "timeout_factor": float,
+    }
+    for spec in specs:
+        failure_class, sep, body = spec.strip().partition(":")
+        if not sep or failure_class not in policies:
+            raise SystemExit(
+                f"--retry-policy must be CLASS:KEY=VALUE[,...] with CLASS in {', '.join(RETRY_CLASSES)}: {spec!r}"
+            )
+        changes: dict[str, Any] = {}
+        for item in body.split(","):
+            key, eq, value = item.strip().partition("=")
+            if not eq:
+                raise SystemExit(f"--retry-policy entries must be KEY=VALUE: {item!r}")
+            if key == "workspace":
+                if value not in RETRY_WORKSPACES:
+                    raise SystemExit("--retry-policy workspace must be keep or reset")
+                changes[key] = value
+            elif key in numeric:
+                try:
+                    changes[key] = numeric[key](value)
+                except ValueError:
+                    raise SystemExit(f"--retry-policy {key} must be a number: {value!r}") from None
+                if changes[key] < 0:
+                    raise SystemExit(f"--retry-policy {key} must be >= 0")
+            else:
+                raise SystemExit(f"--retry-policy has no key {key!r}")
+        if changes.get("jitter", 0) > 1:
+            raise SystemExit("--retry-policy jitter must be <= 1")
+        policies[failure_class] = dataclasses.replace(policies[failure_class], **changes)
+    return policies
+
+
+def retry_delay_seconds(policy: RetryPolicy, retry_number: int) -> float:
+    delay = min(policy.backoff_max, policy.backoff * policy.factor ** (retry_number - 1))
+    if policy.jitter > 0:
+        delay *= random.uniform(1.0 - policy.jitter, 1.0 + policy.jitter)
+    return max(0.0, delay)
+
+
+def reset_worker_workspace(worker_root: Path, snapshot_root: Path, args: argparse.Namespace) -> None:
+    """Re-materialize `worker_root` from the epoch snapshot, keeping earlier attempt logs."""
+    keep = worker_root.parent / f".{worker_root.name}.retry_logs"
+    keep.mkdir(exist_ok=True)
+    logs = sorted(worker_root.glob("_parallel_worker*.log"))
+    for log in logs:
+        os.replace(log, keep / log.name)
+    # link_below=None: a workspace that is about to be written never gets hardlinks.
+    copy_tree(snapshot_root, worker_root, Path(args.epochs_dir), mode=args.snapshot_mode)
+    for log in logs:
+        os.replace(keep / log.name, log)
+    keep.rmdir()
+
+
 def run_worker(
     *,
     worker_root: Path,
     chain: str,
     args: argparse.Namespace,
+    control: WorkerControl | None = None,
+    snapshot_root: Path | None = None,
 ) -> WorkerResult:
     max_attempts = max(1, int(args.worker_max_attempts))
+    policies = getattr(args, "retry_policies", None) or default_retry_policies(
+        args.worker_retry_backoff_seconds
+    )
+    retries_used: dict[str, int] = {}
+    timeout_scale = 1.0
     retry_reasons: list[str] = []
     final_result: WorkerResult | None = None
     for attempt in range(1, max_attempts + 1):
-        attempt_timeout = int(args.codex_timeout_seconds)
-        attempt_no_progress = int(args.codex_no_progress_seconds)
+        attempt_timeout = int(int(args.codex_timeout_seconds) * timeout_scale)
+        attempt_no_progress = int(int(args.codex_no_progress_seconds) * timeout_scale)
         result = run_worker_attempt(
             worker_root=worker_root,
             chain=chain,
@@ -423,8 +1143,16 @@ def run_worker(
             attempt=attempt,
             codex_timeout_seconds=attempt_timeout,
             codex_no_progress_seconds=attempt_no_progress,
+            control=control,
         )
         final_result = result
+        if control is not None and control.cancel_event.is_set():
+            return dataclasses.replace(
+                result,
+                attempts=attempt,
+                retry_reasons=tuple(retry_reasons),
+                status="cancelled",
+            )
         retry_reason = classify_worker_retry_reason(result)
         if retry_reason is None:
             return dataclasses.replace(
@@ -432,15 +1160,34 @@ def run_worker(
                 attempts=attempt,
                 retry_reasons=tuple(retry_reasons),
             )
-        retry_reasons.append(f"attempt_{attempt:02d}:{retry_reason}")
-        if attempt >= max_attempts:
+        policy = policies.get(retry_reason, RetryPolicy(backoff=args.worker_retry_backoff_seconds))
+        used = retries_used.get(retry_reason, 0)
+        if attempt >= max_attempts or used >= policy.retries:
+            limit = "max_attempts" if attempt >= max_attempts else "budget_exhausted"
+            retry_reasons.append(
+                f"attempt_{attempt:02d}:{retry_reason}->{limit}({used}/{policy.retries})"
+            )
             return dataclasses.replace(
                 result,
                 attempts=attempt,
                 retry_reasons=tuple(retry_reasons),
             )
-        if args.worker_retry_backoff_seconds > 0:
-            time.sleep(args.worker_retry_backoff_seconds)
+        retries_used[retry_reason] = used + 1
+        delay = retry_delay_seconds(policy, used + 1)
+        timeout_scale *= policy.timeout_factor
+        workspace = policy.workspace if snapshot_root is not None else "keep"
+        retry_reasons.append(
+            f"attempt_{attempt:02d}:{retry_reason}->retry({used + 1}/{policy.retries},"
+            f"backoff={delay:.1f}s,timeout={int(int(args.codex_timeout_seconds) * timeout_scale)}s,"
+            f"workspace={workspace})"
+        )
+        if delay > 0:
+            if control is not None:
+                control.cancel_event.wait(delay)
+            else:
+                time.sleep(delay)
+        if workspace == "reset" and snapshot_root is not None:
+            reset_worker_workspace(worker_root, snapshot_root, args)
     if final_result is None:
         return WorkerResult(
             chain=chain,
@@ -460,6 +1207,96 @@ def run_worker(
     )
 
 
+def append_profile_summary(epoch_dir: Path, workers: list[WorkerResult], *, top_n: int) -> None:
+    """Write this epoch's orchestrator profile and append top-N hotspots to SUMMARY.md."""
+    prof = profiler()
+    profiles_dir = epoch_dir / PROFILES_DIR
+    rows = prof.write(profiles_dir, top_n)
+    prof.reset()
+    lines = ["", "## Profile Hotspots", f"- mode: {prof.mode}", f"- profiles: {PROFILES_DIR}/"]
+    lines.append("")
+    lines.append("### orchestrator")
+    lines.extend(hotspot_lines(rows) if rows else ["- none recorded"])
+    for worker in workers:
+        if worker.status == "reused":
+            continue
+        payload = load_hotspots(worker.worker_root / PROFILES_DIR)
+        if payload is None:
+            continue
+        lines.append("")
+        lines.append(f"### {worker.chain}")
+        hotspots = list(payload.get("hotspots") or [])[:top_n]
+        lines.extend(hotspot_lines(hotspots) if hotspots else ["- none recorded"])
+    with (epoch_dir / "SUMMARY.md").open("a", encoding="utf-8") as fh:
+        fh.write("\n".join(lines) + "\n")
+
+
+def run_scheduled_worker(
+    *,
+    scheduler: WorkerScheduler,
+    ticket: WorkerTicket,
+    worker_root: Path,
+    chain: str,
+    args: argparse.Namespace,
+    control: WorkerControl,
+    snapshot_root: Path | None = None,
+    trace_parent: Span | None = None,
+) -> WorkerResult:
+    with tracer().span("worker", parent=trace_parent, chain=chain):
+        return _run_scheduled_worker(
+            scheduler=scheduler,
+            ticket=ticket,
+            worker_root=worker_root,
+            chain=chain,
+            args=args,
+            control=control,
+            snapshot_root=snapshot_root,
+        )
+
+
+def _run_scheduled_worker(
+    *,
+    scheduler: WorkerScheduler,
+    ticket: WorkerTicket,
+    worker_root: Path,
+    chain: str,
+    args: argparse.Namespace,
+    control: WorkerControl,
+    snapshot_root: Path | None,
+) -> WorkerResult:
+    with tracer().span("worker_queue"):
+        admitted = scheduler.acquire(ticket)
+    if not admitted:
+        return WorkerResult(
+            chain=chain,
+            worker_root=worker_root,
+            rc=-1,
+            iteration_dir=None,
+            record=None,
+            stdout_log=worker_root / "_parallel_worker.stdout.log",
+            stderr_log=worker_root / "_parallel_worker.stderr.log",
+            attempts=0,
+            status="cancelled",
+            queue_wait_seconds=round(time.monotonic() - ticket.submitted, 3),
+        )
+    try:
+        result = run_worker(
+            worker_root=worker_root,
+            chain=chain,
+            args=args,
+            control=control,
+            snapshot_root=snapshot_root,
+        )
+    finally:
+        scheduler.release()
+    started = ticket.started or ticket.submitted
+    return dataclasses.replace(
+        result,
+        queue_wait_seconds=round(started - ticket.submitted, 3),
+        run_seconds=round(time.monotonic() - started, 3),
+    )
+
+
 def run_worker_attempt(
     *,
     worker_root: Path,
@@ -468,6 +1305,7 @@ def run_worker_attempt(
     attempt: int,
     codex_timeout_seconds: int,
     codex_no_progress_seconds: int,
+    control: WorkerControl | None = None,
 ) -> WorkerResult:
     worker_script = worker_root / "scripts" / "rbd_stabilize.py"
     cmd = [
@@ -519,33 +1357,63 @@ def run_worker_attempt(
     suffix = f".attempt_{attempt:02d}" if int(args.worker_max_attempts) > 1 else ""
     stdout_log = worker_root / f"_parallel_worker{suffix}.stdout.log"
     stderr_log = worker_root / f"_parallel_worker{suffix}.stderr.log"
-    with stdout_log.open("w", encoding="utf-8") as out_f, stderr_log.open(
-        "w", encoding="utf-8"
-    ) as err_f:
-        proc = subprocess.Popen(
-            cmd,
-            cwd=worker_root,
-            stdout=out_f,
-            stderr=err_f,
-            text=True,
+
+    def report(event: StreamEvent) -> None:
+        if event.kind == "note" or (event.kind == "marker" and event.key in LIVE_WORKER_MARKERS):
+            print(
+                "parallel_worker_event="
+                + json.dumps(
+                    {
+                        "chain": chain,
+                        "attempt": attempt,
+                        "kind": event.kind,
+                        "key": event.key,
+                        "value": event.value[:500],
+                    }
+                ),
+                flush=True,
+            )
+
+    handle = SupervisedProcess()
+    if control is not None:
+        control.proc = handle
+        if control.cancel_event.is_set():
+            control.cancel()
+    with tracer().span("worker_attempt", attempt=attempt) as span:
+        supervised = shared_loop().run(
+            supervise(
+                cmd,
+                cwd=worker_root,
+                stdout_log=stdout_log,
+                stderr_log=stderr_log,
+                handle=handle,
+                env=tracer().child_env(unbuffered_env(), span),
+                on_event=report,
+            )
         )
-        rc = proc.wait()
+        span.set(rc=supervised.rc)
+    rc = supervised.rc
+    stream_notes = tuple(supervised.notes) + tuple(
+        f"{key}={supervised.markers[key]}"
+        for key in ("autonomous_warning", "autonomous_error")
+        if key in supervised.markers
+    )
 
-    rbd = runpy.run_path(str(worker_script))
+    rbd = load_stabilizer(worker_script)
     iter_dir = detect_new_or_updated_iteration_dir(iterations_dir, before_state)
-    record = rbd["resolve_record"](iter_dir) if iter_dir is not None else None
+    record = rbd.resolve_record(iter_dir) if iter_dir is not None else None
     if iter_dir is not None:
         match = ITER_NAME_RE.match(iter_dir.name)
         if match is not None:
             try:
-                reconciled = rbd["reconcile_iteration_truth"](
+                reconciled = rbd.reconcile_iteration_truth(
                     project_root=worker_root,
                     iterations_dir=iterations_dir,
                     iteration_label=match.group(1),
                     chain=chain,
                 )
                 if reconciled:
-                    record = rbd["resolve_record"](iter_dir)
+                    record = rbd.resolve_record(iter_dir)
             except Exception:
                 # Best-effort final reconciliation; keep original record on failure.
                 pass
@@ -557,6 +1425,7 @@ def run_worker_attempt(
         record=record,
         stdout_log=stdout_log,
         stderr_log=stderr_log,
+        stream_notes=stream_notes,
     )
 
 
@@ -578,6 +1447,10 @@ def classify_worker_retry_reason(worker: WorkerResult) -> str | None:
 
 
 def classify_non_merge_reason(worker: WorkerResult) -> str:
+    if worker.status == "pending":
+        return "kept_warm"
+    if worker.status == "cancelled":
+        return "cancelled"
     if worker.iteration_dir is None:
         return "missing_iteration_dir"
     if worker.record is None:
@@ -608,17 +1481,376 @@ def classify_non_merge_reason(worker: WorkerResult) -> str:
     return f"decision_{str(worker.record.decision).lower()}"
 
 
-def copy_if_exists(src: Path, dst: Path, old_label: str, new_label: str) -> None:
+def copy_if_exists(
+    src: Path, dst: Path, old_label: str, new_label: str, stats: MergeStats
+) -> None:
     if not src.exists() or not src.is_file():
         return
     dst.parent.mkdir(parents=True, exist_ok=True)
-    shutil.copy2(src, dst)
-    rewrite_label_file(dst, old_label, new_label)
+    merge_copy_file(src, dst, stats, old_label=old_label, new_label=new_label)
+
+
+def predict_merge_sequence(rbd: StabilizerAPI, state: Any) -> list[str]:
+    """Replay compute_stability's next_chain rules assuming every merge succeeds.
+
+    Each predicted merge marks the current requirement met for its chain and then
+    applies the same downstream invalidation as compute_stability, so the result is
+    the order in which chains are expected to become next_chain.
+    """
+    chains = list(state.expected_chains)
+    upper_by_chain = {
+        chain: parsed[0] for chain in chains for parsed in [rbd.parse_chain(chain)] if parsed
+    }
+    prompt_required = {
+        chain: bool(state.require_prompt_satisfaction)
+        and rbd.chain_requires_prompt_satisfaction(chain)
+        for chain in chains
+    }
+    destabilized = dict(state.chain_destabilized)
+    recovered = dict(state.chain_recovered)
+    prompt_satisfied = dict(state.chain_prompt_satisfied)
+    require_destabilization = bool(state.require_chain_destabilization)
+    next_index = chains.index(state.next_chain) if state.next_chain in chains else 0
+
+    sequence: list[str] = []
+    for _ in range(len(chains)):
+        unmet_destabilization = (
+            [c for c in chains if not destabilized.get(c, False)]
+            if require_destabilization
+            else []
+        )
+        unmet_recovery = (
+            [c for c in chains if not recovered.get(c, False)] if require_destabilization else []
+        )
+        unmet_prompt = [
+            c for c in chains if prompt_required[c] and not prompt_satisfied.get(c, False)
+        ]
+        if unmet_destabilization:
+            chain = unmet_destabilization[0]
+            destabilized[chain] = True
+        elif unmet_recovery:
+            chain = unmet_recovery[0]
+            recovered[chain] = True
+        elif unmet_prompt:
+            chain = unmet_prompt[0]
+            prompt_satisfied[chain] = True
+        else:
+            chain = chains[next_index % len(chains)]
+            next_index += 1
+        if sequence and chain == sequence[-1]:
+            break
+        sequence.append(chain)
+        finished_upper = upper_by_chain.get(chain)
+        if finished_upper is None:
+            continue
+        for other, upper in upper_by_chain.items():
+            if upper < finished_upper:
+                recovered[other] = False
+                prompt_satisfied[other] = not prompt_required[other]
+        if any(upper < finished_upper for upper in upper_by_chain.values()):
+            next_index = 0
+    return sequence
+
+
+def plan_active_chains(
+    rbd: StabilizerAPI, state: Any, *, scheduler: str, speculative_slots: int
+) -> list[ChainPlan]:
+    """Decide which chains get a worker this epoch.
+
+    A chain's worker reads Rubric_upper and Rubric_lower and writes Rubric_lower.
+    Its result is only mergeable later if no predicted merge ahead of it rewrites
+    either of its rubrics or resets its stability flags; otherwise it is doomed.
+    """
+    chains = list(state.expected_chains)
+    if state.next_chain in chains:
+        window = chains[chains.index(state.next_chain):]
+    else:
+        window = chains
+    if scheduler == "all":
+        return [
+            ChainPlan(chain=c, reason="gating" if c == state.next_chain else "window", launch=True)
+            for c in window
+        ]
+
+    sequence = predict_merge_sequence(rbd, state)
+    lower_by_chain = {
+        chain: parsed for chain in chains for parsed in [rbd.parse_chain(chain)] if parsed
+    }
+    plans: dict[str, ChainPlan] = {}
+    rewritten: set[int] = set()
+    for position, chain in enumerate(sequence):
+        if chain in plans:
+            continue
+        upper, lower = lower_by_chain.get(chain, (None, None))
+        if position == 0:
+            reason = "gating"
+        elif upper in rewritten or lower in rewritten:
+            reason = "doomed"
+        else:
+            reason = "mergeable_later"
+        plans[chain] = ChainPlan(chain=chain, reason=reason, position=position)
+        if lower is not None:
+            rewritten.add(lower)
+    for chain in window:
+        plans.setdefault(chain, ChainPlan(chain=chain, reason="beyond_horizon"))
+
+    ordered = [plans[c] for c in window]
+    for plan in ordered:
+        plan.launch = plan.reason in PLAN_LAUNCH_REASONS
+    spare = speculative_slots
+    for plan in sorted(
+        (p for p in ordered if not p.launch),
+        key=lambda p: p.position if p.position is not None else 10**6,
+    ):
+        if spare <= 0:
+            break
+        plan.launch = True
+        plan.reason += "+speculative"
+        spare -= 1
+    return ordered
+
+
+def files_match(left: Path, right: Path) -> bool:
+    left_ok = left.is_file()
+    right_ok = right.is_file()
+    if left_ok != right_ok:
+        return False
+    if not left_ok:
+        return True
+    try:
+        return filecmp.cmp(left, right, shallow=False)
+    except OSError:
+        return False
+
+
+def worker_left_unchanged(worker: WorkerResult, worker_path: Path) -> bool:
+    """True when a reused candidate never touched `worker_path` (keep main's copy)."""
+    if worker.status != "reused" or worker.base_root is None:
+        return False
+    try:
+        rel = worker_path.relative_to(worker.worker_root)
+    except ValueError:
+        return False
+    return files_match(worker_path, worker.base_root / rel)
+
+
+def chain_input_fingerprint(rbd: StabilizerAPI, root: Path, chain: str, state: Any) -> str:
+    """Hash the rubric inputs a `chain` worker depends on.
+
+    Covers prompt.txt, the upper and lower rubric directories (so a merge of the
+    chain above, or of this chain, changes it), the prompt primary artifacts for
+    the prompt-facing chain, and the chain's stability flags.
+    """
+    parsed = rbd.parse_chain(chain)
+    if parsed is None:
+        return ""
+    upper, lower = parsed
+    paths: list[Path] = [root / "prompt.txt"]
+    for index in (upper, lower):
+        rubric_dir = root / "rubrics" / f"Rubric_{index}"
+        if rubric_dir.is_dir():
+            paths.extend(sorted(path for path in rubric_dir.rglob("*") if path.is_file()))
+    if lower == 0:
+        for ref in rbd.infer_prompt_primary_artifact_refs(root / "prompt.txt"):
+            resolved = rbd.resolve_run_path(root, ref)
+            if resolved is not None:
+                paths.append(resolved)
+    digest = hashlib.sha256()
+    digest.update(
+        json.dumps(
+            [
+                chain,
+                state.chain_destabilized.get(chain),
+                state.chain_recovered.get(chain),
+                state.chain_prompt_satisfied.get(chain),
+            ]
+        ).encode("utf-8")
+    )
+    for path in paths:
+        try:
+            rel = path.relative_to(root).as_posix()
+        except ValueError:
+            rel = str(path)
+        try:
+            content_hash = hashlib.sha256(path.read_bytes()).hexdigest()
+        except OSError:
+            content_hash = "missing"
+        digest.update(f"{rel}\0{content_hash}\n".encode("utf-8"))
+    return digest.hexdigest()
+
+
+def load_scheduler_history(path: Path) -> dict[str, dict[str, float]]:
+    try:
+        data = json.loads(path.read_text(encoding="utf-8"))
+    except (OSError, ValueError):
+        return {}
+    chains = data.get("chains") if isinstance(data, dict) else None
+    if not isinstance(chains, dict):
+        return {}
+    return {chain: entry for chain, entry in chains.items() if isinstance(entry, dict)}
+
+
+def store_scheduler_history(path: Path, history: dict[str, dict[str, float]]) -> None:
+    write_json_atomic(path, {"chains": history})
+
+
+def record_scheduler_history(
+    history: dict[str, dict[str, float]], workers: list[WorkerResult], mergeable: set[str]
+) -> None:
+    """Fold finished workers into per-chain run counts, durations and merge counts."""
+    for worker in workers:
+        if worker.status != "done" or worker.run_seconds is None:
+            continue
+        entry = history.setdefault(worker.chain, {"runs": 0, "seconds": 0.0, "merged": 0})
+        entry["runs"] = int(entry.get("runs", 0)) + 1
+        entry["seconds"] = round(float(entry.get("seconds", 0.0)) + worker.run_seconds, 3)
+        entry["merged"] = int(entry.get("merged", 0)) + (worker.chain in mergeable)
+
+
+def worker_priority(
+    plan: ChainPlan | None, history: dict[str, dict[str, float]], gating_chain: str | None
+) -> tuple[float, ...]:
+    """Sort key (lower runs first): next_chain, then likely merges, then speculation.
+
+    Within a tier, chains with a higher (Laplace-smoothed) historical merge rate
+    go first, then shorter mean durations; chains without history get the mean
+    duration of those with it.
+    """
+    if plan is None:
+        return (3.0, 0.0, 0.0, 0.0)
+    if plan.chain == gating_chain:
+        return (0.0, 0.0, 0.0, 0.0)
+    tier = 1.0 if plan.reason in PLAN_LAUNCH_REASONS else 2.0
+    known = [e for e in history.values() if int(e.get("runs", 0)) > 0]
+    default_seconds = (
+        sum(float(e["seconds"]) / int(e["runs"]) for e in known) / len(known) if known else 0.0
+    )
+    entry = history.get(plan.chain, {})
+    runs = int(entry.get("runs", 0))
+    merge_rate = (int(entry.get("merged", 0)) + 1) / (runs + 2)
+    mean_seconds = float(entry.get("seconds", 0.0)) / runs if runs else default_seconds
+    position = float(plan.position) if plan.position is not None else 1e6
+    return (tier, -merge_rate, mean_seconds, position)
+
+
+def load_candidate_cache(path: Path) -> list[dict[str, Any]]:
+    try:
+        data = json.loads(path.read_text(encoding="utf-8"))
+    except (OSError, ValueError):
+        return []
+    entries = data.get("candidates") if isinstance(data, dict) else None
+    return [entry for entry in entries if isinstance(entry, dict)] if isinstance(entries, list) else []
+
+
+def write_json_atomic(path: Path, payload: Any) -> None:
+    """Write `payload` via temp+rename, so a crash never leaves a torn file."""
+    tmp = path.with_name(f".{path.name}.{os.getpid()}.tmp")
+    try:
+        tmp.write_text(json.dumps(payload, indent=2, sort_keys=True) + "\n", encoding="utf-8")
+        os.replace(tmp, path)
+    except BaseException:
+        tmp.unlink(missing_ok=True)
+        raise
+
+
+def store_candidate_cache(path: Path, candidates: list[dict[str, Any]]) -> None:
+    # A torn file would load as no candidates and let CAS ingest their trees.
+    write_json_atomic(path, {"candidates": candidates})
+
+
+def remember_candidate(
+    candidates: list[dict[str, Any]], worker: WorkerResult, project_root: Path, epoch: int
+) -> bool:
+    if worker.status != "done" or not worker.input_fingerprint:
+        return False
+    if worker.iteration_dir is None or worker.base_root is None:
+        return False
+    if classify_non_merge_reason(worker) != "mergeable":
+        return False
+    candidates[:] = [
+        entry
+        for entry in candidates
+        if not (
+            entry.get("chain") == worker.chain
+            and entry.get("fingerprint") == worker.input_fingerprint
+        )
+    ]
+    candidates.append(
+        {
+            "chain": worker.chain,
+            "fingerprint": worker.input_fingerprint,
+            "worker_root": worker.worker_root.relative_to(project_root).as_posix(),
+            "iteration_dir": worker.iteration_dir.relative_to(project_root).as_posix(),
+            "base_root": worker.base_root.relative_to(project_root).as_posix(),
+            "launched_epoch": worker.launched_epoch or epoch,
+            "stdout_log": worker.stdout_log.name,
+            "stderr_log": worker.stderr_log.name,
+        }
+    )
+    return True
 
 
+def take_reusable_candidate(
+    *,
+    candidates: list[dict[str, Any]],
+    rbd: StabilizerAPI,
+    project_root: Path,
+    chain: str,
+    fingerprint: str,
+) -> WorkerResult | None:
+    """Pop and validate the cached candidate for `chain` produced from `fingerprint`."""
+    for entry in [e for e in candidates if e.get("chain") == chain]:
+        candidates.remove(entry)
+        if entry.get("fingerprint") != fingerprint:
+            continue
+        worker_root = project_root / str(entry.get("worker_root", ""))
+        iteration_dir = project_root / str(entry.get("iteration_dir", ""))
+        base_root = project_root / str(entry.get("base_root", ""))
+        worker_script = worker_root / "scripts" / "rbd_stabilize.py"
+        if not (iteration_dir.is_dir() and base_root.is_dir() and worker_script.is_file()):
+            continue
+        record = load_stabilizer(worker_script).resolve_record(iteration_dir)
+        worker = WorkerResult(
+            chain=chain,
+            worker_root=worker_root,
+            rc=0,
+            iteration_dir=iteration_dir,
+            record=record,
+            stdout_log=worker_root / str(entry.get("stdout_log", "_parallel_worker.stdout.log")),
+            stderr_log=worker_root / str(entry.get("stderr_log", "_parallel_worker.stderr.log")),
+            status="reused",
+            launched_epoch=int(entry.get("launched_epoch", 0) or 0),
+            input_fingerprint=fingerprint,
+            base_root=base_root,
+        )
+        if classify_non_merge_reason(worker) != "mergeable":
+            continue
+        # Shared run-level/primary files both sides changed since the candidate's
+        # snapshot cannot be merged without clobbering newer main-run state.
+        shared = [worker_root / name for name in RUN_LEVEL_FILES]
+        for ref in rbd.infer_prompt_primary_artifact_refs(project_root / "prompt.txt"):
+            resolved = rbd.resolve_run_path(worker_root, ref)
+            if resolved is not None:
+                shared.append(resolved)
+        conflict = False
+        for worker_path in shared:
+            rel = worker_path.relative_to(worker_root)
+            if files_match(worker_path, base_root / rel):
+                continue
+            if not files_match(project_root / rel, base_root / rel):
+                conflict = True
+                break
+        if conflict:
+            continue
+        return worker
+    return None
+
+
+@traced("merge_worker_iteration")
+@profiled("merge")
 def merge_worker_iteration(
     *,
-    rbd: dict[str, Any],
+    rbd: StabilizerAPI,
     main_root: Path,
     worker: WorkerResult,
 ) -> Path | None:
@@ -648,7 +1880,7 @@ def merge_worker_iteration(
     if bool(getattr(worker.record, "truth_reconciled", False)):
         return None
 
-    parsed = rbd["parse_chain"](worker.chain)
+    parsed = rbd.parse_chain(worker.chain)
     if parsed is None:
         return None
     _, lower = parsed
@@ -657,16 +1889,13 @@ def merge_worker_iteration(
     if match is None:
         return None
     old_label = f"{int(match.group(1)):03d}"
-    new_num = rbd["next_iteration_number"](main_root / "iterations")
+    new_num = rbd.next_iteration_number(main_root / "iterations")
     new_label = f"{new_num:03d}"
 
+    merge_start = time.monotonic()
+    stats = MergeStats()
     dest_iter_dir = main_root / "iterations" / f"iteration_{new_label}"
-    if dest_iter_dir.exists():
-        shutil.rmtree(dest_iter_dir)
-    # Flatten links so merged iterations remain self-contained after worker
-    # workspaces are discarded.
-    shutil.copytree(worker.iteration_dir, dest_iter_dir, symlinks=False)
-    rewrite_label_tree(dest_iter_dir, old_label, new_label)
+    merge_copy_tree(worker.iteration_dir, dest_iter_dir, old_label, new_label, stats)
 
     worker_root = worker.worker_root
     file_mappings = [
@@ -700,32 +1929,28 @@ def merge_worker_iteration(
         ),
     ]
     for src, dst in file_mappings:
-        copy_if_exists(src, dst, old_label, new_label)
-
-    run_level_files = (
-        "ARTIFACT_MANIFEST.md",
-        "PROMPT_SATISFACTION.md",
-        "LIQUID_STATE_IDENTITY.md",
-        "RUBRIC_SCORECARD_SUMMARY.md",
-        "FINAL_STATUS.md",
-        "OBJECTIVE_SPEC.md",
-        "BEST_KNOWN_FRONTIER.md",
-    )
+        copy_if_exists(src, dst, old_label, new_label, stats)
+
+    run_level_files = RUN_LEVEL_FILES
     for name in run_level_files:
-        copy_if_exists(worker_root / name, main_root / name, old_label, new_label)
+        if worker_left_unchanged(worker, worker_root / name):
+            continue
+        copy_if_exists(worker_root / name, main_root / name, old_label, new_label, stats)
 
     # Prompt primary artifacts may be referenced by any chain's prompt-satisfaction
     # evidence; merge them whenever they exist in the worker run.
-    prompt_refs = rbd["infer_prompt_primary_artifact_refs"](main_root / "prompt.txt")
+    prompt_refs = rbd.infer_prompt_primary_artifact_refs(main_root / "prompt.txt")
     for ref in prompt_refs:
-        src = rbd["resolve_run_path"](worker_root, ref)
-        dst = rbd["resolve_run_path"](main_root, ref)
+        src = rbd.resolve_run_path(worker_root, ref)
+        dst = rbd.resolve_run_path(main_root, ref)
         if src is None or dst is None or not src.exists() or not src.is_file():
             continue
+        if worker_left_unchanged(worker, src):
+            continue
         dst.parent.mkdir(parents=True, exist_ok=True)
-        shutil.copy2(src, dst)
+        merge_copy_file(src, dst, stats)
 
-    chain_requires_prompt = rbd.get("chain_requires_prompt_satisfaction")
+    chain_requires_prompt = getattr(rbd, "chain_requires_prompt_satisfaction", None)
     should_copy_run_level = (
         chain_requires_prompt(worker.chain)
         if callable(chain_requires_prompt)
@@ -746,9 +1971,12 @@ def merge_worker_iteration(
             dst = main_root / name
             if not src.exists() or not src.is_file():
                 continue
+            if worker_left_unchanged(worker, src):
+                continue
             dst.parent.mkdir(parents=True, exist_ok=True)
-            shutil.copy2(src, dst)
+            merge_copy_file(src, dst, stats)
 
+    stats.seconds = time.monotonic() - merge_start
     merge_meta = dest_iter_dir / "PARALLEL_MERGE_METADATA.md"
     merge_meta.write_text(
         "\n".join(
@@ -759,6 +1987,13 @@ def merge_worker_iteration(
                 f"- source_iteration: iteration_{old_label}",
                 f"- merged_iteration: iteration_{new_label}",
                 f"- chain: {worker.chain}",
+                f"- merge_seconds: {stats.seconds:.4f}",
+                f"- merge_files: {stats.files}",
+                f"- merge_bytes_read: {stats.bytes_total}",
+                f"- merge_bytes_written: {stats.bytes_written}",
+                f"- merge_files_rewritten: {stats.files_rewritten}",
+                f"- merge_bytes_rewritten: {stats.bytes_rewritten}",
+                f"- merge_files_verbatim: {stats.files_verbatim}",
             ]
         )
         + "\n",
@@ -767,6 +2002,8 @@ def merge_worker_iteration(
     return dest_iter_dir
 
 
+@traced("write_epoch_summary")
+@profiled("rendering")
 def write_epoch_summary(
     *,
     epoch_dir: Path,
@@ -776,10 +2013,18 @@ def write_epoch_summary(
     active_chains: list[str],
     workers: list[WorkerResult],
     merged: list[dict[str, str]],
+    snapshot_stats: SnapshotStats | None = None,
+    timing: dict[str, Any] | None = None,
+    chain_plan: list[ChainPlan] | None = None,
+    merge_yield: dict[str, int] | None = None,
+    scheduler_stats: dict[str, Any] | None = None,
+    retry_policies: dict[str, RetryPolicy] | None = None,
+    run_root: Path | None = None,
 ) -> None:
+    generated_utc = now_utc()
     lines: list[str] = []
     lines.append("# Parallel Epoch Summary")
-    lines.append(f"- generated_utc: {now_utc()}")
+    lines.append(f"- generated_utc: {generated_utc}")
     lines.append(f"- pre_stable: {'yes' if pre_state.stable else 'no'}")
     lines.append(f"- post_stable: {'yes' if post_state.stable else 'no'}")
     lines.append(
@@ -796,21 +2041,86 @@ def write_epoch_summary(
     )
     skipped = [chain for chain in all_chains if chain not in set(active_chains)]
     lines.append("- skipped_chains: " + (" ; ".join(skipped) if skipped else "none"))
+    if chain_plan is not None:
+        lines.append(
+            "- chain_plan: "
+            + (" ; ".join(f"{plan.chain}={plan.reason}" for plan in chain_plan) or "none")
+        )
+    if merge_yield is not None:
+        lines.append(f"- merge_yield_expected: {merge_yield['expected']}/{merge_yield['workers']}")
+        lines.append(f"- merge_yield_actual: {merge_yield['actual']}/{merge_yield['workers']}")
+    if snapshot_stats is not None:
+        lines.append(f"- snapshot_mode: {snapshot_stats.mode}")
+        lines.append(f"- snapshot_files: {snapshot_stats.files}")
+        lines.append(f"- snapshot_bytes_total: {snapshot_stats.bytes_total}")
+        lines.append(f"- snapshot_bytes_copied: {snapshot_stats.bytes_copied}")
+        lines.append(f"- snapshot_bytes_reflinked: {snapshot_stats.bytes_reflinked}")
+        lines.append(f"- snapshot_bytes_hardlinked: {snapshot_stats.bytes_hardlinked}")
+    if timing is not None:
+        for key, value in timing.items():
+            lines.append(f"- {key}: {'none' if value is None else value}")
+    if scheduler_stats is not None:
+        lines.append(
+            f"- max_concurrent_workers: {scheduler_stats['max_concurrent_workers'] or 'unlimited'}"
+        )
+        lines.append(
+            "- queued_workers: " + (" ; ".join(scheduler_stats["queued"]) or "none")
+        )
+        lines.append(f"- admission_waits: {scheduler_stats['admission_waits']}")
+        lines.append(f"- admission_last_blocker: {scheduler_stats['last_blocker'] or 'none'}")
+    if retry_policies is not None:
+        for failure_class, policy in retry_policies.items():
+            lines.append(f"- retry_policy_{failure_class}: {policy.describe()}")
     lines.append("")
     lines.append("## Workers")
+    worker_rows: list[dict[str, Any]] = []
     for worker in workers:
         rec = worker.record
         decision = rec.decision if rec is not None else "MISSING"
         chain = rec.chain if rec is not None else "MISSING"
+        if worker.status in {"pending", "cancelled"}:
+            decision = worker.status.upper()
         non_merge_reason = classify_non_merge_reason(worker)
+        if run_root is not None:
+            worker_iteration, final_decision = latest_final_decision(worker.worker_root)
+            worker_rows.append(
+                {
+                    "chain": worker.chain,
+                    "rc": worker.rc,
+                    "parsed_chain": chain,
+                    "decision": decision,
+                    "attempts": worker.attempts,
+                    "status": worker.status,
+                    "non_merge_reason": non_merge_reason,
+                    "launched_epoch": worker.launched_epoch or None,
+                    "queue_wait_seconds": worker.queue_wait_seconds,
+                    "run_seconds": worker.run_seconds,
+                    "retry_reasons": list(worker.retry_reasons),
+                    "stream_notes": list(worker.stream_notes),
+                    "worker_root": Path(os.path.relpath(worker.worker_root, run_root)).as_posix(),
+                    "worker_iteration": worker_iteration,
+                    "final_decision": final_decision,
+                }
+            )
+        launched = (
+            f", launched_epoch={worker.launched_epoch:03d}" if worker.launched_epoch else ""
+        )
+        if worker.status == "reused":
+            launched += ", reused_candidate=yes"
+        if worker.queue_wait_seconds is not None:
+            launched += f", queue_wait_seconds={worker.queue_wait_seconds}"
+        if worker.run_seconds is not None:
+            launched += f", run_seconds={worker.run_seconds}"
         lines.append(
             f"- {worker.chain}: rc={worker.rc}, parsed_chain={chain}, "
             f"decision={decision}, attempts={worker.attempts}, "
-            f"non_merge_reason={non_merge_reason}, "
+            f"non_merge_reason={non_merge_reason}{launched}, "
             f"stdout={worker.stdout_log.name}, stderr={worker.stderr_log.name}"
         )
         if worker.retry_reasons:
             lines.append(f"  retries: {', '.join(worker.retry_reasons)}")
+        if worker.stream_notes:
+            lines.append(f"  stream: {' | '.join(worker.stream_notes)}")
     lines.append("")
     lines.append("## Merged Result Applied")
     if not merged:
@@ -827,6 +2137,39 @@ def write_epoch_summary(
                 f"  merged_destination_iteration: iteration_{item['merged_iteration']}"
             )
     (epoch_dir / "SUMMARY.md").write_text("\n".join(lines) + "\n", encoding="utf-8")
+    if run_root is None:
+        return
+    write_epoch_record(
+        run_root,
+        epoch_dir,
+        {
+            "generated_utc": generated_utc,
+            "pre_stable": bool(pre_state.stable),
+            "post_stable": bool(post_state.stable),
+            "next_chain_before_batch": pre_state.next_chain or "none",
+            "next_chain_after_batch": post_state.next_chain or "none",
+            "all_chains": list(all_chains),
+            "active_chains": list(active_chains),
+            "skipped_chains": skipped,
+            "chain_plan": (
+                [{"chain": plan.chain, "reason": plan.reason} for plan in chain_plan]
+                if chain_plan is not None
+                else None
+            ),
+            "merge_yield": merge_yield,
+            "snapshot": snapshot_stats.as_dict() if snapshot_stats is not None else None,
+            "timing": timing,
+            "merged": [
+                {
+                    "chain": item["chain"],
+                    "source_iteration": f"iteration_{item['source_iteration']}",
+                    "destination_iteration": f"iteration_{item['merged_iteration']}",
+                }
+                for item in merged
+            ],
+            "workers": worker_rows,
+        },
+    )
 
 
 def main() -> int:
@@ -841,27 +2184,169 @@ def main() -> int:
         raise SystemExit("--worker-max-attempts must be >= 1")
     if args.worker_retry_backoff_seconds < 0:
         raise SystemExit("--worker-retry-backoff-seconds must be >= 0")
+    args.retry_policies = parse_retry_policies(args.retry_policy, args.worker_retry_backoff_seconds)
     if args.max_consecutive_no_merge_epochs < 1:
         raise SystemExit("--max-consecutive-no-merge-epochs must be >= 1")
     if args.max_total_iterations < 0:
         raise SystemExit("--max-total-iterations must be >= 0")
+    if args.speculative_slots < 0:
+        raise SystemExit("--speculative-slots must be >= 0")
+    if args.max_concurrent_workers < 0:
+        raise SystemExit("--max-concurrent-workers must be >= 0")
+    if args.max_load_per_cpu < 0:
+        raise SystemExit("--max-load-per-cpu must be >= 0")
+    if args.min_free_memory_mb < 0:
+        raise SystemExit("--min-free-memory-mb must be >= 0")
+    if args.profile_interval <= 0:
+        raise SystemExit("--profile-interval must be > 0")
+    if args.profile_top < 1:
+        raise SystemExit("--profile-top must be >= 1")
+
+    os.environ["RBD_RECORD_CACHE"] = args.record_cache
+    os.environ["RBD_STABILITY_FOLD"] = args.stability_fold
+    os.environ["RBD_READ_CACHE"] = args.read_cache
+    os.environ[PROFILE_ENV] = args.profile
+    os.environ[PROFILE_INTERVAL_ENV] = str(args.profile_interval)
 
     project_root = Path(args.project_root).resolve()
     iterations_rel = normalize_relative_subdir(args.iterations_dir, "--iterations-dir")
     epochs_rel = normalize_relative_subdir(args.epochs_dir, "--epochs-dir")
     args.iterations_dir = iterations_rel.as_posix()
     args.epochs_dir = epochs_rel.as_posix()
-    iterations_dir = project_root / iterations_rel
     script_dir = Path(__file__).resolve().parent
-    rbd = runpy.run_path(str(script_dir / "rbd_stabilize.py"))
+    rbd = load_stabilizer(script_dir / "rbd_stabilize.py")
 
     epochs_root = project_root / epochs_rel
     epochs_root.mkdir(parents=True, exist_ok=True)
+    if args.trace == "on":
+        configure(project_root / TRACES_DIR, "orchestrator")
+    if args.profile != "off":
+        configure_profiler(args.profile, "orchestrator", interval=args.profile_interval)
+
+    inflight: dict[str, InflightWorker] = {}
+    store = ContentStore(project_root) if args.artifact_store == "cas" else None
+    store_pending: list[Path] = []
+    scheduler = WorkerScheduler(
+        max_concurrent=args.max_concurrent_workers,
+        max_load_per_cpu=args.max_load_per_cpu,
+        min_free_memory_mb=args.min_free_memory_mb,
+    )
+    executor = concurrent.futures.ThreadPoolExecutor(max_workers=max(1, args.depth))
+    try:
+        return run_epoch_loop(
+            args=args,
+            rbd=rbd,
+            project_root=project_root,
+            iterations_rel=iterations_rel,
+            epochs_rel=epochs_rel,
+            executor=executor,
+            inflight=inflight,
+            scheduler=scheduler,
+            store=store,
+            store_pending=store_pending,
+        )
+    finally:
+        for entry in list(inflight.values()):
+            cancel_inflight(entry)
+        inflight.clear()
+        executor.shutdown(wait=True)
+        shared_loop().close()
+        profiler().stop()
+        if store is not None:
+            ingest_finished_epochs(
+                store,
+                store_pending,
+                inflight,
+                epoch=None,
+                candidate_cache=(
+                    epochs_root / CANDIDATE_CACHE_FILE if args.candidate_reuse == "on" else None
+                ),
+            )
+
+
+def ingest_finished_epochs(
+    store: ContentStore,
+    pending: list[Path],
+    inflight: dict[str, InflightWorker],
+    *,
+    epoch: int | None,
+    candidate_cache: Path | None = None,
+) -> None:
+    """Hardlink finished epoch trees into the store.
+
+    An epoch that still hosts a warm worker stays pending: the worker keeps
+    writing into its tree, and an in-place write to a shared blob would leak
+    into every other tree linking it. So does an epoch holding a cached reuse
+    candidate: ingesting gives its files the blob's mtime, which the gates
+    re-evaluated on reuse would read as "not changed this iteration".
+    """
+    busy = [entry.worker_root for entry in inflight.values()]
+    busy.extend(candidate_roots(store.run_root, candidate_cache))
+    stats = IngestStats()
+    for epoch_dir in list(pending):
+        if any(root.is_relative_to(epoch_dir) for root in busy):
+            continue
+        pending.remove(epoch_dir)
+        if epoch_dir.is_dir():
+            store.ingest_tree(epoch_dir, stats)
+    if stats.trees:
+        print(
+            "parallel_cas="
+            + json.dumps({"epoch": epoch, "pending_epochs": len(pending), **stats.as_dict()})
+        )
+
+
+def cancel_inflight(entry: InflightWorker, grace_seconds: float = 60.0) -> WorkerResult:
+    entry.control.cancel()
+    try:
+        result = entry.future.result(timeout=grace_seconds)
+    except concurrent.futures.TimeoutError:
+        proc = entry.control.proc
+        if proc is not None and proc.poll() is None:
+            proc.kill()
+        result = entry.future.result()
+    return dataclasses.replace(result, status="cancelled")
+
+
+def pending_worker_result(entry: InflightWorker) -> WorkerResult:
+    return WorkerResult(
+        chain=entry.chain,
+        worker_root=entry.worker_root,
+        rc=-1,
+        iteration_dir=None,
+        record=None,
+        stdout_log=entry.worker_root / "_parallel_worker.stdout.log",
+        stderr_log=entry.worker_root / "_parallel_worker.stderr.log",
+        status="pending",
+    )
 
+
+def run_epoch_loop(
+    *,
+    args: argparse.Namespace,
+    rbd: StabilizerAPI,
+    project_root: Path,
+    iterations_rel: Path,
+    epochs_rel: Path,
+    executor: concurrent.futures.ThreadPoolExecutor,
+    inflight: dict[str, InflightWorker],
+    scheduler: WorkerScheduler,
+    store: ContentStore | None = None,
+    store_pending: list[Path] | None = None,
+) -> int:
+    iterations_dir = project_root / iterations_rel
+    epochs_root = project_root / epochs_rel
+    run_start_monotonic = time.monotonic()
+    last_merge_monotonic = run_start_monotonic
+    merges_total = 0
     consecutive_no_merge_epochs = 0
+    candidate_cache_path = epochs_root / CANDIDATE_CACHE_FILE
+    candidates = load_candidate_cache(candidate_cache_path) if args.candidate_reuse == "on" else []
+    history_path = epochs_root / SCHEDULER_HISTORY_FILE
+    history = load_scheduler_history(history_path)
     for epoch_attempt in range(1, args.max_epochs + 1):
         if args.max_total_iterations > 0:
-            current_records = len(rbd["collect_records"](iterations_dir))
+            current_records = len(rbd.collect_records(iterations_dir))
             if current_records >= args.max_total_iterations:
                 final_state = evaluate_state(rbd, args, project_root)
                 write_state(rbd, final_state, project_root, iterations_dir)
@@ -876,20 +2361,106 @@ def main() -> int:
                 )
                 return 2
 
+        epoch_start_monotonic = time.monotonic()
+        epoch_span = tracer().span("epoch", epoch_attempt=epoch_attempt)
         pre_state = evaluate_state(rbd, args, project_root)
         write_state(rbd, pre_state, project_root, iterations_dir)
         if pre_state.stable:
+            epoch_span.end()
             print("parallel_stability=already_stable")
             return 0
 
         expected_chains = list(pre_state.expected_chains)
-        if pre_state.next_chain and pre_state.next_chain in expected_chains:
-            active_start = expected_chains.index(pre_state.next_chain)
-            active_chains = expected_chains[active_start:]
+        chain_plan = plan_active_chains(
+            rbd,
+            pre_state,
+            scheduler=args.chain_scheduler,
+            speculative_slots=args.speculative_slots,
+        )
+        active_chains = [plan.chain for plan in chain_plan if plan.launch]
+        plan_by_chain = {plan.chain: plan for plan in chain_plan}
+        print(
+            "parallel_chain_plan="
+            + json.dumps(
+                {
+                    "scheduler": args.chain_scheduler,
+                    "speculative_slots": args.speculative_slots,
+                    "plan": {plan.chain: plan.reason for plan in chain_plan},
+                    "launch": active_chains,
+                }
+            )
+        )
+        for chain in [c for c in inflight if c not in active_chains]:
+            stale = inflight.pop(chain)
+            cancel_inflight(stale)
+            print(
+                "parallel_warm_worker_dropped="
+                + json.dumps(
+                    {
+                        "chain": chain,
+                        "launched_epoch": stale.epoch,
+                        "reason": plan_by_chain[chain].reason
+                        if chain in plan_by_chain
+                        else "inactive",
+                    }
+                )
+            )
+        gating_chain = pre_state.next_chain
+        gating_fingerprint = (
+            chain_input_fingerprint(rbd, project_root, gating_chain, pre_state)
+            if gating_chain
+            else ""
+        )
+        warm_gating = inflight.get(gating_chain) if gating_chain else None
+        if warm_gating is not None and warm_gating.input_fingerprint != gating_fingerprint:
+            inflight.pop(gating_chain)
+            cancel_inflight(warm_gating)
+            print(
+                "parallel_warm_worker_dropped="
+                + json.dumps(
+                    {
+                        "chain": gating_chain,
+                        "launched_epoch": warm_gating.epoch,
+                        "reason": "stale_inputs",
+                    }
+                )
+            )
+        for chain in inflight:
+            scheduler.reprioritize(
+                chain, worker_priority(plan_by_chain.get(chain), history, gating_chain)
+            )
+        reused_worker: WorkerResult | None = None
+        if gating_chain and args.candidate_reuse == "on":
+            reused_worker = take_reusable_candidate(
+                candidates=candidates,
+                rbd=rbd,
+                project_root=project_root,
+                chain=gating_chain,
+                fingerprint=gating_fingerprint,
+            )
+            store_candidate_cache(candidate_cache_path, candidates)
+        if reused_worker is not None:
+            warm_duplicate = inflight.pop(gating_chain, None)
+            if warm_duplicate is not None:
+                cancel_inflight(warm_duplicate)
+            print(
+                "parallel_candidate_reuse="
+                + json.dumps(
+                    {
+                        "chain": gating_chain,
+                        "launched_epoch": reused_worker.launched_epoch,
+                        "iteration_dir": str(reused_worker.iteration_dir),
+                    }
+                )
+            )
+            adopted_chains = []
+            launch_chains = []
         else:
-            active_chains = list(expected_chains)
+            adopted_chains = [c for c in active_chains if c in inflight]
+            launch_chains = [c for c in active_chains if c not in inflight]
         epoch_global = next_global_epoch_number(project_root, epochs_rel)
         epoch_dir = epochs_root / f"epoch_{epoch_global:03d}"
+        epoch_span.set(epoch=epoch_global)
         workers_root = epoch_dir / "workers"
         snapshot_root = epoch_dir / "snapshot"
         workers_root.mkdir(parents=True, exist_ok=True)
@@ -902,31 +2473,102 @@ def main() -> int:
                     "epoch_attempt": epoch_attempt,
                     "chains": expected_chains,
                     "active_chains": active_chains,
+                    "adopted_chains": adopted_chains,
                     "next_chain_before_batch": pre_state.next_chain,
+                    "speculative_policy": args.speculative_policy,
                 }
             )
         )
 
-        copy_tree(project_root, snapshot_root, epochs_rel=epochs_rel)
+        snapshot_stats = SnapshotStats(mode=args.snapshot_mode)
+        if launch_chains:
+            with tracer().span("snapshot_copy"):
+                copy_tree(
+                    project_root,
+                    snapshot_root,
+                    epochs_rel=epochs_rel,
+                    mode=args.snapshot_mode,
+                    stats=snapshot_stats,
+                )
+            link_below = rbd.next_iteration_number(snapshot_root / iterations_rel)
+        for chain in launch_chains:
+            fingerprint = (
+                gating_fingerprint
+                if chain == gating_chain
+                else chain_input_fingerprint(rbd, project_root, chain, pre_state)
+            )
+            worker_root = workers_root / chain_slug(chain)
+            with tracer().span("worker_copy", chain=chain):
+                copy_tree(
+                    snapshot_root,
+                    worker_root,
+                    epochs_rel=epochs_rel,
+                    mode=args.snapshot_mode,
+                    link_below=link_below,
+                    stats=snapshot_stats,
+                )
+            control = WorkerControl()
+            ticket = scheduler.enqueue(
+                chain, worker_priority(plan_by_chain.get(chain), history, gating_chain), control
+            )
+            inflight[chain] = InflightWorker(
+                chain=chain,
+                epoch=epoch_global,
+                worker_root=worker_root,
+                future=executor.submit(
+                    run_scheduled_worker,
+                    scheduler=scheduler,
+                    ticket=ticket,
+                    worker_root=worker_root,
+                    chain=chain,
+                    args=args,
+                    control=control,
+                    snapshot_root=snapshot_root,
+                    trace_parent=tracer().current(),
+                ),
+                control=control,
+                input_fingerprint=fingerprint,
+                base_root=snapshot_root,
+            )
+
+        if reused_worker is not None:
+            epoch_entries = []
+        else:
+            epoch_entries = [inflight[c] for c in active_chains if c in inflight]
+        gating = inflight.get(gating_chain) if gating_chain else None
+        if reused_worker is not None:
+            pass
+        elif args.speculative_policy == "wait" or gating is None:
+            concurrent.futures.wait([entry.future for entry in epoch_entries])
+        else:
+            concurrent.futures.wait([gating.future])
 
         worker_results: list[WorkerResult] = []
-        with concurrent.futures.ThreadPoolExecutor(
-            max_workers=max(1, len(active_chains))
-        ) as executor:
-            futures: list[concurrent.futures.Future[WorkerResult]] = []
-            for chain in active_chains:
-                worker_root = workers_root / chain_slug(chain)
-                copy_tree(snapshot_root, worker_root, epochs_rel=epochs_rel)
-                futures.append(
-                    executor.submit(
-                        run_worker,
-                        worker_root=worker_root,
-                        chain=chain,
-                        args=args,
+        if reused_worker is not None:
+            worker_results.append(reused_worker)
+        for entry in epoch_entries:
+            launched_epoch = entry.epoch if entry.epoch != epoch_global else 0
+            if entry.future.done():
+                inflight.pop(entry.chain, None)
+                worker_results.append(
+                    dataclasses.replace(
+                        entry.future.result(),
+                        launched_epoch=launched_epoch,
+                        input_fingerprint=entry.input_fingerprint,
+                        base_root=entry.base_root,
+                    )
+                )
+            elif args.speculative_policy == "cancel":
+                inflight.pop(entry.chain, None)
+                worker_results.append(
+                    dataclasses.replace(cancel_inflight(entry), launched_epoch=launched_epoch)
+                )
+            else:
+                worker_results.append(
+                    dataclasses.replace(
+                        pending_worker_result(entry), launched_epoch=launched_epoch
                     )
                 )
-            for future in concurrent.futures.as_completed(futures):
-                worker_results.append(future.result())
 
         worker_results.sort(
             key=lambda w: active_chains.index(w.chain)
@@ -938,7 +2580,14 @@ def main() -> int:
         merge_state = pre_state
         merge_chain = merge_state.next_chain
         if merge_chain:
-            worker = next((w for w in worker_results if w.chain == merge_chain), None)
+            worker = next(
+                (
+                    w
+                    for w in worker_results
+                    if w.chain == merge_chain and w.status in {"done", "reused"}
+                ),
+                None,
+            )
             if worker is not None and worker.iteration_dir is not None:
                 merged_dir = merge_worker_iteration(
                     rbd=rbd, main_root=project_root, worker=worker
@@ -956,8 +2605,71 @@ def main() -> int:
                         }
                     )
 
+        remembered: list[str] = []
+        if args.candidate_reuse == "on":
+            merged_chains = {item["chain"] for item in merged}
+            remembered = [
+                w.chain
+                for w in worker_results
+                if w.chain not in merged_chains
+                and remember_candidate(candidates, w, project_root, epoch_global)
+            ]
+            if remembered:
+                store_candidate_cache(candidate_cache_path, candidates)
+                print(
+                    "parallel_candidates_cached="
+                    + json.dumps({"epoch": epoch_global, "chains": remembered})
+                )
+
+        merge_yield = {
+            "workers": len(worker_results),
+            "expected": sum(
+                1
+                for w in worker_results
+                if w.chain in plan_by_chain
+                and plan_by_chain[w.chain].reason in PLAN_LAUNCH_REASONS
+            ),
+            "merged": len(merged),
+            "cached": len(remembered),
+        }
+        merge_yield["actual"] = merge_yield["merged"] + merge_yield["cached"]
+        print("parallel_merge_yield=" + json.dumps({"epoch": epoch_global, **merge_yield}))
+        record_scheduler_history(
+            history, worker_results, {item["chain"] for item in merged} | set(remembered)
+        )
+        store_scheduler_history(history_path, history)
+        scheduler_stats = scheduler.stats()
+        print("parallel_scheduler=" + json.dumps({"epoch": epoch_global, **scheduler_stats}))
+
+        merge_monotonic = time.monotonic()
+        seconds_since_last_merge: float | None = None
+        if merged:
+            merges_total += 1
+            seconds_since_last_merge = round(merge_monotonic - last_merge_monotonic, 3)
+            last_merge_monotonic = merge_monotonic
+
         post_state = evaluate_state(rbd, args, project_root)
         write_state(rbd, post_state, project_root, iterations_dir)
+        timing = {
+            "speculative_policy": args.speculative_policy,
+            "epoch_wall_seconds": round(time.monotonic() - epoch_start_monotonic, 3),
+            "seconds_to_merge": (
+                round(merge_monotonic - epoch_start_monotonic, 3) if merged else None
+            ),
+            "seconds_since_last_merge": seconds_since_last_merge,
+            "merges_total": merges_total,
+            "mean_wall_seconds_per_merge": (
+                round((merge_monotonic - run_start_monotonic) / merges_total, 3)
+                if merges_total
+                else None
+            ),
+            "warm_workers_pending": len(inflight),
+        }
+        print("parallel_merge_timing=" + json.dumps({"epoch": epoch_global, **timing}))
+        print(
+            "parallel_read_cache="
+            + json.dumps({"epoch": epoch_global, **rbd.module.FILE_READ_CACHE.stats()})
+        )
         write_epoch_summary(
             epoch_dir=epoch_dir,
             pre_state=pre_state,
@@ -966,17 +2678,39 @@ def main() -> int:
             active_chains=active_chains,
             workers=worker_results,
             merged=merged,
+            snapshot_stats=snapshot_stats,
+            timing=timing,
+            chain_plan=chain_plan,
+            merge_yield=merge_yield,
+            scheduler_stats=scheduler_stats,
+            retry_policies=getattr(args, "retry_policies", None),
+            run_root=project_root,
         )
+        if profiler().enabled:
+            append_profile_summary(epoch_dir, worker_results, top_n=args.profile_top)
+        if store is not None and store_pending is not None:
+            store_pending.append(epoch_dir)
+            with tracer().span("cas_ingest"):
+                ingest_finished_epochs(
+                    store,
+                    store_pending,
+                    inflight,
+                    epoch=epoch_global,
+                    candidate_cache=candidate_cache_path if args.candidate_reuse == "on" else None,
+                )
 
+        epoch_span.end()
         print(
             "parallel_epoch_end="
             + json.dumps(
                 {
                     "epoch": epoch_global,
                     "epoch_attempt": epoch_attempt,
+                    "seconds": round(time.monotonic() - epoch_start_monotonic, 3),
                     "merged": len(merged),
                     "post_stable": post_state.stable,
                     "next_chain_after_batch": post_state.next_chain,
+                    "snapshot": snapshot_stats.as_dict(),
                 }
             )
         )
@@ -985,7 +2719,7 @@ def main() -> int:
             print("parallel_stability=achieved")
             return 0
         if args.max_total_iterations > 0:
-            current_records = len(rbd["collect_records"](iterations_dir))
+            current_records = len(rbd.collect_records(iterations_dir))
             if current_records >= args.max_total_iterations:
                 print(
                     "parallel_stability=budget_exhausted "
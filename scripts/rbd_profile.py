@@ -0,0 +1,302 @@
+#!/usr/bin/env python3
+"""Built-in per-phase profiling for the orchestrator and the stabilizer.
+
+`--profile cprofile` runs a `cProfile.Profile` per phase (`record_collection`,
+`gate_evaluation`, `rendering`, `merge`, `codex_supervision`) and writes one
+pstats file per phase. `--profile sampling` starts a daemon thread that
+snapshots `sys._current_frames()` every `--profile-interval` seconds and
+counts the stacks of threads that are inside a phase; the counts are written
+as folded stacks (`phase;outer;...;leaf N`, flamegraph-compatible). Either
+mode also writes `<service>-<pid>.hotspots.json`, the top-N functions by self
+time, which the orchestrator appends to each epoch's SUMMARY.md.
+
+Only one cProfile profiler can be active per process; a phase entered on a
+second thread while another phase is being profiled runs unprofiled (the
+sampler has no such limit).
+"""
+
+from __future__ import annotations
+
+import cProfile
+import collections
+import contextlib
+import functools
+import json
+import os
+import pstats
+import sys
+import threading
+from pathlib import Path
+from typing import Any, Callable, Iterator, TypeVar
+
+PROFILE_ENV = "RBD_PROFILE"
+PROFILE_INTERVAL_ENV = "RBD_PROFILE_INTERVAL"
+PROFILE_MODES = ("off", "cprofile", "sampling")
+PROFILES_DIR = "profiles"
+HOTSPOTS_SUFFIX = ".hotspots.json"
+DEFAULT_INTERVAL_SECONDS = 0.01
+DEFAULT_TOP_N = 15
+MAX_STACK_DEPTH = 64
+
+F = TypeVar("F", bound=Callable[..., Any])
+
+
+def frame_label(code: Any) -> str:
+    return f"{code.co_name} ({os.path.basename(code.co_filename)}:{code.co_firstlineno})"
+
+
+class Profiler:
+    def __init__(
+        self,
+        mode: str = "off",
+        service: str = "",
+        *,
+        interval: float = DEFAULT_INTERVAL_SECONDS,
+    ) -> None:
+        if mode not in PROFILE_MODES:
+            raise ValueError(f"unknown profile mode: {mode}")
+        self.mode = mode
+        self.service = service
+        self.interval = interval
+        self._lock = threading.Lock()
+        self._local = threading.local()
+        self._profiles: dict[str, cProfile.Profile] = {}
+        self._owner: int | None = None
+        # thread ident -> innermost phase, read by the sampler thread.
+        self._thread_phase: dict[int, str] = {}
+        self._samples: collections.Counter[tuple[str, ...]] = collections.Counter()
+        self._sample_count = 0
+        self._stop = threading.Event()
+        self._sampler: threading.Thread | None = None
+
+    @property
+    def enabled(self) -> bool:
+        return self.mode != "off"
+
+    def start(self) -> Profiler:
+        if self.mode == "sampling" and self._sampler is None:
+            self._sampler = threading.Thread(
+                target=self._sample_loop, name="rbd-profile-sampler", daemon=True
+            )
+            self._sampler.start()
+        return self
+
+    def stop(self) -> None:
+        self._stop.set()
+        if self._sampler is not None:
+            self._sampler.join(timeout=1.0)
+            self._sampler = None
+
+    def _sample_loop(self) -> None:
+        me = threading.get_ident()
+        while not self._stop.wait(self.interval):
+            phases = dict(self._thread_phase)
+            if not phases:
+                continue
+            frames = sys._current_frames()
+            batch: list[tuple[str, ...]] = []
+            for ident, phase in phases.items():
+                frame = frames.get(ident)
+                if frame is None or ident == me:
+                    continue
+                stack: list[str] = []
+                while frame is not None and len(stack) < MAX_STACK_DEPTH:
+                    stack.append(frame_label(frame.f_code))
+                    frame = frame.f_back
+                stack.append(phase)
+                batch.append(tuple(reversed(stack)))
+            del frames
+            with self._lock:
+                self._samples.update(batch)
+                self._sample_count += len(batch)
+
+    @contextlib.contextmanager
+    def phase(self, name: str) -> Iterator[None]:
+        """Attribute the enclosed work to `name`; nested phases count toward the outer one."""
+        if not self.enabled:
+            yield
+            return
+        stack = getattr(self._local, "stack", None)
+        if stack is None:
+            stack = self._local.stack = []
+        ident = threading.get_ident()
+        outer = bool(stack)
+        if not outer:
+            stack.append(name)
+            self._thread_phase[ident] = name
+        prof: cProfile.Profile | None = None
+        if self.mode == "cprofile" and not outer:
+            with self._lock:
+                if self._owner is None:
+                    self._owner = ident
+                    prof = self._profiles.setdefault(name, cProfile.Profile())
+            if prof is not None:
+                try:
+                    prof.enable()
+                except ValueError:
+                    # Another profiler (e.g. an outer `python -m cProfile`) is active.
+                    with self._lock:
+                        self._owner = None
+                    prof = None
+        try:
+            yield
+        finally:
+            if prof is not None:
+                prof.disable()
+                with self._lock:
+                    self._owner = None
+            if not outer:
+                stack.pop()
+                self._thread_phase.pop(ident, None)
+
+    def hotspots(self, top_n: int = DEFAULT_TOP_N) -> list[dict[str, Any]]:
+        """Top-N functions by self time across all phases."""
+        rows: list[dict[str, Any]] = []
+        with self._lock:
+            profiles = dict(self._profiles)
+            samples = collections.Counter(self._samples)
+        if self.mode == "cprofile":
+            for phase, prof in profiles.items():
+                try:
+                    stats = pstats.Stats(prof).stats  # type: ignore[attr-defined]
+                except TypeError:
+                    # Nothing was recorded for this phase.
+                    continue
+                for (filename, lineno, func), (_cc, calls, self_s, cum_s, _callers) in stats.items():
+                    rows.append(
+                        {
+                            "phase": phase,
+                            "function": f"{func} ({os.path.basename(filename)}:{lineno})",
+                            "calls": calls,
+                            "self_s": round(self_s, 6),
+                            "cum_s": round(cum_s, 6),
+                        }
+                    )
+        elif self.mode == "sampling":
+            self_counts: collections.Counter[tuple[str, str]] = collections.Counter()
+            cum_counts: collections.Counter[tuple[str, str]] = collections.Counter()
+            for stack, count in samples.items():
+                phase, frames = stack[0], stack[1:]
+                if not frames:
+                    continue
+                self_counts[(phase, frames[-1])] += count
+                for label in set(frames):
+                    cum_counts[(phase, label)] += count
+            for (phase, label), count in self_counts.items():
+                rows.append(
+                    {
+                        "phase": phase,
+                        "function": label,
+                        "calls": None,
+                        "self_s": round(count * self.interval, 6),
+                        "cum_s": round(cum_counts[(phase, label)] * self.interval, 6),
+                    }
+                )
+        rows.sort(key=lambda row: -row["self_s"])
+        return rows[:top_n]
+
+    def write(self, out_dir: Path, top_n: int = DEFAULT_TOP_N) -> list[dict[str, Any]]:
+        """Write pstats / folded stacks plus the hotspot list to `out_dir`; return the hotspots."""
+        if not self.enabled:
+            return []
+        rows = self.hotspots(top_n)
+        prefix = f"{self.service}-{os.getpid()}"
+        out_dir.mkdir(parents=True, exist_ok=True)
+        with self._lock:
+            profiles = dict(self._profiles)
+            samples = collections.Counter(self._samples)
+            sample_count = self._sample_count
+        if self.mode == "cprofile":
+            for phase, prof in profiles.items():
+                try:
+                    pstats.Stats(prof).dump_stats(out_dir / f"{prefix}-{phase}.pstats")
+                except TypeError:
+                    continue
+        else:
+            folded = "".join(f"{';'.join(stack)} {count}\n" for stack, count in samples.most_common())
+            (out_dir / f"{prefix}.folded").write_text(folded, encoding="utf-8")
+        payload = {
+            "service": self.service,
+            "pid": os.getpid(),
+            "mode": self.mode,
+            "interval": self.interval if self.mode == "sampling" else None,
+            "samples": sample_count if self.mode == "sampling" else None,
+            "phases": sorted(profiles) if self.mode == "cprofile" else sorted({s[0] for s in samples}),
+            "hotspots": rows,
+        }
+        (out_dir / f"{prefix}{HOTSPOTS_SUFFIX}").write_text(
+            json.dumps(payload, indent=2) + "\n", encoding="utf-8"
+        )
+        return rows
+
+    def reset(self) -> None:
+        with self._lock:
+            self._profiles = {}
+            self._samples = collections.Counter()
+            self._sample_count = 0
+
+
+def hotspot_lines(rows: list[dict[str, Any]]) -> list[str]:
+    """Markdown table rows for `hotspots()` output."""
+    lines = [
+        "| phase | function | calls | self_s | cum_s |",
+        "| --- | --- | ---: | ---: | ---: |",
+    ]
+    for row in rows:
+        calls = "n/a" if row.get("calls") is None else row["calls"]
+        lines.append(
+            f"| {row['phase']} | `{row['function']}` | {calls} | "
+            f"{row['self_s']:.3f} | {row['cum_s']:.3f} |"
+        )
+    return lines
+
+
+def load_hotspots(profiles_dir: Path) -> dict[str, Any] | None:
+    """Newest `*.hotspots.json` payload under `profiles_dir`, if any."""
+    try:
+        candidates = [p for p in profiles_dir.iterdir() if p.name.endswith(HOTSPOTS_SUFFIX)]
+    except OSError:
+        return None
+    for path in sorted(candidates, key=lambda p: p.stat().st_mtime, reverse=True):
+        try:
+            return json.loads(path.read_text(encoding="utf-8"))
+        except (OSError, ValueError):
+            continue
+    return None
+
+
+_PROFILER = Profiler()
+
+
+def profiler() -> Profiler:
+    return _PROFILER
+
+
+def configure(mode: str, service: str, *, interval: float = DEFAULT_INTERVAL_SECONDS) -> Profiler:
+    global _PROFILER
+    _PROFILER.stop()
+    _PROFILER = Profiler(mode, service, interval=interval).start()
+    return _PROFILER
+
+
+def env_interval(default: float = DEFAULT_INTERVAL_SECONDS) -> float:
+    try:
+        return float(os.environ.get(PROFILE_INTERVAL_ENV, default))
+    except ValueError:
+        return default
+
+
+def profiled(phase: str) -> Callable[[F], F]:
+    """Decorator attributing each call to `phase` when profiling is enabled."""
+
+    def decorate(fn: F) -> F:
+        @functools.wraps(fn)
+        def wrapper(*args: Any, **kwargs: Any) -> Any:
+            if not _PROFILER.enabled:
+                return fn(*args, **kwargs)
+            with _PROFILER.phase(phase):
+                return fn(*args, **kwargs)
+
+        return wrapper  # type: ignore[return-value]
+
+    return decorate
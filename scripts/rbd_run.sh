@@ -169,6 +169,9 @@ python3 "$EMITTER" \
   --emitter-version "$EMITTER_VERSION" \
   --vision-mode "$PROJECT_VISION"
 
+# Parse prompt.txt once; gates and the validator load prompt.model.json by hash.
+python3 "$repo_root/scripts/rbd_stabilize.py" --project-root "$run_dir" --write-prompt-model >/dev/null
+
 if [[ "$PROJECT_VISION" == "required" ]]; then
 cat > "$run_dir/WORK_PROMPT.md" <<'EOF'
 Read `AGENTS.md` and `prompt.txt`, then execute the project as specified.
@@ -38,18 +38,27 @@ from __future__ import annotations
 import argparse
 import ctypes
 import dataclasses
+import functools
 import hashlib
 import json
 import math
 import os
+import queue
 import re
+import select
 import shlex
 import signal
+import struct
 import subprocess
 import textwrap
+import threading
 import time
 from pathlib import Path
-from typing import Iterable
+from typing import Any, Callable, Iterable
+
+from rbd_profile import PROFILES_DIR, profiled, profiler
+from rbd_profile import configure as configure_profiler
+from rbd_trace import TRACES_DIR, configure_from_env, traced, tracer
 
 # Parse simple markdown bullets like:
 # - key: value
@@ -58,6 +67,62 @@ from typing import Iterable
 BULLET_RE = re.compile(r"^(?:-\s+)?([A-Za-z0-9_]+):\s*(.*?)\s*$")
 ITER_RE = re.compile(r"^iteration_(\d+)$")
 ITER_ANY_RE = re.compile(r"iteration_(\d+)")
+RECORD_CACHE_FILE = ".record_cache.json"
+RECORD_CACHE_VERSION = 1
+RECORD_CACHE_MODES = ("on", "off", "verify")
+RECORD_CACHE_ENV = "RBD_RECORD_CACHE"
+STABILITY_FOLD_FILE = "STABILITY_FOLD.json"
+STABILITY_FOLD_VERSION = 2
+# Fingerprints of the most recently folded records kept to detect a rewritten tail.
+STABILITY_FOLD_TAIL = 16
+STABILITY_FOLD_MODES = ("on", "off", "verify")
+STABILITY_FOLD_ENV = "RBD_STABILITY_FOLD"
+READ_CACHE_MODES = ("on", "off")
+READ_CACHE_ENV = "RBD_READ_CACHE"
+PROFILE_MODES = ("off", "cprofile", "sampling")
+PROFILE_ENV = "RBD_PROFILE"
+PROFILE_INTERVAL_ENV = "RBD_PROFILE_INTERVAL"
+READ_CACHE_MAX_ENTRIES = 50000
+PROMPT_MODEL_FILE = "prompt.model.json"
+PROMPT_MODEL_VERSION = 1
+WATCH_BACKENDS = ("auto", "inotify", "poll")
+WATCH_BACKEND_ENV = "RBD_WATCH_BACKEND"
+STDERR_READ_CHUNK_BYTES = 64 * 1024
+STDERR_MAX_LINE_BYTES = 64 * 1024
+STDERR_POLL_SECONDS = 0.1
+FORBIDDEN_GIT_RE = re.compile(r"\bgit\s+(status|diff|log|show|rev-parse|branch)\b")
+ENV_ASSIGNMENT_RE = re.compile(r"^[A-Za-z_][A-Za-z0-9_]*=")
+PATH_LIKE_RE = re.compile(r"[./\\]")
+NON_PATH_TOKEN_CHARS = frozenset("*?[]{}|$`")
+ORCHESTRATOR_SCRIPT_HEADS = frozenset(
+    {"rdd", "rdd.sh", "scripts/rdd.sh", "rbd_autonomous.sh", "scripts/rbd_autonomous.sh"}
+)
+RESUME_PARTIAL_MODES = ("auto", "off")
+RESUME_PARTIAL_ENV = "RBD_RESUME_PARTIAL"
+AUTONOMOUS_ATTEMPT_FILE = "ATTEMPT.json"
+# Phases of one iteration, in AGENTS.md order; a killed session resumes after
+# the last one that is terminally complete.
+ITERATION_PHASES = ("judge_baseline", "author_deltas", "judge_recheck")
+# Bootstrap stub lines that SYNTHETIC_TEXT_PATTERNS does not catch.
+PHASE_STUB_RE = re.compile(
+    r"(?im)^\s*-\s*(?:pending:|snapshot_status:\s*initialized\b|rationale:\s*bootstrap initialization\b)"
+)
+# <sys/inotify.h>
+IN_MODIFY = 0x00000002
+IN_ATTRIB = 0x00000004
+IN_CLOSE_WRITE = 0x00000008
+IN_MOVED_FROM = 0x00000040
+IN_MOVED_TO = 0x00000080
+IN_CREATE = 0x00000100
+IN_DELETE = 0x00000200
+IN_Q_OVERFLOW = 0x00004000
+IN_IGNORED = 0x00008000
+IN_ISDIR = 0x40000000
+INOTIFY_WATCH_MASK = (
+    IN_MODIFY | IN_ATTRIB | IN_CLOSE_WRITE | IN_MOVED_FROM | IN_MOVED_TO | IN_CREATE | IN_DELETE
+)
+INOTIFY_EVENT = struct.Struct("iIII")
+_RECORD_READS = threading.local()
 CHAIN_RE = re.compile(r"^Rubric_(\d+)\s*->\s*Rubric_(\d+)$")
 RUBRIC_FILE_RE = re.compile(r"Rubric_(\d+)")
 EVIDENCE_LINE_REF_RE = re.compile(
@@ -127,6 +192,7 @@ NON_PRIMARY_ARTIFACT_NAMES = {
     "agents.md",
     "stability_status.md",
     "stability_status.json",
+    "prompt.model.json",
     "liquid_state_identity.md",
     "artifact_manifest.md",
     "rubric_scorecard_summary.md",
@@ -335,6 +401,28 @@ class PromptSatisfactionEntry:
     implementation_paths: tuple[str, ...] = ()
 
 
+@dataclasses.dataclass(frozen=True)
+class PromptModel:
+    """Everything the gates derive from prompt.txt, keyed by its sha256.
+
+    `requirements` follows the stabilizer (action-line fallback when the prompt
+    has no numbered items); `declared_requirements` is numbered items plus
+    acceptance bullets only. Word lists hold every lowercase token of 4+
+    characters, before each consumer applies its own stopwords.
+    `primary_ref_candidates` are raw file refs; bare names are resolved against
+    the run directory at lookup time.
+    """
+
+    prompt_sha256: str
+    requirements: tuple[str, ...]
+    requirement_ids: tuple[str, ...]
+    declared_requirements: tuple[str, ...]
+    acceptance_criteria: tuple[str, ...]
+    primary_ref_candidates: tuple[str, ...]
+    prompt_words: tuple[str, ...]
+    requirement_words: tuple[tuple[str, ...], ...]
+
+
 @dataclasses.dataclass(frozen=True)
 class IterationRecord:
     iteration: int
@@ -465,6 +553,70 @@ def parse_args() -> argparse.Namespace:
         default="",
         help="Optional JSON output path.",
     )
+    p.add_argument(
+        "--record-cache",
+        default=os.environ.get(RECORD_CACHE_ENV, "on"),
+        help=(
+            "Iteration record cache in iterations/.record_cache.json: on, off, or "
+            "verify (re-resolve cache hits and report mismatches). "
+            "Env: RBD_RECORD_CACHE."
+        ),
+    )
+    p.add_argument(
+        "--stability-fold",
+        default=os.environ.get(STABILITY_FOLD_ENV, "on"),
+        help=(
+            "Incremental stability fold state in STABILITY_FOLD.json: on, off, or "
+            "verify (also replay every record and report mismatches). "
+            "Env: RBD_STABILITY_FOLD."
+        ),
+    )
+    p.add_argument(
+        "--read-cache",
+        default=os.environ.get(READ_CACHE_ENV, "on"),
+        help=(
+            "Stat-validated in-process cache of artifact text and parsed views shared "
+            "by resolve_record gate checks: on or off. Env: RBD_READ_CACHE."
+        ),
+    )
+    p.add_argument(
+        "--profile",
+        default=os.environ.get(PROFILE_ENV, "off"),
+        help=(
+            "off, cprofile (one pstats file per phase: record_collection, gate_evaluation, "
+            "rendering, codex_supervision) or sampling (stack samples of threads inside a "
+            "phase, written as folded stacks). Output and a top-N hotspot list go to "
+            "<project-root>/profiles/. Env: RBD_PROFILE."
+        ),
+    )
+    p.add_argument(
+        "--profile-interval",
+        type=float,
+        default=float(os.environ.get(PROFILE_INTERVAL_ENV, "0.01")),
+        help="Seconds between --profile sampling snapshots. Env: RBD_PROFILE_INTERVAL.",
+    )
+    p.add_argument(
+        "--profile-top",
+        type=int,
+        default=15,
+        help="Number of hotspots kept in the --profile summary.",
+    )
+    p.add_argument(
+        "--resume-partial-iteration",
+        default=os.environ.get(RESUME_PARTIAL_ENV, "auto"),
+        help=(
+            "auto: when the latest iteration is this chain's, its codex session was killed "
+            "by the timeout, no-progress or policy watchdog after finishing some but not all "
+            "phases (baseline judge, author deltas, recheck judge) and it has no resolved "
+            "record, continue that iteration with a prompt for the remaining phases only; "
+            "off: always start a new iteration. Env: RBD_RESUME_PARTIAL."
+        ),
+    )
+    p.add_argument(
+        "--write-prompt-model",
+        action="store_true",
+        help=f"Write {PROMPT_MODEL_FILE} for <project-root>/prompt.txt and exit.",
+    )
     p.add_argument(
         "--fail-if-unstable",
         action="store_true",
@@ -514,6 +666,16 @@ def parse_args() -> argparse.Namespace:
             "Set 0 to disable."
         ),
     )
+    p.add_argument(
+        "--watch-backend",
+        default=os.environ.get(WATCH_BACKEND_ENV, "auto"),
+        help=(
+            "Artifact change detection for the codex supervision loop: auto (inotify "
+            "with polling fallback), inotify (fail if unavailable), or poll. Either "
+            "inotify mode switches to polling if a new directory cannot be watched "
+            "(e.g. max_user_watches exhausted). Env: RBD_WATCH_BACKEND."
+        ),
+    )
     p.add_argument(
         "--codex-bin",
         default="codex",
@@ -623,6 +785,520 @@ def _linux_set_pdeathsig(sig: int) -> None:
     _ = prctl(PR_SET_PDEATHSIG, ctypes.c_ulong(sig), 0, 0, 0)
 
 
+class PollingArtifactWatcher:
+    """Change detection by walking every watch root (one full scan per query)."""
+
+    backend = "poll"
+
+    def __init__(self, roots: list[Path], *, exclude_part: str = "_autonomous") -> None:
+        self.roots = roots
+        self.exclude_part = exclude_part
+
+    def latest_mtime(self) -> float:
+        latest = 0.0
+        for root in self.roots:
+            if not root.exists():
+                continue
+            if root.is_file():
+                try:
+                    latest = max(latest, root.stat().st_mtime)
+                except OSError:
+                    pass
+                continue
+            try:
+                iterator = root.rglob("*")
+            except OSError:
+                continue
+            for child in iterator:
+                if not child.is_file():
+                    continue
+                if self.exclude_part in child.parts:
+                    continue
+                try:
+                    latest = max(latest, child.stat().st_mtime)
+                except OSError:
+                    continue
+        return latest
+
+    def take_changes(self) -> bool:
+        # Polling cannot tell what changed; callers must assume everything did.
+        return True
+
+    def wait(self, timeout: float, wake_fds: tuple[int, ...] = ()) -> None:
+        if wake_fds:
+            try:
+                select.select(list(wake_fds), [], [], max(0.0, timeout))
+                return
+            except (OSError, ValueError):
+                pass
+        time.sleep(max(0.0, timeout))
+
+    def close(self) -> None:
+        return None
+
+
+class InotifyArtifactWatcher:
+    """Incremental change detection backed by Linux inotify (via ctypes).
+
+    Keeps the latest non-excluded file mtime and a dirty flag up to date from
+    kernel events, so queries are O(events) instead of O(tree). If a directory
+    created later cannot be watched (typically `max_user_watches`), the watcher
+    degrades to full scans rather than miss writes inside it.
+    """
+
+    backend = "inotify"
+
+    def __init__(self, roots: list[Path], *, exclude_part: str = "_autonomous") -> None:
+        if os.name != "posix":
+            raise OSError("inotify requires a posix host")
+        libc = ctypes.CDLL("libc.so.6", use_errno=True)
+        self._add_watch = libc.inotify_add_watch
+        self._add_watch.argtypes = [ctypes.c_int, ctypes.c_char_p, ctypes.c_uint32]
+        self._add_watch.restype = ctypes.c_int
+        libc.inotify_init1.argtypes = [ctypes.c_int]
+        libc.inotify_init1.restype = ctypes.c_int
+        fd = libc.inotify_init1(os.O_NONBLOCK | os.O_CLOEXEC)
+        if fd < 0:
+            err = ctypes.get_errno()
+            raise OSError(err, os.strerror(err))
+        self.fd = fd
+        self.roots = roots
+        self.exclude_part = exclude_part
+        self._fallback: PollingArtifactWatcher | None = None
+        self.watch_dirs: dict[int, str] = {}
+        self._watched: set[str] = set()
+        self._latest = 0.0
+        self._changed = True
+        # Bumped for every non-excluded event; wait() returns only when it moves.
+        self._events = 0
+        try:
+            for root in roots:
+                if root.is_dir():
+                    self._watch_tree(os.fspath(root))
+                elif root.is_file():
+                    self._note_file(os.fspath(root))
+        except OSError:
+            self.close()
+            raise
+
+    def _excluded(self, path: str) -> bool:
+        return self.exclude_part in Path(path).parts
+
+    def _note_file(self, path: str) -> None:
+        if self._excluded(path):
+            return
+        try:
+            st = os.stat(path)
+        except OSError:
+            return
+        if not os.path.isfile(path):
+            return
+        self._latest = max(self._latest, st.st_mtime)
+
+    def _watch_tree(self, top: str) -> None:
+        if self._excluded(top):
+            return
+        for dirpath, dirnames, filenames in os.walk(top):
+            # No watches below excluded dirs: codex log chunks would wake wait().
+            dirnames[:] = [name for name in dirnames if name != self.exclude_part]
+            if dirpath in self._watched:
+                continue
+            wd = self._add_watch(self.fd, os.fsencode(dirpath), INOTIFY_WATCH_MASK)
+            if wd < 0:
+                err = ctypes.get_errno()
+                raise OSError(err, f"inotify_add_watch failed for {dirpath}: {os.strerror(err)}")
+            self.watch_dirs[wd] = dirpath
+            self._watched.add(dirpath)
+            for name in filenames:
+                self._note_file(os.path.join(dirpath, name))
+
+    def _degrade(self, exc: OSError) -> None:
+        print(f"autonomous_watch_backend_degraded=poll reason={exc}", flush=True)
+        self._fallback = PollingArtifactWatcher(self.roots, exclude_part=self.exclude_part)
+        self.backend = "poll"
+        self.close()
+
+    def _drain(self) -> None:
+        while self.fd >= 0:
+            try:
+                buf = os.read(self.fd, 64 * 1024)
+            except BlockingIOError:
+                return
+            if not buf:
+                return
+            offset = 0
+            while offset + INOTIFY_EVENT.size <= len(buf):
+                wd, mask, _cookie, name_len = INOTIFY_EVENT.unpack_from(buf, offset)
+                raw_name = buf[offset + INOTIFY_EVENT.size : offset + INOTIFY_EVENT.size + name_len]
+                offset += INOTIFY_EVENT.size + name_len
+                if mask & IN_Q_OVERFLOW:
+                    # Lost events: rebuild state from a fresh scan.
+                    for dirpath in list(self.watch_dirs.values()):
+                        for name in os.listdir(dirpath) if os.path.isdir(dirpath) else ():
+                            self._note_file(os.path.join(dirpath, name))
+                    self._changed = True
+                    continue
+                if mask & IN_IGNORED:
+                    self._watched.discard(self.watch_dirs.pop(wd, ""))
+                    continue
+                parent = self.watch_dirs.get(wd)
+                if parent is None:
+                    continue
+                name = os.fsdecode(raw_name.rstrip(b"\0"))
+                path = os.path.join(parent, name) if name else parent
+                if self._excluded(path):
+                    continue
+                self._changed = True
+                self._events += 1
+                if mask & IN_ISDIR:
+                    if mask & (IN_CREATE | IN_MOVED_TO):
+                        try:
+                            self._watch_tree(path)
+                        except OSError as exc:
+                            self._degrade(exc)
+                            return
+                    continue
+                if mask & (IN_DELETE | IN_MOVED_FROM):
+                    continue
+                self._note_file(path)
+
+    def latest_mtime(self) -> float:
+        self._drain()
+        if self._fallback is not None:
+            return self._fallback.latest_mtime()
+        return self._latest
+
+    def take_changes(self) -> bool:
+        self._drain()
+        if self._fallback is not None:
+            return self._fallback.take_changes()
+        changed = self._changed
+        self._changed = False
+        return changed
+
+    def wait(self, timeout: float, wake_fds: tuple[int, ...] = ()) -> None:
+        """Block until a non-excluded change, a wake fd, or `timeout` seconds."""
+        deadline = time.monotonic() + max(0.0, timeout)
+        seen = self._events
+        while self._fallback is None:
+            remaining = deadline - time.monotonic()
+            if remaining <= 0:
+                return
+            try:
+                ready, _, _ = select.select([self.fd, *wake_fds], [], [], remaining)
+            except (OSError, ValueError):
+                time.sleep(remaining)
+                return
+            if not ready or any(fd != self.fd for fd in ready):
+                return
+            self._drain()
+            if self._events != seen:
+                return
+        self._fallback.wait(deadline - time.monotonic(), wake_fds)
+
+    def close(self) -> None:
+        if self.fd >= 0:
+            try:
+                os.close(self.fd)
+            except OSError:
+                pass
+            self.fd = -1
+
+
+def open_artifact_watcher(
+    roots: list[Path], backend: str
+) -> PollingArtifactWatcher | InotifyArtifactWatcher:
+    if backend == "inotify":
+        try:
+            return InotifyArtifactWatcher(roots)
+        except (OSError, AttributeError) as exc:
+            raise SystemExit(
+                f"--watch-backend inotify is unavailable: {type(exc).__name__}: {exc}"
+            ) from exc
+    if backend == "auto":
+        try:
+            return InotifyArtifactWatcher(roots)
+        except (OSError, AttributeError) as exc:
+            print(f"autonomous_watch_backend_fallback=poll reason={type(exc).__name__}: {exc}")
+    return PollingArtifactWatcher(roots)
+
+
+class CommandPolicyMatcher:
+    """Flags forbidden codex shell commands in `... -lc '<command>'` stderr lines."""
+
+    def __init__(self, project_root: Path) -> None:
+        self.project_root = project_root.resolve()
+
+    @staticmethod
+    def inline_shell_command(line: str) -> str:
+        marker = "-lc "
+        idx = line.find(marker)
+        if idx == -1:
+            return ""
+        tail = line[idx + len(marker):].strip()
+        if not tail:
+            return ""
+        if tail[0] in {"'", '"'}:
+            quote = tail[0]
+            end = tail.find(quote, 1)
+            if end != -1:
+                return tail[1:end].strip()
+        return tail
+
+    @staticmethod
+    def command_tokens(command_text: str) -> list[str]:
+        """Shell tokens with leading `VAR=value` assignments dropped."""
+        try:
+            tokens = shlex.split(command_text, posix=True)
+        except ValueError:
+            tokens = command_text.split()
+        idx = 0
+        while idx < len(tokens) and ENV_ASSIGNMENT_RE.match(tokens[idx]):
+            idx += 1
+        return tokens[idx:]
+
+    @staticmethod
+    def _normalized(tok: str) -> str:
+        value = tok.strip().lower()
+        while value.startswith("./"):
+            value = value[2:]
+        return value
+
+    def invokes_recursive_orchestrator(self, tokens: list[str]) -> bool:
+        if not tokens:
+            return False
+        head = self._normalized(tokens[0])
+        if head in ORCHESTRATOR_SCRIPT_HEADS:
+            return True
+        if head in {"bash", "sh"} and len(tokens) >= 2:
+            if self._normalized(tokens[1]) in ORCHESTRATOR_SCRIPT_HEADS:
+                return True
+        if head in {"python", "python3"}:
+            script_token = ""
+            for tok in tokens[1:]:
+                low = self._normalized(tok)
+                if low.endswith(".py"):
+                    script_token = low
+                    break
+            if script_token.endswith(("rbd_parallel_links.py", "rbd_autonomous.py")):
+                return True
+            if script_token.endswith("rbd_stabilize.py"):
+                tail = " ".join(tokens[2:]).lower()
+                if "--request-stability" in tail or "--run-chain-once" in tail:
+                    return True
+        return False
+
+    def has_scope_escape(self, tokens: list[str]) -> bool:
+        for tok in tokens:
+            if ".." not in tok or tok.startswith("-"):
+                continue
+            # Ignore obvious regex fragments and non-path tokens.
+            if NON_PATH_TOKEN_CHARS.intersection(tok) or not PATH_LIKE_RE.search(tok):
+                continue
+            candidate = Path(tok)
+            try:
+                resolved = (
+                    candidate.resolve(strict=False)
+                    if candidate.is_absolute()
+                    else (self.project_root / candidate).resolve(strict=False)
+                )
+            except OSError:
+                return True
+            try:
+                resolved.relative_to(self.project_root)
+            except ValueError:
+                return True
+        return False
+
+    def check_line(self, raw: str) -> str | None:
+        if "-lc " not in raw:
+            return None
+        command = self.inline_shell_command(raw.strip())
+        if not command:
+            return None
+        lowered = command.lower()
+        if FORBIDDEN_GIT_RE.search(lowered):
+            return "forbidden git command detected"
+        tokens = self.command_tokens(command)
+        if self.invokes_recursive_orchestrator(tokens):
+            return "forbidden recursive orchestrator command detected"
+        if ("rbd_stabilize.py" in lowered) and ("--request-stability" in lowered):
+            return "forbidden recursive stability request detected"
+        if self.has_scope_escape(tokens):
+            return "forbidden scope-escape path (`../`) detected in command"
+        return None
+
+    def check(self, log_chunk: str) -> str | None:
+        for line in log_chunk.splitlines():
+            violation = self.check_line(line)
+            if violation is not None:
+                return violation
+        return None
+
+
+class StreamLineReader:
+    """Incremental line splitter over a pipe that tees raw bytes to a log.
+
+    Reads at most `chunk_bytes` per call and carries an unterminated tail into
+    the next call, so a line split across writes is seen once and whole. Only
+    the first `max_line_bytes` of an overlong line are kept.
+    """
+
+    def __init__(
+        self,
+        fd: int,
+        sink: Any,
+        *,
+        chunk_bytes: int = STDERR_READ_CHUNK_BYTES,
+        max_line_bytes: int = STDERR_MAX_LINE_BYTES,
+    ) -> None:
+        self.fd = fd
+        self.sink = sink
+        self.chunk_bytes = chunk_bytes
+        self.max_line_bytes = max_line_bytes
+        self.eof = False
+        self._partial = b""
+        self._discarding = False
+
+    def read_lines(self) -> tuple[list[str], int]:
+        """Complete lines from at most one chunk, and the number of bytes read."""
+        try:
+            data = os.read(self.fd, self.chunk_bytes)
+        except BlockingIOError:
+            return [], 0
+        except OSError:
+            data = b""
+        if not data:
+            self.eof = True
+            tail, self._partial = self._partial, b""
+            if tail and not self._discarding:
+                return [tail.decode("utf-8", errors="ignore")], 0
+            return [], 0
+        self.sink.write(data)
+        self.sink.flush()
+        parts = (self._partial + data).split(b"\n")
+        self._partial = parts.pop()
+        lines: list[str] = []
+        for part in parts:
+            if self._discarding:
+                # Remainder of a line whose head was already emitted.
+                self._discarding = False
+                continue
+            lines.append(part.decode("utf-8", errors="ignore"))
+        if len(self._partial) > self.max_line_bytes:
+            if not self._discarding:
+                lines.append(self._partial[: self.max_line_bytes].decode("utf-8", errors="ignore"))
+            self._discarding = True
+            self._partial = b""
+        return lines, len(data)
+
+
+class CodexStreamMonitor:
+    """Reads codex stdout/stderr pipes on a background thread.
+
+    Both streams are teed to their log files. Every complete stderr line goes
+    through `matcher`; a violation is queued on `events` as
+    ("violation", message) and wakes the supervision loop through `wake_fd`.
+    `last_activity` is the monotonic time stderr last grew.
+    """
+
+    def __init__(
+        self,
+        stdout_pipe: Any,
+        stderr_pipe: Any,
+        stdout_sink: Any,
+        stderr_sink: Any,
+        matcher: CommandPolicyMatcher,
+        *,
+        poll_seconds: float = STDERR_POLL_SECONDS,
+    ) -> None:
+        self._pipes = (stdout_pipe, stderr_pipe)
+        self.stdout_reader = StreamLineReader(stdout_pipe.fileno(), stdout_sink)
+        self.stderr_reader = StreamLineReader(stderr_pipe.fileno(), stderr_sink)
+        self.matcher = matcher
+        self.poll_seconds = poll_seconds
+        self.events: queue.Queue[tuple[str, str]] = queue.Queue()
+        self.last_activity = 0.0
+        self.bytes_read = 0
+        self._sink_lock = threading.Lock()
+        self._stop = threading.Event()
+        self._wake_r, self._wake_w = os.pipe()
+        os.set_blocking(self._wake_r, False)
+        os.set_blocking(self._wake_w, False)
+        self._thread = threading.Thread(target=self._run, name="codex-stream-monitor", daemon=True)
+
+    @property
+    def wake_fd(self) -> int:
+        return self._wake_r
+
+    def start(self) -> CodexStreamMonitor:
+        self._thread.start()
+        return self
+
+    def write_note(self, message: str) -> None:
+        with self._sink_lock:
+            self.stderr_reader.sink.write((message + "\n").encode("utf-8"))
+            self.stderr_reader.sink.flush()
+
+    def _run(self) -> None:
+        readers = {r.fd: r for r in (self.stdout_reader, self.stderr_reader)}
+        while readers and not self._stop.is_set():
+            try:
+                ready, _, _ = select.select(list(readers), [], [], self.poll_seconds)
+            except (OSError, ValueError):
+                break
+            for fd in ready:
+                reader = readers[fd]
+                with self._sink_lock:
+                    lines, nbytes = reader.read_lines()
+                if reader.eof:
+                    readers.pop(fd)
+                self.bytes_read += nbytes
+                if reader is not self.stderr_reader:
+                    continue
+                if nbytes:
+                    self.last_activity = time.monotonic()
+                for line in lines:
+                    violation = self.matcher.check_line(line)
+                    if violation is not None:
+                        self.events.put(("violation", violation))
+                        try:
+                            os.write(self._wake_w, b"!")
+                        except OSError:
+                            pass
+
+    def poll_violation(self) -> str | None:
+        try:
+            while os.read(self._wake_r, 512):
+                pass
+        except OSError:
+            pass
+        try:
+            while True:
+                kind, message = self.events.get_nowait()
+                if kind == "violation":
+                    return message
+        except queue.Empty:
+            return None
+
+    def close(self, drain_seconds: float = 2.0) -> None:
+        """Drain both pipes until EOF (bounded by `drain_seconds`), then stop."""
+        self._thread.join(timeout=max(0.0, drain_seconds))
+        self._stop.set()
+        if self._thread.is_alive():
+            self._thread.join(timeout=2.0)
+        for pipe in self._pipes:
+            try:
+                pipe.close()
+            except OSError:
+                pass
+        for fd in (self._wake_r, self._wake_w):
+            try:
+                os.close(fd)
+            except OSError:
+                pass
+
+
 def parse_chain(chain: str) -> tuple[int, int] | None:
     match = CHAIN_RE.match(chain.strip())
     if not match:
@@ -638,7 +1314,80 @@ def format_chain(upper: int, lower: int) -> str:
     return f"Rubric_{upper} -> Rubric_{lower}"
 
 
-def parse_bullets(md_path: Path) -> dict[str, str]:
+def track_record_read(path: Path) -> None:
+    """Note `path` as an input of the resolve_record call in progress (if any)."""
+    reads = getattr(_RECORD_READS, "paths", None)
+    if reads is not None:
+        reads.add(os.fspath(path))
+
+
+class FileReadCache:
+    """Run-wide cache of file contents and the views parsed from them.
+
+    Entries are keyed by path and validated against (size, mtime_ns) on every
+    lookup; each entry holds derived views by kind (text, bullets, json,
+    prompt_model, ...). Callers must treat returned views as read-only. Rewrites made
+    by the stabilizer itself go through `replace_text`, which drops the entry.
+    """
+
+    def __init__(self, max_entries: int = READ_CACHE_MAX_ENTRIES) -> None:
+        self.max_entries = max_entries
+        self.hits = 0
+        self.misses = 0
+        self.invalidations = 0
+        self._entries: dict[str, tuple[tuple[int, int], dict[str, Any]]] = {}
+        self._lock = threading.Lock()
+
+    def view(self, path: Path, kind: str, build: Callable[[Path], Any]) -> Any:
+        track_record_read(path)
+        if os.environ.get(READ_CACHE_ENV, "on").strip().lower() == "off":
+            return build(path)
+        key = os.fspath(path)
+        try:
+            st = os.stat(key)
+        except OSError:
+            return build(path)
+        stamp = (int(st.st_size), int(st.st_mtime_ns))
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None and entry[0] == stamp and kind in entry[1]:
+                self.hits += 1
+                return entry[1][kind]
+            self.misses += 1
+        value = build(path)
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None or entry[0] != stamp:
+                if len(self._entries) >= self.max_entries:
+                    self._entries.pop(next(iter(self._entries)))
+                entry = (stamp, {})
+                self._entries[key] = entry
+            entry[1][kind] = value
+        return value
+
+    def invalidate(self, path: Path) -> None:
+        with self._lock:
+            if self._entries.pop(os.fspath(path), None) is not None:
+                self.invalidations += 1
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+
+    def stats(self) -> dict[str, int]:
+        with self._lock:
+            return {
+                "hits": self.hits,
+                "misses": self.misses,
+                "invalidations": self.invalidations,
+                "entries": len(self._entries),
+            }
+
+
+FILE_READ_CACHE = FileReadCache()
+
+
+def _read_bullets(md_path: Path) -> dict[str, str]:
     data: dict[str, str] = {}
     if not md_path.exists():
         return data
@@ -650,6 +1399,30 @@ def parse_bullets(md_path: Path) -> dict[str, str]:
     return data
 
 
+def parse_bullets(md_path: Path) -> dict[str, str]:
+    return dict(FILE_READ_CACHE.view(md_path, "bullets", _read_bullets))
+
+
+def replace_text(path: Path, text: str) -> None:
+    """Write `text` to a temp file and `os.replace` it over `path`.
+
+    `path` gets a fresh inode, so epoch snapshot hardlinks (read-only, shared
+    with the snapshot and sibling workers) are never written through, and a
+    failed write leaves the previous file in place.
+    """
+    FILE_READ_CACHE.invalidate(path)
+    tmp = path.with_name(f".{path.name}.{os.getpid()}.tmp")
+    try:
+        tmp.write_text(text, encoding="utf-8")
+        os.replace(tmp, path)
+    except BaseException:
+        try:
+            tmp.unlink()
+        except OSError:
+            pass
+        raise
+
+
 def upsert_simple_bullet(md_path: Path, key: str, value: str) -> bool:
     text = read_text_safe(md_path) if md_path.exists() else ""
     bullet = f"- {key}: {value}"
@@ -662,7 +1435,7 @@ def upsert_simple_bullet(md_path: Path, key: str, value: str) -> bool:
     if updated == text:
         return False
     md_path.parent.mkdir(parents=True, exist_ok=True)
-    md_path.write_text(updated, encoding="utf-8")
+    replace_text(md_path, updated)
     return True
 
 
@@ -690,7 +1463,7 @@ def append_truth_reconciliation_defect(
         "  - remediation_required: align decision and quality claims with computed truth in this same iteration.\n"
     )
     path.parent.mkdir(parents=True, exist_ok=True)
-    path.write_text(text + block, encoding="utf-8")
+    replace_text(path, text + block)
     return True
 
 
@@ -786,6 +1559,7 @@ def reconcile_frontier_best_known_claims(
     return changed
 
 
+@traced("reconcile_iteration_truth")
 def reconcile_iteration_truth(
     *,
     project_root: Path,
@@ -1137,6 +1911,9 @@ def status_is_satisfied(status: str, verification: str = "") -> bool:
     return False
 
 
+# Requirement matching normalizes the same evidence and trace texts once per
+# requirement; memoizing keeps that linear in distinct texts.
+@functools.lru_cache(maxsize=1024)
 def normalize_text(value: str) -> str:
     lowered = value.lower()
     lowered = re.sub(r"`[^`]+`", " ", lowered)
@@ -1218,17 +1995,24 @@ def contains_scope_escape_path(text: str) -> bool:
 
 
 def is_nonempty_file(path: Path) -> bool:
+    track_record_read(path)
     return path.exists() and path.is_file() and path.stat().st_size > 0
 
 
+def tracked_exists(path: Path) -> bool:
+    """`path.exists()`, with the probe (hit or miss) noted as a record input."""
+    track_record_read(path)
+    return path.exists()
+
+
 def resolve_evidence_path(run_root: Path, iter_dir: Path, rel: str) -> Path | None:
     """Resolve evidence/implementation refs against run root and iteration scope."""
     primary = resolve_run_path(run_root, rel)
-    if primary is not None and primary.exists():
+    if primary is not None and tracked_exists(primary):
         return primary
 
     scoped = resolve_run_path(iter_dir, rel)
-    if scoped is not None and scoped.exists():
+    if scoped is not None and tracked_exists(scoped):
         return scoped
 
     clean_rel = normalize_scalar(str(rel)).strip().lstrip("./")
@@ -1242,13 +2026,13 @@ def resolve_evidence_path(run_root: Path, iter_dir: Path, rel: str) -> Path | No
         or clean_rel.startswith("author_deltas/")
     ):
         candidate = resolve_run_path(iter_dir, clean_rel)
-        if candidate is not None and candidate.exists():
+        if candidate is not None and tracked_exists(candidate):
             return candidate
 
     # Allow references written as iteration paths without explicit prefix.
     if clean_rel.startswith("iteration_"):
         candidate = resolve_run_path(run_root / "iterations", clean_rel)
-        if candidate is not None and candidate.exists():
+        if candidate is not None and tracked_exists(candidate):
             return candidate
 
     return None
@@ -1300,6 +2084,7 @@ def normalize_rel_ref(ref: str) -> str:
 
 
 def file_sha256_hex(path: Path) -> str:
+    track_record_read(path)
     digest = hashlib.sha256()
     try:
         with path.open("rb") as fh:
@@ -1408,7 +2193,7 @@ def write_primary_artifact_runtime(
 ) -> None:
     path = iter_dir / PRIMARY_ARTIFACT_RUNTIME_FILE
     try:
-        path.write_text(json.dumps(payload, indent=2) + "\n", encoding="utf-8")
+        replace_text(path, json.dumps(payload, indent=2) + "\n")
     except OSError:
         pass
 
@@ -1420,7 +2205,7 @@ def load_primary_artifact_runtime(iter_dir: Path) -> dict[str, object] | None:
     raw = read_text_safe(path)
     if not raw.strip():
         return None
-    data, _repaired = load_json_lenient(raw)
+    data, _repaired = read_json_lenient(path)
     if isinstance(data, dict):
         return data
     return None
@@ -1541,12 +2326,14 @@ def _iter_acceptable_files_in_dir(
     max_files: int = 32,
 ) -> list[Path]:
     files: list[Path] = []
+    track_record_read(path)
     if not path.exists() or (not path.is_dir()):
         return files
     try:
         for child in sorted(path.rglob("*")):
             if not child.is_file():
                 continue
+            track_record_read(child)
             if evidence_ref_is_acceptable(child, run_root, iter_dir):
                 files.append(child)
                 if len(files) >= max_files:
@@ -1581,6 +2368,33 @@ def collect_implementation_ref_chunks(
     return chunks
 
 
+@functools.lru_cache(maxsize=64)
+def prompt_primary_match_keys(
+    prompt_primary_refs: tuple[str, ...],
+) -> tuple[tuple[str, str, str], ...]:
+    """(ref_norm, stem_norm, lowercase name) per primary ref, computed once per prompt."""
+    keys: list[tuple[str, str, str]] = []
+    for ref in prompt_primary_refs:
+        clean_ref = normalize_scalar(ref).strip().lstrip("./")
+        if not clean_ref:
+            continue
+        keys.append(
+            (
+                normalize_text(clean_ref),
+                normalize_text(Path(clean_ref).stem),
+                Path(clean_ref).name.lower(),
+            )
+        )
+    return tuple(keys)
+
+
+@functools.lru_cache(maxsize=64)
+def prompt_primary_ref_set(prompt_primary_refs: tuple[str, ...]) -> frozenset[str]:
+    return frozenset(
+        normalize_scalar(ref).strip().lstrip("./").lower() for ref in prompt_primary_refs
+    )
+
+
 def requirement_requires_prompt_primary_match(
     requirement: str, prompt_primary_refs: tuple[str, ...]
 ) -> bool:
@@ -1588,13 +2402,7 @@ def requirement_requires_prompt_primary_match(
         return False
     req_raw = normalize_scalar(requirement).lower()
     req_norm = normalize_text(requirement)
-    for ref in prompt_primary_refs:
-        clean_ref = normalize_scalar(ref).strip().lstrip("./")
-        if not clean_ref:
-            continue
-        ref_norm = normalize_text(clean_ref)
-        stem_norm = normalize_text(Path(clean_ref).stem)
-        name_l = Path(clean_ref).name.lower()
+    for ref_norm, stem_norm, name_l in prompt_primary_match_keys(prompt_primary_refs):
         if ref_norm and ref_norm in req_norm:
             return True
         if stem_norm and stem_norm in req_norm:
@@ -1620,9 +2428,7 @@ def implementation_refs_are_valid(
     if not refs:
         return False
 
-    prompt_primary_set = {
-        normalize_scalar(ref).strip().lstrip("./").lower() for ref in prompt_primary_refs
-    }
+    prompt_primary_set = prompt_primary_ref_set(tuple(prompt_primary_refs))
 
     valid_any = 0
     valid_primary_like = 0
@@ -1668,14 +2474,13 @@ def implementation_refs_are_valid(
 
 
 def parse_prompt_requirements(prompt_path: Path) -> list[str]:
-    if not prompt_path.exists():
-        return []
-    try:
-        lines = prompt_path.read_text(encoding="utf-8", errors="ignore").splitlines()
-    except OSError:
-        return []
+    return list(load_prompt_model(prompt_path).requirements)
 
+
+def prompt_requirement_views(lines: list[str]) -> tuple[list[str], list[str], list[str]]:
+    """Return (requirements, declared_requirements, acceptance_criteria)."""
     requirements: list[str] = []
+    acceptance: list[str] = []
     seen: set[str] = set()
     in_acceptance = False
     found_numbered = False
@@ -1698,6 +2503,8 @@ def parse_prompt_requirements(prompt_path: Path) -> list[str]:
         if in_acceptance:
             if stripped.startswith("- "):
                 req = stripped[2:].strip()
+                if req and req not in acceptance:
+                    acceptance.append(req)
                 if req and req not in seen:
                     requirements.append(req)
                     seen.add(req)
@@ -1705,8 +2512,9 @@ def parse_prompt_requirements(prompt_path: Path) -> list[str]:
             if stripped.endswith(":"):
                 in_acceptance = False
 
+    declared = list(requirements)
     if found_numbered:
-        return requirements
+        return requirements, declared, acceptance
 
     for raw in lines:
         stripped = raw.strip()
@@ -1716,15 +2524,93 @@ def parse_prompt_requirements(prompt_path: Path) -> list[str]:
             if stripped not in seen:
                 requirements.append(stripped)
                 seen.add(stripped)
-    return requirements
+    return requirements, declared, acceptance
+
+
+def prompt_word_tokens(text: str) -> tuple[str, ...]:
+    return tuple(sorted({tok for tok in re.findall(r"[a-z0-9]+", text.lower()) if len(tok) >= 4}))
+
+
+def build_prompt_model(raw: bytes) -> PromptModel:
+    text = raw.decode("utf-8", errors="ignore")
+    lines = text.splitlines()
+    requirements, declared, acceptance = prompt_requirement_views(lines)
+    candidates: list[str] = []
+    for line in lines:
+        stripped = line.strip()
+        if not stripped:
+            continue
+        write_match = PROMPT_WRITE_FILE_RE.match(stripped)
+        refs = [write_match.group(1)] if write_match else []
+        refs.extend(extract_file_refs(stripped))
+        for ref in refs:
+            if ref not in candidates:
+                candidates.append(ref)
+    return PromptModel(
+        prompt_sha256=hashlib.sha256(raw).hexdigest(),
+        requirements=tuple(requirements),
+        requirement_ids=tuple(f"RQ-{idx:02d}" for idx in range(1, len(requirements) + 1)),
+        declared_requirements=tuple(declared),
+        acceptance_criteria=tuple(acceptance),
+        primary_ref_candidates=tuple(candidates),
+        prompt_words=prompt_word_tokens(text),
+        requirement_words=tuple(prompt_word_tokens(req) for req in requirements),
+    )
+
+
+def prompt_model_payload(model: PromptModel) -> dict[str, Any]:
+    return {"version": PROMPT_MODEL_VERSION, **dataclasses.asdict(model)}
+
+
+def _load_prompt_model(prompt_path: Path) -> PromptModel:
+    try:
+        raw = prompt_path.read_bytes()
+    except OSError:
+        raw = b""
+    sha = hashlib.sha256(raw).hexdigest()
+    try:
+        data = json.loads((prompt_path.parent / PROMPT_MODEL_FILE).read_text(encoding="utf-8"))
+    except (OSError, json.JSONDecodeError):
+        data = None
+    if (
+        isinstance(data, dict)
+        and data.get("version") == PROMPT_MODEL_VERSION
+        and data.get("prompt_sha256") == sha
+    ):
+        try:
+            return PromptModel(
+                prompt_sha256=sha,
+                requirements=tuple(data["requirements"]),
+                requirement_ids=tuple(data["requirement_ids"]),
+                declared_requirements=tuple(data["declared_requirements"]),
+                acceptance_criteria=tuple(data["acceptance_criteria"]),
+                primary_ref_candidates=tuple(data["primary_ref_candidates"]),
+                prompt_words=tuple(data["prompt_words"]),
+                requirement_words=tuple(tuple(words) for words in data["requirement_words"]),
+            )
+        except (KeyError, TypeError):
+            pass
+    return build_prompt_model(raw)
+
+
+def load_prompt_model(prompt_path: Path) -> PromptModel:
+    """Return the model for `prompt_path`, preferring a matching prompt.model.json."""
+    return FILE_READ_CACHE.view(prompt_path, "prompt_model", _load_prompt_model)
+
+
+def write_prompt_model(prompt_path: Path) -> Path:
+    model = build_prompt_model(prompt_path.read_bytes())
+    out_path = prompt_path.parent / PROMPT_MODEL_FILE
+    tmp_path = out_path.with_name(out_path.name + ".tmp")
+    tmp_path.write_text(json.dumps(prompt_model_payload(model), indent=2) + "\n", encoding="utf-8")
+    os.replace(tmp_path, out_path)
+    return out_path
 
 
 def infer_prompt_primary_artifact_refs(prompt_path: Path) -> tuple[str, ...]:
     if not prompt_path.exists():
         return ()
-    text = read_text_safe(prompt_path)
-    if not text:
-        return ()
+    model = load_prompt_model(prompt_path)
 
     refs: list[str] = []
     seen: set[str] = set()
@@ -1758,8 +2644,10 @@ def infer_prompt_primary_artifact_refs(prompt_path: Path) -> tuple[str, ...]:
                 continue
             checked.add(key)
             path = run_root / candidate
+            track_record_read(path)
             if path.exists() and path.is_file():
                 return path.name
+        track_record_read(run_root)
         try:
             for child in run_root.iterdir():
                 if not child.is_file():
@@ -1786,20 +2674,17 @@ def infer_prompt_primary_artifact_refs(prompt_path: Path) -> tuple[str, ...]:
         refs.append(normalized)
         seen.add(lowered)
 
-    for raw in text.splitlines():
-        stripped = raw.strip()
-        if not stripped:
-            continue
-        write_match = PROMPT_WRITE_FILE_RE.match(stripped)
-        if write_match:
-            maybe_add(write_match.group(1))
-        for ref in extract_file_refs(stripped):
-            maybe_add(ref)
+    for ref in model.primary_ref_candidates:
+        maybe_add(ref)
 
     return tuple(refs)
 
 
 def parse_prompt_satisfaction_entries(path: Path) -> list[PromptSatisfactionEntry]:
+    return list(FILE_READ_CACHE.view(path, "prompt_satisfaction", _read_prompt_satisfaction_entries))
+
+
+def _read_prompt_satisfaction_entries(path: Path) -> list[PromptSatisfactionEntry]:
     if not path.exists():
         return []
     try:
@@ -2138,13 +3023,18 @@ def semantic_tokens(value: str, *, min_len: int = 4) -> set[str]:
     }
 
 
+@functools.lru_cache(maxsize=1024)
+def semantic_token_set(value: str) -> frozenset[str]:
+    return frozenset(semantic_tokens(value))
+
+
 def requirement_matches_trace_text(requirement: str, trace_text: str) -> bool:
     req_norm = normalize_text(requirement)
     trace_norm = normalize_text(trace_text)
     if req_norm and trace_norm and (req_norm in trace_norm or trace_norm in req_norm):
         return True
-    req_tokens = semantic_tokens(requirement)
-    trace_tokens = semantic_tokens(trace_text)
+    req_tokens = semantic_token_set(requirement)
+    trace_tokens = semantic_token_set(trace_text)
     if not req_tokens or not trace_tokens:
         return False
     overlap = req_tokens & trace_tokens
@@ -2175,13 +3065,111 @@ def requirement_matches_entry(requirement: str, entry: PromptSatisfactionEntry)
     return False
 
 
-def read_text_safe(path: Path) -> str:
+@dataclasses.dataclass(frozen=True)
+class RequirementMatchIndex:
+    """Inverted index over PROMPT_SATISFACTION entries.
+
+    `requirement_candidates` returns the same entries, in file order, as
+    filtering with `requirement_matches_entry` plus the RQ/REQ id check, but
+    finds token and file-ref overlaps through posting lists instead of
+    re-normalizing every entry for every requirement.
+    """
+
+    entries: tuple[PromptSatisfactionEntry, ...]
+    norms: tuple[str, ...]
+    token_counts: tuple[int, ...]
+    by_token: dict[str, tuple[int, ...]]
+    by_ref: dict[str, tuple[int, ...]]
+    by_id: dict[str, tuple[int, ...]]
+
+
+def build_requirement_match_index(
+    entries: Iterable[PromptSatisfactionEntry],
+) -> RequirementMatchIndex:
+    entry_list = tuple(entries)
+    norms: list[str] = []
+    token_counts: list[int] = []
+    by_token: dict[str, list[int]] = {}
+    by_ref: dict[str, list[int]] = {}
+    by_id: dict[str, list[int]] = {}
+    for idx, entry in enumerate(entry_list):
+        ent_norm = normalize_text(entry.requirement)
+        tokens = set(ent_norm.split())
+        norms.append(ent_norm)
+        token_counts.append(len(tokens))
+        for tok in tokens:
+            by_token.setdefault(tok, []).append(idx)
+        refs = (
+            set(extract_file_refs(entry.requirement))
+            | set(entry.evidence_paths)
+            | set(entry.implementation_paths)
+        )
+        for ref in refs:
+            by_ref.setdefault(ref, []).append(idx)
+        by_id.setdefault(normalize_scalar(entry.requirement).strip().upper(), []).append(idx)
+    return RequirementMatchIndex(
+        entries=entry_list,
+        norms=tuple(norms),
+        token_counts=tuple(token_counts),
+        by_token={tok: tuple(ids) for tok, ids in by_token.items()},
+        by_ref={ref: tuple(ids) for ref, ids in by_ref.items()},
+        by_id={key: tuple(ids) for key, ids in by_id.items()},
+    )
+
+
+def load_requirement_match_index(path: Path) -> RequirementMatchIndex:
+    """Index for `path`, built once per PROMPT_SATISFACTION.md revision."""
+    return FILE_READ_CACHE.view(
+        path,
+        "requirement_index",
+        lambda p: build_requirement_match_index(parse_prompt_satisfaction_entries(p)),
+    )
+
+
+def requirement_candidates(
+    index: RequirementMatchIndex,
+    requirement: str,
+    requirement_ids: set[str],
+) -> list[PromptSatisfactionEntry]:
+    hits: set[int] = set()
+    req_norm = normalize_text(requirement)
+    if req_norm:
+        # Substring containment is not token-aligned; a scan over the
+        # precomputed norms is cheap compared to normalizing each entry.
+        for idx, ent_norm in enumerate(index.norms):
+            if ent_norm and (req_norm in ent_norm or ent_norm in req_norm):
+                hits.add(idx)
+    for ref in set(extract_file_refs(requirement)):
+        hits.update(index.by_ref.get(ref, ()))
+    req_tokens = set(req_norm.split())
+    if req_tokens:
+        overlap: dict[int, int] = {}
+        for tok in req_tokens:
+            for idx in index.by_token.get(tok, ()):
+                overlap[idx] = overlap.get(idx, 0) + 1
+        for idx, shared in overlap.items():
+            if shared >= max(2, min(len(req_tokens), index.token_counts[idx]) // 2):
+                hits.add(idx)
+    for requirement_id in requirement_ids:
+        hits.update(index.by_id.get(requirement_id, ()))
+    return [index.entries[idx] for idx in sorted(hits)]
+
+
+def _read_text(path: Path) -> str:
     try:
         return path.read_text(encoding="utf-8", errors="ignore")
     except OSError:
         return ""
 
 
+def read_text_safe(path: Path) -> str:
+    return FILE_READ_CACHE.view(path, "text", _read_text)
+
+
+def read_json_lenient(path: Path) -> tuple[Any | None, str]:
+    return FILE_READ_CACHE.view(path, "json", lambda p: load_json_lenient(read_text_safe(p)))
+
+
 def is_prompt_source_ref(ref: str) -> bool:
     normalized = str(ref).strip().strip("`").lower()
     if not normalized:
@@ -2190,6 +3178,8 @@ def is_prompt_source_ref(ref: str) -> bool:
     return normalized == "prompt.txt" or normalized.endswith("/prompt.txt")
 
 
+# Cached text objects from FILE_READ_CACHE hash once, so repeat scans are cheap.
+@functools.lru_cache(maxsize=4096)
 def looks_synthetic_text(text: str) -> bool:
     return any(pattern.search(text) for pattern in SYNTHETIC_TEXT_PATTERNS)
 
@@ -2220,14 +3210,14 @@ def rubric_json_has_real_delta(
     raw = read_text_safe(path)
     if looks_synthetic_text(raw):
         return False
-    data, repaired_json = load_json_lenient(raw)
+    data, repaired_json = read_json_lenient(path)
     if data is None:
         return False
     if not isinstance(data, dict):
         return False
     if repaired_json != raw:
         try:
-            path.write_text(json.dumps(data, indent=2) + "\n", encoding="utf-8")
+            replace_text(path, json.dumps(data, indent=2) + "\n")
         except OSError:
             pass
     x_axis = data.get("x_axis")
@@ -2520,7 +3510,7 @@ def rubric_json_has_minimum_delta(
     if looks_synthetic_text(raw):
         return False
 
-    data, repaired_json = load_json_lenient(raw)
+    data, repaired_json = read_json_lenient(path)
     if data is None or not isinstance(data, dict):
         # Resilience fallback: accept structurally rich rubric-like JSON text
         # even when strict JSON parsing fails (for example, one malformed quote),
@@ -2553,7 +3543,7 @@ def rubric_json_has_minimum_delta(
         return True
     if repaired_json != raw:
         try:
-            path.write_text(json.dumps(data, indent=2) + "\n", encoding="utf-8")
+            replace_text(path, json.dumps(data, indent=2) + "\n")
         except OSError:
             pass
 
@@ -2638,12 +3628,12 @@ def rubric_json_has_axis_trace_delta(
     raw = read_text_safe(path)
     if looks_synthetic_text(raw):
         return False
-    data, repaired_json = load_json_lenient(raw)
+    data, repaired_json = read_json_lenient(path)
     if data is None or not isinstance(data, dict):
         return False
     if repaired_json != raw:
         try:
-            path.write_text(json.dumps(data, indent=2) + "\n", encoding="utf-8")
+            replace_text(path, json.dumps(data, indent=2) + "\n")
         except OSError:
             pass
 
@@ -2686,7 +3676,9 @@ def iteration_has_real_delta_evidence(iter_dir: Path, chain: str) -> bool:
     run_root = iter_dir.parent.parent
     prompt_path = run_root / "prompt.txt"
     prompt_requirements = parse_prompt_requirements(prompt_path)
-    prompt_words = semantic_tokens(read_text_safe(prompt_path))
+    prompt_words = {
+        tok for tok in load_prompt_model(prompt_path).prompt_words if tok not in SEMANTIC_STOPWORDS
+    }
 
     paths = {
         "deltas": run_root / f"deltas/iteration_{iteration_label}.md",
@@ -2767,12 +3759,9 @@ def iteration_has_real_delta_evidence(iter_dir: Path, chain: str) -> bool:
 
 def baseline_has_prompt_linkage(baseline_path: Path) -> bool:
     if not baseline_path.exists():
+        track_record_read(baseline_path)
         return False
-    try:
-        text = baseline_path.read_text(encoding="utf-8", errors="ignore")
-    except OSError:
-        return False
-    return bool(PROMPT_LINK_RE.search(text))
+    return bool(PROMPT_LINK_RE.search(read_text_safe(baseline_path)))
 
 
 def artifact_has_prompt_access(path: Path) -> bool:
@@ -3194,6 +4183,7 @@ def primary_artifact_delta_is_meaningful(iter_dir: Path, chain: str) -> bool:
             resolved = resolve_run_path(run_root, raw_ref)
             if resolved is None or not artifact_file_has_substance(resolved):
                 continue
+            track_record_read(resolved)
             try:
                 if resolved.stat().st_mtime + 1e-6 >= start_epoch:
                     return True
@@ -3257,7 +4247,8 @@ def run_level_prompt_satisfaction_complete(iter_dir: Path) -> bool:
         path = run_root / "PROMPT_SATISFACTION.md"
     if not path.exists():
         return False
-    entries = parse_prompt_satisfaction_entries(path)
+    match_index = load_requirement_match_index(path)
+    entries = match_index.entries
     if not entries:
         return False
 
@@ -3353,12 +4344,7 @@ def run_level_prompt_satisfaction_complete(iter_dir: Path) -> bool:
             f"REQ-{req_index}",
             f"REQ-{req_index:02d}",
         }
-        candidates = [
-            e
-            for e in entries
-            if requirement_matches_entry(requirement, e)
-            or normalize_scalar(e.requirement).strip().upper() in requirement_ids
-        ]
+        candidates = requirement_candidates(match_index, requirement, requirement_ids)
         if not candidates:
             return False
 
@@ -3403,9 +4389,8 @@ def run_level_prompt_satisfaction_complete(iter_dir: Path) -> bool:
 
 def identity_lock_evidence_exists(iter_dir: Path) -> bool:
     run_root = iter_dir.parent.parent
-    return (
-        (run_root / "LIQUID_STATE_IDENTITY.md").exists()
-        or (iter_dir / "LIQUID_STATE_IDENTITY.md").exists()
+    return tracked_exists(run_root / "LIQUID_STATE_IDENTITY.md") or tracked_exists(
+        iter_dir / "LIQUID_STATE_IDENTITY.md"
     )
 
 
@@ -3574,18 +4559,187 @@ def resolve_record(iter_dir: Path) -> IterationRecord | None:
     )
 
 
-def collect_records(iterations_dir: Path) -> list[IterationRecord]:
+def path_signature(path: str) -> list[int] | None:
+    try:
+        st = os.stat(path)
+    except OSError:
+        return None
+    return [int(st.st_size), int(st.st_mtime_ns)]
+
+
+def iteration_tree_signature(iter_dir: Path) -> str:
+    digest = hashlib.sha256()
+    for dirpath, dirnames, filenames in os.walk(iter_dir):
+        dirnames.sort()
+        for name in [".", *sorted(filenames)]:
+            full = os.path.join(dirpath, name)
+            sig = path_signature(full)
+            rel = os.path.relpath(full, iter_dir)
+            digest.update(f"{rel}\0{sig}\n".encode("utf-8"))
+    return digest.hexdigest()
+
+
+_STABILIZER_SOURCE_HASH: str | None = None
+
+
+def stabilizer_source_hash() -> str:
+    global _STABILIZER_SOURCE_HASH
+    if _STABILIZER_SOURCE_HASH is None:
+        try:
+            _STABILIZER_SOURCE_HASH = hashlib.sha256(Path(__file__).read_bytes()).hexdigest()
+        except (NameError, OSError):
+            _STABILIZER_SOURCE_HASH = "unknown"
+    return _STABILIZER_SOURCE_HASH
+
+
+def resolve_record_tracked(iter_dir: Path) -> tuple[IterationRecord | None, set[str]]:
+    previous = getattr(_RECORD_READS, "paths", None)
+    _RECORD_READS.paths = set()
+    try:
+        record = resolve_record(iter_dir)
+        reads = _RECORD_READS.paths
+    finally:
+        _RECORD_READS.paths = previous
+    if previous is not None:
+        previous.update(reads)
+    return record, reads
+
+
+def record_cache_key_path(path: str, run_root: Path) -> str:
+    try:
+        return "@run/" + Path(path).relative_to(run_root).as_posix()
+    except ValueError:
+        return path
+
+
+def record_cache_real_path(key: str, run_root: Path) -> str:
+    if key.startswith("@run/"):
+        return os.fspath(run_root / key[len("@run/"):])
+    return key
+
+
+def record_cache_entry_is_fresh(
+    entry: dict[str, Any], iter_dir: Path, run_root: Path
+) -> bool:
+    if entry.get("tree") != iteration_tree_signature(iter_dir):
+        return False
+    reads = entry.get("reads")
+    if not isinstance(reads, dict):
+        return False
+    for key, sig in reads.items():
+        if path_signature(record_cache_real_path(key, run_root)) != sig:
+            return False
+    return True
+
+
+def load_record_cache(cache_path: Path) -> dict[str, Any]:
+    try:
+        data = json.loads(cache_path.read_text(encoding="utf-8"))
+    except (OSError, ValueError):
+        return {}
+    if not isinstance(data, dict):
+        return {}
+    if data.get("version") != RECORD_CACHE_VERSION:
+        return {}
+    if data.get("stabilizer_sha256") != stabilizer_source_hash():
+        return {}
+    entries = data.get("entries")
+    return entries if isinstance(entries, dict) else {}
+
+
+def store_record_cache(cache_path: Path, entries: dict[str, Any]) -> None:
+    payload = {
+        "version": RECORD_CACHE_VERSION,
+        "stabilizer_sha256": stabilizer_source_hash(),
+        "entries": entries,
+    }
+    tmp_path = cache_path.with_name(f"{cache_path.name}.{os.getpid()}.tmp")
+    try:
+        tmp_path.write_text(json.dumps(payload, sort_keys=True) + "\n", encoding="utf-8")
+        os.replace(tmp_path, cache_path)
+    except OSError:
+        try:
+            tmp_path.unlink()
+        except OSError:
+            pass
+
+
+def record_cache_mode(cache_mode: str | None = None) -> str:
+    mode = (cache_mode or os.environ.get(RECORD_CACHE_ENV, "on")).strip().lower()
+    return mode if mode in RECORD_CACHE_MODES else "on"
+
+
+@profiled("record_collection")
+def collect_records(
+    iterations_dir: Path, cache_mode: str | None = None
+) -> list[IterationRecord]:
+    """Resolve every iteration record, reusing `.record_cache.json` entries.
+
+    Entries are keyed by iteration directory and invalidated when any file under
+    the iteration, or any file resolve_record read outside it, changes size or
+    mtime. `verify` mode re-resolves cache hits and reports disagreements.
+    """
     records: list[IterationRecord] = []
     if not iterations_dir.exists():
         return records
 
+    mode = record_cache_mode(cache_mode)
+    cache_path = iterations_dir / RECORD_CACHE_FILE
+    run_root = iterations_dir.parent
+    cached = load_record_cache(cache_path) if mode != "off" else {}
+    entries: dict[str, Any] = {}
+    dirty = False
     for candidate in sorted(iterations_dir.iterdir()):
         if not candidate.is_dir():
             continue
-        record = resolve_record(candidate)
+        if mode == "off":
+            record = resolve_record(candidate)
+            if record is not None:
+                records.append(record)
+            continue
+        entry = cached.get(candidate.name)
+        record = None
+        hit = isinstance(entry, dict) and record_cache_entry_is_fresh(
+            entry, candidate, run_root
+        )
+        if hit:
+            payload = entry.get("record")
+            record = IterationRecord(**payload) if isinstance(payload, dict) else None
+            if mode == "verify":
+                fresh, _reads = resolve_record_tracked(candidate)
+                if fresh != record:
+                    print(
+                        "record_cache_mismatch="
+                        + json.dumps(
+                            {
+                                "iteration": candidate.name,
+                                "cached": dataclasses.asdict(record) if record else None,
+                                "fresh": dataclasses.asdict(fresh) if fresh else None,
+                            },
+                            sort_keys=True,
+                        )
+                    )
+                    record = fresh
+                    hit = False
+                    dirty = True
+            if hit:
+                entries[candidate.name] = entry
+        if not hit:
+            record, reads = resolve_record_tracked(candidate)
+            entries[candidate.name] = {
+                "tree": iteration_tree_signature(candidate),
+                "reads": {
+                    record_cache_key_path(path, run_root): path_signature(path)
+                    for path in sorted(reads)
+                },
+                "record": dataclasses.asdict(record) if record is not None else None,
+            }
+            dirty = True
         if record is not None:
             records.append(record)
 
+    if mode != "off" and (dirty or set(entries) != set(cached)):
+        store_record_cache(cache_path, entries)
     records.sort(key=lambda r: r.iteration)
     return records
 
@@ -3623,177 +4777,245 @@ def chain_requires_prompt_satisfaction(chain: str) -> bool:
     return parsed is not None and parsed[1] == 0
 
 
-def compute_stability(
-    records: Iterable[IterationRecord],
-    required_streak: int,
-    depth: int,
-    require_chain_destabilization: bool = False,
-    min_destabilization_defects: int = 3,
-    min_destabilization_baseline_mean: float = 40.0,
-    max_destabilization_baseline_mean: float = 95.0,
-    min_recovery_iteration_gap: int = 1,
-    require_prompt_linkage: bool = False,
-    require_prompt_satisfaction: bool = True,
-) -> StabilityResult:
-    expected_chains = build_expected_chains(depth)
-    if not expected_chains:
-        return StabilityResult(
-            records=list(records),
-            streak=required_streak,
-            required_streak=required_streak,
-            depth=depth,
-            expected_chains=[],
-            chain_destabilized={},
-            require_chain_destabilization=require_chain_destabilization,
-            chain_recovered={},
-            chain_prompt_satisfied={},
-            min_destabilization_defects=min_destabilization_defects,
-            min_destabilization_baseline_mean=min_destabilization_baseline_mean,
-            max_destabilization_baseline_mean=max_destabilization_baseline_mean,
-            min_recovery_iteration_gap=min_recovery_iteration_gap,
-            require_prompt_linkage=require_prompt_linkage,
-            require_prompt_satisfaction=require_prompt_satisfaction,
-            system_phase="stabilized_readout",
-            next_chain=None,
-            stable=True,
-            rationale="Depth < 1 implies no adjacency chains; stability is trivially satisfied.",
-        )
+@dataclasses.dataclass
+class StabilityFold:
+    """State compute_stability carries from one iteration record to the next.
 
-    streak = 0
-    ordered = list(records)
-    next_index = 0
-    chain_destabilized: dict[str, bool] = {chain: False for chain in expected_chains}
-    chain_recovered: dict[str, bool] = {chain: False for chain in expected_chains}
-    chain_upper_by_chain: dict[str, int] = {
-        chain: parsed[0]
-        for chain in expected_chains
-        for parsed in [parse_chain(chain)]
-        if parsed is not None
-    }
-    prompt_required_by_chain: dict[str, bool] = {
-        chain: require_prompt_satisfaction and chain_requires_prompt_satisfaction(chain)
-        for chain in expected_chains
-    }
-    chain_prompt_satisfied: dict[str, bool] = {
+    Persisted as STABILITY_FOLD.json next to STABILITY_STATUS.json so newly
+    appended records advance it without replaying the whole history.
+    """
+
+    expected_chains: list[str]
+    require_chain_destabilization: bool
+    min_destabilization_defects: int
+    min_destabilization_baseline_mean: float
+    max_destabilization_baseline_mean: float
+    min_recovery_iteration_gap: int
+    require_prompt_linkage: bool
+    require_prompt_satisfaction: bool
+    streak: int = 0
+    next_index: int = 0
+    chain_destabilized: dict[str, bool] = dataclasses.field(default_factory=dict)
+    chain_recovered: dict[str, bool] = dataclasses.field(default_factory=dict)
+    chain_prompt_satisfied: dict[str, bool] = dataclasses.field(default_factory=dict)
+    chain_first_destabilization_iter: dict[str, int] = dataclasses.field(default_factory=dict)
+    folded_count: int = 0
+    # Fingerprints of the last STABILITY_FOLD_TAIL folded records, in order.
+    folded_tail: list[str] = dataclasses.field(default_factory=list)
+
+    def config(self) -> dict[str, Any]:
+        return {
+            "expected_chains": self.expected_chains,
+            "require_chain_destabilization": self.require_chain_destabilization,
+            "min_destabilization_defects": self.min_destabilization_defects,
+            "min_destabilization_baseline_mean": self.min_destabilization_baseline_mean,
+            "max_destabilization_baseline_mean": self.max_destabilization_baseline_mean,
+            "min_recovery_iteration_gap": self.min_recovery_iteration_gap,
+            "require_prompt_linkage": self.require_prompt_linkage,
+            "require_prompt_satisfaction": self.require_prompt_satisfaction,
+        }
+
+    def chain_upper_by_chain(self) -> dict[str, int]:
+        return {
+            chain: parsed[0]
+            for chain in self.expected_chains
+            for parsed in [parse_chain(chain)]
+            if parsed is not None
+        }
+
+    def prompt_required_by_chain(self) -> dict[str, bool]:
+        return {
+            chain: self.require_prompt_satisfaction and chain_requires_prompt_satisfaction(chain)
+            for chain in self.expected_chains
+        }
+
+
+def new_stability_fold(
+    expected_chains: list[str],
+    *,
+    require_chain_destabilization: bool,
+    min_destabilization_defects: int,
+    min_destabilization_baseline_mean: float,
+    max_destabilization_baseline_mean: float,
+    min_recovery_iteration_gap: int,
+    require_prompt_linkage: bool,
+    require_prompt_satisfaction: bool,
+) -> StabilityFold:
+    fold = StabilityFold(
+        expected_chains=list(expected_chains),
+        require_chain_destabilization=require_chain_destabilization,
+        min_destabilization_defects=min_destabilization_defects,
+        min_destabilization_baseline_mean=min_destabilization_baseline_mean,
+        max_destabilization_baseline_mean=max_destabilization_baseline_mean,
+        min_recovery_iteration_gap=min_recovery_iteration_gap,
+        require_prompt_linkage=require_prompt_linkage,
+        require_prompt_satisfaction=require_prompt_satisfaction,
+    )
+    prompt_required_by_chain = fold.prompt_required_by_chain()
+    fold.chain_destabilized = {chain: False for chain in expected_chains}
+    fold.chain_recovered = {chain: False for chain in expected_chains}
+    fold.chain_prompt_satisfied = {
         chain: not prompt_required_by_chain[chain] for chain in expected_chains
     }
-    chain_first_destabilization_iter: dict[str, int] = {}
-
-    for record in ordered:
-        prompt_required = prompt_required_by_chain.get(
-            record.chain, require_prompt_satisfaction
+    return fold
+
+
+def record_fingerprint(record: IterationRecord) -> str:
+    return hashlib.sha256(repr(record).encode("utf-8")).hexdigest()[:16]
+
+
+def advance_stability_fold(fold: StabilityFold, record: IterationRecord) -> None:
+    """Fold one record into `fold` in O(chains)."""
+    expected_chains = fold.expected_chains
+    require_chain_destabilization = fold.require_chain_destabilization
+    require_prompt_satisfaction = fold.require_prompt_satisfaction
+    chain_destabilized = fold.chain_destabilized
+    chain_recovered = fold.chain_recovered
+    chain_prompt_satisfied = fold.chain_prompt_satisfied
+    chain_first_destabilization_iter = fold.chain_first_destabilization_iter
+    chain_upper_by_chain = fold.chain_upper_by_chain()
+    prompt_required_by_chain = fold.prompt_required_by_chain()
+    streak = fold.streak
+    next_index = fold.next_index
+
+    prompt_required = prompt_required_by_chain.get(
+        record.chain, require_prompt_satisfaction
+    )
+    prompt_ok_for_chain = record.prompt_satisfaction or not prompt_required
+
+    if require_chain_destabilization and record.chain in chain_destabilized:
+        nontrivial_destabilization = (
+            record.baseline_total_defects >= fold.min_destabilization_defects
+            and record.baseline_mean >= 0.0
+            and record.baseline_mean >= fold.min_destabilization_baseline_mean
+            and record.baseline_mean <= fold.max_destabilization_baseline_mean
+            and (not record.synthetic_iteration)
+            and record.real_delta_evidence
         )
-        prompt_ok_for_chain = record.prompt_satisfaction or not prompt_required
-
-        if require_chain_destabilization and record.chain in chain_destabilized:
+        if fold.require_prompt_linkage:
             nontrivial_destabilization = (
-                record.baseline_total_defects >= min_destabilization_defects
-                and record.baseline_mean >= 0.0
-                and record.baseline_mean >= min_destabilization_baseline_mean
-                and record.baseline_mean <= max_destabilization_baseline_mean
+                nontrivial_destabilization and record.prompt_linked_baseline
+            )
+        if nontrivial_destabilization:
+            chain_destabilized[record.chain] = True
+            if record.chain not in chain_first_destabilization_iter:
+                chain_first_destabilization_iter[record.chain] = record.iteration
+
+    quality_perfect = record.is_quality_perfect
+    if record.chain in chain_prompt_satisfied:
+        if prompt_required_by_chain.get(record.chain, False):
+            chain_prompt_satisfied[record.chain] = (
+                quality_perfect
+                and prompt_ok_for_chain
                 and (not record.synthetic_iteration)
                 and record.real_delta_evidence
             )
-            if require_prompt_linkage:
-                nontrivial_destabilization = (
-                    nontrivial_destabilization and record.prompt_linked_baseline
-                )
-            if nontrivial_destabilization:
-                chain_destabilized[record.chain] = True
-                if record.chain not in chain_first_destabilization_iter:
-                    chain_first_destabilization_iter[record.chain] = record.iteration
-
-        quality_perfect = record.is_quality_perfect
-        if record.chain in chain_prompt_satisfied:
-            if prompt_required_by_chain.get(record.chain, False):
-                chain_prompt_satisfied[record.chain] = (
-                    quality_perfect
-                    and prompt_ok_for_chain
-                    and (not record.synthetic_iteration)
-                    and record.real_delta_evidence
-                )
+        else:
+            chain_prompt_satisfied[record.chain] = True
+
+    eligible_perfect = (
+        quality_perfect
+        and record.identity_lock
+        and (not record.synthetic_iteration)
+        and record.real_delta_evidence
+        and prompt_ok_for_chain
+    )
+    if require_chain_destabilization:
+        destabilized = chain_destabilized.get(record.chain, False)
+        first_iter = chain_first_destabilization_iter.get(record.chain, 10**9)
+        recoverable = destabilized and (
+            record.iteration >= first_iter + fold.min_recovery_iteration_gap
+        )
+        eligible_perfect = eligible_perfect and recoverable
+        if eligible_perfect:
+            chain_recovered[record.chain] = True
+
+    if not eligible_perfect:
+        streak = 0
+        next_index = 0
+    else:
+        expected_chain = expected_chains[next_index]
+        if record.chain == expected_chain:
+            next_index += 1
+            if next_index == len(expected_chains):
+                streak += 1
+                next_index = 0
+        # Out-of-order perfect record: only restart if it matches the first chain.
+        elif record.chain == expected_chains[0]:
+            streak = 0
+            if len(expected_chains) == 1:
+                streak = 1
+                next_index = 0
             else:
-                chain_prompt_satisfied[record.chain] = True
+                next_index = 1
+        # Orphan perfect record that does not fit the expected order.
+        else:
+            streak = 0
+            next_index = 0
 
-        eligible_perfect = (
-            quality_perfect
-            and record.identity_lock
-            and (not record.synthetic_iteration)
-            and record.real_delta_evidence
-            and prompt_ok_for_chain
-        )
-        if require_chain_destabilization:
-            destabilized = chain_destabilized.get(record.chain, False)
-            first_iter = chain_first_destabilization_iter.get(record.chain, 10**9)
-            recoverable = destabilized and (
-                record.iteration >= first_iter + min_recovery_iteration_gap
+    parsed_chain = parse_chain(record.chain)
+    finished_rubric_task = (
+        parsed_chain is not None
+        and record.decision.upper() in {"ACCEPT", "PROVISIONAL_ACCEPT"}
+        and (not record.synthetic_iteration)
+        and record.real_delta_evidence
+    )
+    if finished_rubric_task:
+        finished_upper = parsed_chain[0]
+        invalidated_any = False
+        has_downstream_chain = False
+        for chain, upper in chain_upper_by_chain.items():
+            # Dependency invalidation flows toward the prompt-facing side:
+            # when Rubric_k improves Rubric_(k-1), all chains with h < k
+            # must be recomputed against the updated lower-rubric context.
+            if upper >= finished_upper:
+                continue
+            has_downstream_chain = True
+            if (
+                chain_recovered.get(chain, False)
+                or (
+                    prompt_required_by_chain.get(chain, False)
+                    and chain_prompt_satisfied.get(chain, False)
+                )
+            ):
+                invalidated_any = True
+            # Preserve prior destabilization evidence across dependency
+            # invalidation. Re-invalidation should force downstream
+            # reconvergence, but it should not re-impose a synthetic
+            # "first-ever destabilization" gate on the same prompt run.
+            chain_recovered[chain] = False
+            chain_prompt_satisfied[chain] = not prompt_required_by_chain.get(
+                chain, False
             )
-            eligible_perfect = eligible_perfect and recoverable
-            if eligible_perfect:
-                chain_recovered[record.chain] = True
 
-        if not eligible_perfect:
+        # A completed rubric task invalidates downstream prompt-facing chains.
+        if invalidated_any or has_downstream_chain:
             streak = 0
             next_index = 0
-        else:
-            expected_chain = expected_chains[next_index]
-            if record.chain == expected_chain:
-                next_index += 1
-                if next_index == len(expected_chains):
-                    streak += 1
-                    next_index = 0
-            # Out-of-order perfect record: only restart if it matches the first chain.
-            elif record.chain == expected_chains[0]:
-                streak = 0
-                if len(expected_chains) == 1:
-                    streak = 1
-                    next_index = 0
-                else:
-                    next_index = 1
-            # Orphan perfect record that does not fit the expected order.
-            else:
-                streak = 0
-                next_index = 0
 
-        parsed_chain = parse_chain(record.chain)
-        finished_rubric_task = (
-            parsed_chain is not None
-            and record.decision.upper() in {"ACCEPT", "PROVISIONAL_ACCEPT"}
-            and (not record.synthetic_iteration)
-            and record.real_delta_evidence
-        )
-        if finished_rubric_task:
-            finished_upper = parsed_chain[0]
-            invalidated_any = False
-            has_downstream_chain = False
-            for chain, upper in chain_upper_by_chain.items():
-                # Dependency invalidation flows toward the prompt-facing side:
-                # when Rubric_k improves Rubric_(k-1), all chains with h < k
-                # must be recomputed against the updated lower-rubric context.
-                if upper >= finished_upper:
-                    continue
-                has_downstream_chain = True
-                if (
-                    chain_recovered.get(chain, False)
-                    or (
-                        prompt_required_by_chain.get(chain, False)
-                        and chain_prompt_satisfied.get(chain, False)
-                    )
-                ):
-                    invalidated_any = True
-                # Preserve prior destabilization evidence across dependency
-                # invalidation. Re-invalidation should force downstream
-                # reconvergence, but it should not re-impose a synthetic
-                # "first-ever destabilization" gate on the same prompt run.
-                chain_recovered[chain] = False
-                chain_prompt_satisfied[chain] = not prompt_required_by_chain.get(
-                    chain, False
-                )
+    fold.streak = streak
+    fold.next_index = next_index
+    fold.folded_count += 1
+    fold.folded_tail.append(record_fingerprint(record))
+    del fold.folded_tail[:-STABILITY_FOLD_TAIL]
 
-            # A completed rubric task invalidates downstream prompt-facing chains.
-            if invalidated_any or has_downstream_chain:
-                streak = 0
-                next_index = 0
+
+def finish_stability(
+    fold: StabilityFold,
+    records: list[IterationRecord],
+    required_streak: int,
+    depth: int,
+) -> StabilityResult:
+    expected_chains = fold.expected_chains
+    require_chain_destabilization = fold.require_chain_destabilization
+    require_prompt_satisfaction = fold.require_prompt_satisfaction
+    chain_destabilized = dict(fold.chain_destabilized)
+    chain_recovered = dict(fold.chain_recovered)
+    chain_prompt_satisfied = dict(fold.chain_prompt_satisfied)
+    prompt_required_by_chain = fold.prompt_required_by_chain()
+    streak = fold.streak
+    next_index = fold.next_index
+    ordered = records
 
     all_chains_destabilized = (
         all(chain_destabilized.values()) if require_chain_destabilization else True
@@ -3873,30 +5095,205 @@ def compute_stability(
                 f"required_streak={required_streak}, next_chain={next_chain}."
             )
 
-    if not ordered and not stable:
-        system_phase = "input_injection"
+    if not ordered and not stable:
+        system_phase = "input_injection"
+
+    return StabilityResult(
+        records=ordered,
+        streak=streak,
+        required_streak=required_streak,
+        depth=depth,
+        expected_chains=expected_chains,
+        chain_destabilized=chain_destabilized,
+        require_chain_destabilization=require_chain_destabilization,
+        chain_recovered=chain_recovered,
+        chain_prompt_satisfied=chain_prompt_satisfied,
+        min_destabilization_defects=fold.min_destabilization_defects,
+        min_destabilization_baseline_mean=fold.min_destabilization_baseline_mean,
+        max_destabilization_baseline_mean=fold.max_destabilization_baseline_mean,
+        min_recovery_iteration_gap=fold.min_recovery_iteration_gap,
+        require_prompt_linkage=fold.require_prompt_linkage,
+        require_prompt_satisfaction=require_prompt_satisfaction,
+        system_phase=system_phase,
+        next_chain=next_chain,
+        stable=stable,
+        rationale=rationale,
+    )
+
+
+@profiled("gate_evaluation")
+def compute_stability(
+    records: Iterable[IterationRecord],
+    required_streak: int,
+    depth: int,
+    require_chain_destabilization: bool = False,
+    min_destabilization_defects: int = 3,
+    min_destabilization_baseline_mean: float = 40.0,
+    max_destabilization_baseline_mean: float = 95.0,
+    min_recovery_iteration_gap: int = 1,
+    require_prompt_linkage: bool = False,
+    require_prompt_satisfaction: bool = True,
+) -> StabilityResult:
+    expected_chains = build_expected_chains(depth)
+    if not expected_chains:
+        return StabilityResult(
+            records=list(records),
+            streak=required_streak,
+            required_streak=required_streak,
+            depth=depth,
+            expected_chains=[],
+            chain_destabilized={},
+            require_chain_destabilization=require_chain_destabilization,
+            chain_recovered={},
+            chain_prompt_satisfied={},
+            min_destabilization_defects=min_destabilization_defects,
+            min_destabilization_baseline_mean=min_destabilization_baseline_mean,
+            max_destabilization_baseline_mean=max_destabilization_baseline_mean,
+            min_recovery_iteration_gap=min_recovery_iteration_gap,
+            require_prompt_linkage=require_prompt_linkage,
+            require_prompt_satisfaction=require_prompt_satisfaction,
+            system_phase="stabilized_readout",
+            next_chain=None,
+            stable=True,
+            rationale="Depth < 1 implies no adjacency chains; stability is trivially satisfied.",
+        )
+
+    ordered = list(records)
+    fold = new_stability_fold(
+        expected_chains,
+        require_chain_destabilization=require_chain_destabilization,
+        min_destabilization_defects=min_destabilization_defects,
+        min_destabilization_baseline_mean=min_destabilization_baseline_mean,
+        max_destabilization_baseline_mean=max_destabilization_baseline_mean,
+        min_recovery_iteration_gap=min_recovery_iteration_gap,
+        require_prompt_linkage=require_prompt_linkage,
+        require_prompt_satisfaction=require_prompt_satisfaction,
+    )
+    for record in ordered:
+        advance_stability_fold(fold, record)
+    return finish_stability(fold, ordered, required_streak, depth)
 
-    return StabilityResult(
-        records=ordered,
-        streak=streak,
-        required_streak=required_streak,
-        depth=depth,
-        expected_chains=expected_chains,
-        chain_destabilized=chain_destabilized,
+
+def stability_fold_mode(fold_mode: str | None = None) -> str:
+    mode = (fold_mode or os.environ.get(STABILITY_FOLD_ENV, "on")).strip().lower()
+    return mode if mode in STABILITY_FOLD_MODES else "on"
+
+
+def load_stability_fold(fold_path: Path) -> StabilityFold | None:
+    try:
+        data = json.loads(fold_path.read_text(encoding="utf-8"))
+    except (OSError, ValueError):
+        return None
+    if not isinstance(data, dict):
+        return None
+    if data.get("version") != STABILITY_FOLD_VERSION:
+        return None
+    if data.get("stabilizer_sha256") != stabilizer_source_hash():
+        return None
+    try:
+        return StabilityFold(**data["fold"])
+    except (KeyError, TypeError):
+        return None
+
+
+def store_stability_fold(fold_path: Path, fold: StabilityFold) -> None:
+    payload = {
+        "version": STABILITY_FOLD_VERSION,
+        "stabilizer_sha256": stabilizer_source_hash(),
+        "fold": dataclasses.asdict(fold),
+    }
+    tmp_path = fold_path.with_name(f"{fold_path.name}.{os.getpid()}.tmp")
+    try:
+        # Key order is significant: unmet-chain lists follow expected_chains order.
+        tmp_path.write_text(json.dumps(payload) + "\n", encoding="utf-8")
+        os.replace(tmp_path, fold_path)
+    except OSError:
+        try:
+            tmp_path.unlink()
+        except OSError:
+            pass
+
+
+@profiled("gate_evaluation")
+def compute_stability_incremental(
+    records: Iterable[IterationRecord],
+    required_streak: int,
+    depth: int,
+    *,
+    fold_path: Path,
+    fold_mode: str | None = None,
+    require_chain_destabilization: bool = False,
+    min_destabilization_defects: int = 3,
+    min_destabilization_baseline_mean: float = 40.0,
+    max_destabilization_baseline_mean: float = 95.0,
+    min_recovery_iteration_gap: int = 1,
+    require_prompt_linkage: bool = False,
+    require_prompt_satisfaction: bool = True,
+) -> StabilityResult:
+    """compute_stability that resumes from the fold persisted at `fold_path`.
+
+    The stored fold is reused when its settings match, `records` is at least as
+    long as what it folded, and the last STABILITY_FOLD_TAIL folded records are
+    unchanged; only the new suffix is folded, so an append costs O(chains)
+    rather than a pass over the whole history. Anything else (a rewritten tail,
+    removed records, new depth) rebuilds from scratch. A rewrite further back
+    than the tail goes unnoticed in `on` mode; `verify` also runs the full
+    replay and reports disagreements.
+    """
+    params = dict(
         require_chain_destabilization=require_chain_destabilization,
-        chain_recovered=chain_recovered,
-        chain_prompt_satisfied=chain_prompt_satisfied,
         min_destabilization_defects=min_destabilization_defects,
         min_destabilization_baseline_mean=min_destabilization_baseline_mean,
         max_destabilization_baseline_mean=max_destabilization_baseline_mean,
         min_recovery_iteration_gap=min_recovery_iteration_gap,
         require_prompt_linkage=require_prompt_linkage,
         require_prompt_satisfaction=require_prompt_satisfaction,
-        system_phase=system_phase,
-        next_chain=next_chain,
-        stable=stable,
-        rationale=rationale,
     )
+    ordered = list(records)
+    mode = stability_fold_mode(fold_mode)
+    expected_chains = build_expected_chains(depth)
+    if mode == "off" or not expected_chains:
+        return compute_stability(ordered, required_streak, depth, **params)
+
+    fresh = new_stability_fold(expected_chains, **params)
+    fold = load_stability_fold(fold_path)
+    if (
+        fold is None
+        or fold.config() != fresh.config()
+        or fold.folded_count > len(ordered)
+        or fold.folded_tail
+        != [
+            record_fingerprint(record)
+            for record in ordered[fold.folded_count - len(fold.folded_tail) : fold.folded_count]
+        ]
+    ):
+        fold = fresh
+    changed = fold is fresh or fold.folded_count != len(ordered)
+    for record in ordered[fold.folded_count:]:
+        advance_stability_fold(fold, record)
+
+    if mode == "verify":
+        replay = new_stability_fold(expected_chains, **params)
+        for record in ordered:
+            advance_stability_fold(replay, record)
+        if dataclasses.asdict(replay) != dataclasses.asdict(fold):
+            print(
+                "stability_fold_mismatch="
+                + json.dumps(
+                    {
+                        "fold_path": str(fold_path),
+                        "incremental": dataclasses.asdict(fold),
+                        "replay": dataclasses.asdict(replay),
+                    },
+                    sort_keys=True,
+                )
+            )
+            fold = replay
+            changed = True
+
+    if changed:
+        store_stability_fold(fold_path, fold)
+    return finish_stability(fold, ordered, required_streak, depth)
 
 
 def render_markdown(result: StabilityResult, iterations_dir: Path) -> str:
@@ -4071,6 +5468,8 @@ def render_json(result: StabilityResult, iterations_dir: Path) -> dict[str, obje
     }
 
 
+@traced("write_outputs")
+@profiled("rendering")
 def write_outputs(
     result: StabilityResult,
     iterations_dir: Path,
@@ -4098,6 +5497,7 @@ def resolve_depth(depth_arg: int, records: Iterable[IterationRecord], rubrics_di
     return infer_depth(rubrics_dir, records) if depth_arg == -1 else depth_arg
 
 
+@traced("evaluate_current_state")
 def evaluate_current_state(
     *,
     iterations_dir: Path,
@@ -4114,10 +5514,11 @@ def evaluate_current_state(
 ) -> StabilityResult:
     records = collect_records(iterations_dir)
     depth = resolve_depth(depth_arg, records, rubrics_dir)
-    return compute_stability(
+    return compute_stability_incremental(
         records,
         required_streak,
         depth,
+        fold_path=iterations_dir.parent / STABILITY_FOLD_FILE,
         require_chain_destabilization=require_chain_destabilization,
         min_destabilization_defects=min_destabilization_defects,
         min_destabilization_baseline_mean=min_destabilization_baseline_mean,
@@ -5438,6 +6839,113 @@ def synthesize_iteration_artifacts(
     )
 
 
+def iteration_phase_files(
+    project_root: Path, iteration_root: Path, iteration_label: str, lower: int
+) -> dict[str, tuple[Path, ...]]:
+    return {
+        "judge_baseline": (
+            iteration_root / "SNAPSHOT.md",
+            iteration_root / "judge_baseline" / "PRIORITIZED_DEFECTS.md",
+        ),
+        "author_deltas": (
+            iteration_root / "author_deltas" / "DEFECT_BURNDOWN_CHECK.md",
+            project_root / f"rubrics/Rubric_{lower}/iteration_{iteration_label}.json",
+            project_root / f"scorecards/Rubric_{lower}_grid_iteration_{iteration_label}.md",
+            project_root / f"collateral/Rubric_{lower}/manifest_iteration_{iteration_label}.md",
+            project_root / f"collateral/Rubric_{lower}/access_log_iteration_{iteration_label}.md",
+            project_root / f"evidence/iteration_{iteration_label}.md",
+            project_root / f"deltas/iteration_{iteration_label}.md",
+            project_root / f"contradictions/iteration_{iteration_label}.md",
+        ),
+        "judge_recheck": (
+            iteration_root / "judge_recheck" / "PRIORITIZED_DEFECTS.md",
+            iteration_root / "judge_recheck" / "FINAL_DECISION.md",
+            iteration_root / "judge_recheck" / "OBJECTIVE_COUNTEREXAMPLES.md",
+            iteration_root / "judge_recheck" / "FRONTIER_STATUS.md",
+            iteration_root / "judge_recheck" / "DISCRIMINATION_CHECK.md",
+        ),
+    }
+
+
+def phase_file_complete(path: Path) -> bool:
+    if not is_nonempty_file(path):
+        return False
+    text = read_text_safe(path)
+    return not (
+        looks_synthetic_text(text)
+        or contains_forbidden_placeholder_token(text)
+        or PHASE_STUB_RE.search(text)
+    )
+
+
+def completed_iteration_phases(
+    project_root: Path, iteration_root: Path, iteration_label: str, lower: int
+) -> tuple[str, ...]:
+    """Leading phases whose files are all finalized (no bootstrap stubs or markers)."""
+    files = iteration_phase_files(project_root, iteration_root, iteration_label, lower)
+    done: list[str] = []
+    for phase in ITERATION_PHASES:
+        if not all(phase_file_complete(path) for path in files[phase]):
+            break
+        done.append(phase)
+    return tuple(done)
+
+
+def load_autonomous_attempt(iteration_root: Path) -> dict[str, Any] | None:
+    path = iteration_root / "_autonomous" / AUTONOMOUS_ATTEMPT_FILE
+    try:
+        data = json.loads(path.read_text(encoding="utf-8"))
+    except (OSError, ValueError):
+        return None
+    return data if isinstance(data, dict) else None
+
+
+def find_resumable_iteration(
+    project_root: Path, iterations_dir: Path, chain: str, lower: int
+) -> tuple[int, tuple[str, ...], dict[str, Any]] | None:
+    """Latest iteration if a supervisor-killed session of `chain` left some, not all, phases behind."""
+    iteration = next_iteration_number(iterations_dir) - 1
+    if iteration < 1:
+        return None
+    label = f"{iteration:03d}"
+    iteration_root = iterations_dir / f"iteration_{label}"
+    attempt = load_autonomous_attempt(iteration_root)
+    if attempt is None or attempt.get("chain") != chain or attempt.get("rc") in (0, None):
+        return None
+    # Plain non-zero codex exits and iterations that already resolved (or were
+    # merged from a worker) start fresh.
+    if not attempt.get("terminated_by_supervisor") or attempt.get("finalized"):
+        return None
+    phases = completed_iteration_phases(project_root, iteration_root, label, lower)
+    if not phases or len(phases) >= len(ITERATION_PHASES):
+        return None
+    return iteration, phases, attempt
+
+
+def build_continuation_block(iteration_dir: str, completed_phases: tuple[str, ...]) -> str:
+    descriptions = {
+        "judge_baseline": "snapshot and baseline judging (`SNAPSHOT.md`, `judge_baseline/PRIORITIZED_DEFECTS.md`)",
+        "author_deltas": (
+            "author remediation (`author_deltas/DEFECT_BURNDOWN_CHECK.md`, target rubric JSON, "
+            "scorecard, collateral manifest/access log, evidence, deltas, contradictions)"
+        ),
+        "judge_recheck": "independent recheck (`judge_recheck/*.md`)",
+    }
+    remaining = [phase for phase in ITERATION_PHASES if phase not in completed_phases]
+    lines = [
+        "Continuation of an interrupted session (mandatory):",
+        f"- A previous codex session for `{iteration_dir}/` was terminated after finishing:",
+        *(f"  - `{phase}`: {descriptions[phase]}" for phase in completed_phases),
+        "- Do not redo finished phases. Treat their files as fixed inputs and read only the parts the remaining work needs;",
+        "  rewrite one only to correct a factual error found by a remaining phase.",
+        "- Remaining work, in order: "
+        + ", ".join(f"`{phase}`" for phase in remaining + ["final_decision"])
+        + " (`judge_recheck/FINAL_DECISION.md`, `STATUS.md`, `SCORE_DELTA.md`, liquid-state files and run-level outputs).",
+        "- Skip the initial snapshot and discovery reads; start writing the first remaining phase's files immediately.",
+    ]
+    return "\n".join(lines) + "\n"
+
+
 def build_autonomous_prompt(
     *,
     chain: str,
@@ -5450,6 +6958,7 @@ def build_autonomous_prompt(
     max_destabilization_baseline_mean: float,
     min_recovery_iteration_gap: int,
     require_prompt_linkage: bool,
+    completed_phases: tuple[str, ...] = (),
 ) -> str:
     parsed = parse_chain(chain)
     if parsed is None:
@@ -5488,6 +6997,9 @@ def build_autonomous_prompt(
             - If no requirements were parsed from `prompt.txt`, treat this as a blocking defect and keep `decision: REJECT`.
             """
         ).strip() + "\n"
+    continuation_block = (
+        build_continuation_block(iteration_dir, completed_phases) if completed_phases else ""
+    )
     destabilize_block = ""
     if force_chain_destabilization:
         prompt_link_line = (
@@ -5527,6 +7039,7 @@ def build_autonomous_prompt(
         - judging_authority: `Rubric_{upper}`
         - prompt_source: `prompt.txt` (must be consumed for prompt-linked scoring)
         {requirement_catalog_block}
+        {continuation_block}
 
         Required workflow (non-optional):
         1. Follow `AGENTS.md` canonical order for this iteration:
@@ -5773,11 +7286,13 @@ def snapshot_run_level_outputs_for_iteration(iteration_root: Path, run_root: Pat
         dst = iteration_root / name
         try:
             text = src.read_text(encoding="utf-8", errors="ignore")
+            FILE_READ_CACHE.invalidate(dst)
             dst.write_text(text, encoding="utf-8")
         except OSError:
             continue
 
 
+@traced("run_autonomous_iteration")
 def run_autonomous_iteration(
     *,
     codex_bin: str,
@@ -5795,12 +7310,30 @@ def run_autonomous_iteration(
     max_destabilization_baseline_mean: float,
     min_recovery_iteration_gap: int,
     require_prompt_linkage: bool,
+    watch_backend: str = "auto",
+    resume_partial: bool = False,
 ) -> tuple[int, int]:
     iteration = next_iteration_number(iterations_dir)
     parsed = parse_chain(chain)
     if parsed is None:
         raise ValueError(f"invalid chain for autonomous execution: {chain}")
     _, lower = parsed
+    completed_phases: tuple[str, ...] = ()
+    attempt_number = 1
+    resumable = (
+        find_resumable_iteration(project_root, iterations_dir, chain, lower)
+        if resume_partial
+        else None
+    )
+    if resumable is not None:
+        iteration, completed_phases, previous_attempt = resumable
+        attempt_number = int(previous_attempt.get("attempt", 1) or 1) + 1
+        print(
+            "autonomous_resume="
+            f"iteration_{iteration:03d} chain='{chain}' attempt={attempt_number} "
+            f"previous_rc={previous_attempt.get('rc')} "
+            f"completed_phases={','.join(completed_phases)}"
+        )
     prompt = build_autonomous_prompt(
         chain=chain,
         iteration=iteration,
@@ -5812,6 +7345,7 @@ def run_autonomous_iteration(
         max_destabilization_baseline_mean=max_destabilization_baseline_mean,
         min_recovery_iteration_gap=min_recovery_iteration_gap,
         require_prompt_linkage=require_prompt_linkage,
+        completed_phases=completed_phases,
     )
     iteration_label = f"{iteration:03d}"
     bootstrap_iteration_scaffold(
@@ -5828,6 +7362,18 @@ def run_autonomous_iteration(
     stderr_path = run_dir / "codex.stderr.log"
     last_message_path = run_dir / "LAST_MESSAGE.txt"
     iteration_root = iterations_dir / f"iteration_{iteration_label}"
+    if completed_phases:
+        # Keep the terminated session's logs next to the continuation's.
+        previous = attempt_number - 1
+        for log_path in (stdout_path, stderr_path):
+            if log_path.exists():
+                os.replace(
+                    log_path,
+                    run_dir / log_path.name.replace("codex.", f"codex.attempt_{previous:02d}.", 1),
+                )
+        # Files are rewritten in place; bump the directory mtime so callers that
+        # detect new-or-updated iteration directories see the resumed one.
+        os.utime(iteration_root)
     iteration_start_epoch = time.time()
     prompt_primary_refs = (
         infer_prompt_primary_artifact_refs(project_root / "prompt.txt")
@@ -5835,7 +7381,11 @@ def run_autonomous_iteration(
         else ()
     )
     primary_runtime_payload: dict[str, object] | None = None
-    if prompt_primary_refs:
+    previous_runtime = load_primary_artifact_runtime(iteration_root) if completed_phases else None
+    if prompt_primary_refs and isinstance(previous_runtime, dict) and previous_runtime.get("before"):
+        # Primary-artifact deltas span every session of the iteration.
+        primary_runtime_payload = previous_runtime
+    elif prompt_primary_refs:
         before_snapshot = build_primary_artifact_snapshot(project_root, prompt_primary_refs)
         primary_runtime_payload = {
             "schema_version": "rbd.primary_artifact_runtime.v1",
@@ -5912,163 +7462,24 @@ def run_autonomous_iteration(
                 return False
         return True
 
-    def latest_artifact_mtime() -> float:
-        watch_roots = [
-            iteration_root,
-            project_root / f"rubrics/Rubric_{lower}",
-            project_root / "scorecards",
-            project_root / f"collateral/Rubric_{lower}",
-            project_root / "evidence",
-            project_root / "deltas",
-            project_root / "contradictions",
-            project_root,
-        ]
-        latest = 0.0
-        for root in watch_roots:
-            if not root.exists():
-                continue
-            if root.is_file():
-                try:
-                    latest = max(latest, root.stat().st_mtime)
-                except OSError:
-                    pass
-                continue
-            try:
-                iterator = root.rglob("*")
-            except OSError:
-                continue
-            for child in iterator:
-                if not child.is_file():
-                    continue
-                if "_autonomous" in child.parts:
-                    continue
-                try:
-                    latest = max(latest, child.stat().st_mtime)
-                except OSError:
-                    continue
-        return latest
-
-    def parse_inline_shell_command(line: str) -> str:
-        marker = "-lc "
-        idx = line.find(marker)
-        if idx == -1:
-            return ""
-        tail = line[idx + len(marker):].strip()
-        if not tail:
-            return ""
-        if tail[0] in {"'", '"'}:
-            quote = tail[0]
-            end = tail.find(quote, 1)
-            if end != -1:
-                return tail[1:end].strip()
-        return tail
-
-    def check_command_policy_violations(log_chunk: str) -> str | None:
-        project_root_resolved = project_root.resolve()
-
-        def tokenized(command_text: str) -> list[str]:
-            try:
-                return shlex.split(command_text, posix=True)
-            except ValueError:
-                return command_text.split()
-
-        def strip_env_prefix(tokens: list[str]) -> list[str]:
-            idx = 0
-            while idx < len(tokens):
-                tok = tokens[idx]
-                if re.match(r"^[A-Za-z_][A-Za-z0-9_]*=", tok):
-                    idx += 1
-                    continue
-                break
-            return tokens[idx:]
-
-        def normalized(tok: str) -> str:
-            value = tok.strip().lower()
-            while value.startswith("./"):
-                value = value[2:]
-            return value
-
-        def invokes_recursive_orchestrator(command_text: str) -> bool:
-            tokens = strip_env_prefix(tokenized(command_text))
-            if not tokens:
-                return False
-            head = normalized(tokens[0])
-            script_heads = {
-                "rdd",
-                "rdd.sh",
-                "scripts/rdd.sh",
-                "rbd_autonomous.sh",
-                "scripts/rbd_autonomous.sh",
-            }
-            if head in script_heads:
-                return True
-            if head in {"bash", "sh"} and len(tokens) >= 2:
-                script = normalized(tokens[1])
-                if script in script_heads:
-                    return True
-            if head in {"python", "python3"}:
-                script_token = ""
-                for tok in tokens[1:]:
-                    low = normalized(tok)
-                    if low.endswith(".py"):
-                        script_token = low
-                        break
-                if script_token.endswith(("rbd_parallel_links.py", "rbd_autonomous.py")):
-                    return True
-                if script_token.endswith("rbd_stabilize.py"):
-                    tail = " ".join(tokens[2:]).lower()
-                    if "--request-stability" in tail or "--run-chain-once" in tail:
-                        return True
-            return False
-
-        def has_scope_escape(command_text: str) -> bool:
-            tokens = strip_env_prefix(tokenized(command_text))
-            for tok in tokens:
-                if ".." not in tok:
-                    continue
-                if tok.startswith("-"):
-                    continue
-                # Ignore obvious regex fragments and non-path tokens.
-                if any(ch in tok for ch in "*?[]{}|$`"):
-                    continue
-                if not re.search(r"[./\\]", tok):
-                    continue
-                candidate = Path(tok)
-                try:
-                    resolved = (
-                        candidate.resolve(strict=False)
-                        if candidate.is_absolute()
-                        else (project_root_resolved / candidate).resolve(strict=False)
-                    )
-                except OSError:
-                    return True
-                try:
-                    resolved.relative_to(project_root_resolved)
-                except ValueError:
-                    return True
-            return False
-
-        for raw in log_chunk.splitlines():
-            line = raw.strip()
-            if "-lc " not in line:
-                continue
-            command = parse_inline_shell_command(line)
-            if not command:
-                continue
-            lowered = command.lower()
-
-            if re.search(r"\bgit\s+(status|diff|log|show|rev-parse|branch)\b", lowered):
-                return "forbidden git command detected"
-
-            if invokes_recursive_orchestrator(command):
-                return "forbidden recursive orchestrator command detected"
-
-            if ("rbd_stabilize.py" in lowered) and ("--request-stability" in lowered):
-                return "forbidden recursive stability request detected"
-
-            if has_scope_escape(command):
-                return "forbidden scope-escape path (`../`) detected in command"
-        return None
+    watch_roots = [
+        iteration_root,
+        project_root / f"rubrics/Rubric_{lower}",
+        project_root / "scorecards",
+        project_root / f"collateral/Rubric_{lower}",
+        project_root / "evidence",
+        project_root / "deltas",
+        project_root / "contradictions",
+        project_root,
+    ]
+    project_root_resolved_for_watch = project_root.resolve()
+    # Nested roots are covered by the recursive project-root watch.
+    distinct_watch_roots = [
+        root
+        for root in watch_roots
+        if root == project_root
+        or not str(root.resolve()).startswith(str(project_root_resolved_for_watch) + os.sep)
+    ]
 
     cmd = [
         codex_bin,
@@ -6097,9 +7508,15 @@ def run_autonomous_iteration(
             f"force_chain_destabilization={'yes' if force_chain_destabilization else 'no'}"
         )
     )
-    with stdout_path.open("w", encoding="utf-8") as stdout_file, stderr_path.open(
-        "w", encoding="utf-8"
-    ) as stderr_file:
+    # Messages of supervisor-initiated kills; only those sessions are resumable.
+    supervisor_terminations: list[str] = []
+    with tracer().span("codex_session", chain=chain), profiler().phase(
+        "codex_supervision"
+    ), stdout_path.open("wb") as stdout_file, stderr_path.open("wb") as stderr_file:
+        # Before launching codex: an explicit --watch-backend inotify that is
+        # unavailable exits here instead of orphaning a running session.
+        watcher = open_artifact_watcher(distinct_watch_roots, watch_backend)
+        print(f"autonomous_watch_backend={watcher.backend}")
         popen_env = os.environ.copy()
         popen_env["GIT_CEILING_DIRECTORIES"] = str(project_root)
         popen_env["GIT_DISCOVERY_ACROSS_FILESYSTEM"] = "0"
@@ -6113,15 +7530,24 @@ def run_autonomous_iteration(
             text=True,
             cwd=project_root,
             env=popen_env,
-            stdout=stdout_file,
-            stderr=stderr_file,
+            stdout=subprocess.PIPE,
+            stderr=subprocess.PIPE,
             start_new_session=True,
             preexec_fn=preexec_fn,
         )
+        assert proc.stdout is not None and proc.stderr is not None
+        stream_monitor = CodexStreamMonitor(
+            proc.stdout,
+            proc.stderr,
+            stdout_file,
+            stderr_file,
+            CommandPolicyMatcher(project_root),
+        ).start()
 
         def terminate_process(message: str) -> int:
-            stderr_file.write(message + "\n")
-            stderr_file.flush()
+            supervisor_terminations.append(message)
+            stream_monitor.write_note(message)
+            print(message, flush=True)
             try:
                 pgid = os.getpgid(proc.pid)
             except ProcessLookupError:
@@ -6144,16 +7570,16 @@ def run_autonomous_iteration(
             try:
                 proc.wait(timeout=2)
             except subprocess.TimeoutExpired:
-                stderr_file.write(
-                    "[autonomous-stability] process did not fully exit after SIGKILL window\n"
+                stream_monitor.write_note(
+                    "[autonomous-stability] process did not fully exit after SIGKILL window"
                 )
-                stderr_file.flush()
             return 124
 
         start_monotonic = time.monotonic()
         last_progress_monotonic = start_monotonic
         last_activity_monotonic = start_monotonic
-        latest_seen_mtime = latest_artifact_mtime()
+        latest_seen_mtime = watcher.latest_mtime()
+        terminal_complete = False
         terminal_seen_monotonic: float | None = None
         completion_grace_seconds = 15.0
         if codex_no_progress_seconds > 0:
@@ -6165,7 +7591,6 @@ def run_autonomous_iteration(
                 min(480.0, codex_no_progress_seconds / 2.0),
             )
         rc = 0
-        stderr_scan_offset = 0
         signal_termination_note: list[str] = []
         previous_signal_handlers: dict[signal.Signals, object] = {}
 
@@ -6204,27 +7629,21 @@ def run_autonomous_iteration(
                     break
 
                 now = time.monotonic()
-                latest_mtime = latest_artifact_mtime()
+                latest_mtime = watcher.latest_mtime()
                 if latest_mtime > latest_seen_mtime + 1e-6:
                     latest_seen_mtime = latest_mtime
                     last_progress_monotonic = now
                     last_activity_monotonic = now
 
-                try:
-                    with stderr_path.open("r", encoding="utf-8", errors="ignore") as stderr_reader:
-                        stderr_reader.seek(stderr_scan_offset)
-                        new_chunk = stderr_reader.read()
-                        stderr_scan_offset = stderr_reader.tell()
-                except OSError:
-                    new_chunk = ""
-                if new_chunk:
-                    last_activity_monotonic = now
-                violation = check_command_policy_violations(new_chunk)
+                last_activity_monotonic = max(last_activity_monotonic, stream_monitor.last_activity)
+                violation = stream_monitor.poll_violation()
                 if violation is not None:
                     rc = terminate_process(f"[autonomous-stability] policy violation: {violation}")
                     break
 
-                if iteration_artifacts_terminally_complete():
+                if watcher.take_changes():
+                    terminal_complete = iteration_artifacts_terminally_complete()
+                if terminal_complete:
                     if terminal_seen_monotonic is None:
                         terminal_seen_monotonic = now
                     elif (now - terminal_seen_monotonic) >= completion_grace_seconds:
@@ -6262,7 +7681,7 @@ def run_autonomous_iteration(
                     )
                     break
 
-                time.sleep(1)
+                watcher.wait(1.0, wake_fds=(stream_monitor.wake_fd,))
         except KeyboardInterrupt:
             terminate_process("[autonomous-stability] interrupted by operator")
             raise
@@ -6272,6 +7691,8 @@ def run_autonomous_iteration(
             )
             raise
         finally:
+            stream_monitor.close()
+            watcher.close()
             for sig, handler in previous_signal_handlers.items():
                 try:
                     signal.signal(sig, handler)
@@ -6308,6 +7729,31 @@ def run_autonomous_iteration(
             f"iteration_{iteration_label} chain='{chain}' "
             "reason=artifact_quality_mismatch_or_identity_mismatch"
         )
+    try:
+        (run_dir / AUTONOMOUS_ATTEMPT_FILE).write_text(
+            json.dumps(
+                {
+                    "chain": chain,
+                    "rc": rc,
+                    "attempt": attempt_number,
+                    "terminated_by_supervisor": rc != 0 and bool(supervisor_terminations),
+                    "termination": supervisor_terminations[-1] if supervisor_terminations else None,
+                    # A written final decision means the iteration is finished; never resume it.
+                    "finalized": phase_file_complete(
+                        iteration_root / "judge_recheck" / "FINAL_DECISION.md"
+                    ),
+                    "resumed_phases": list(completed_phases),
+                    "completed_phases": list(
+                        completed_iteration_phases(project_root, iteration_root, iteration_label, lower)
+                    ),
+                },
+                indent=2,
+            )
+            + "\n",
+            encoding="utf-8",
+        )
+    except OSError:
+        pass
     print(f"autonomous_exec_rc={rc} logs={run_dir}")
     return rc, iteration
 
@@ -6346,6 +7792,7 @@ def request_stability(args: argparse.Namespace) -> int:
             require_prompt_satisfaction=args.require_prompt_satisfaction,
         )
         write_outputs(result, iterations_dir, output_md, json_output)
+        print("read_cache=" + json.dumps(FILE_READ_CACHE.stats()))
         if result.stable:
             print("stability=achieved")
             return 0
@@ -6380,6 +7827,8 @@ def request_stability(args: argparse.Namespace) -> int:
             max_destabilization_baseline_mean=args.max_destabilization_baseline_mean,
             min_recovery_iteration_gap=args.min_recovery_iteration_gap,
             require_prompt_linkage=args.require_prompt_linkage,
+            watch_backend=getattr(args, "watch_backend", "auto"),
+            resume_partial=getattr(args, "resume_partial_iteration", "off") == "auto",
         )
         attempts += 1
         produced_dir = iterations_dir / f"iteration_{iteration_number:03d}"
@@ -6499,6 +7948,8 @@ def run_chain_once(args: argparse.Namespace) -> int:
         max_destabilization_baseline_mean=args.max_destabilization_baseline_mean,
         min_recovery_iteration_gap=args.min_recovery_iteration_gap,
         require_prompt_linkage=args.require_prompt_linkage,
+        watch_backend=getattr(args, "watch_backend", "auto"),
+        resume_partial=getattr(args, "resume_partial_iteration", "off") == "auto",
     )
 
     produced_dir = iterations_dir / f"iteration_{iteration_number:03d}"
@@ -6579,6 +8030,29 @@ def _main_impl() -> int:
             "--codex-reasoning-effort must be one of: "
             + ", ".join(sorted(valid_efforts))
         )
+    if args.watch_backend not in WATCH_BACKENDS:
+        raise SystemExit("--watch-backend must be one of: " + ", ".join(WATCH_BACKENDS))
+    if args.record_cache not in RECORD_CACHE_MODES:
+        raise SystemExit("--record-cache must be one of: " + ", ".join(RECORD_CACHE_MODES))
+    os.environ[RECORD_CACHE_ENV] = args.record_cache
+    if args.stability_fold not in STABILITY_FOLD_MODES:
+        raise SystemExit(
+            "--stability-fold must be one of: " + ", ".join(STABILITY_FOLD_MODES)
+        )
+    os.environ[STABILITY_FOLD_ENV] = args.stability_fold
+    if args.read_cache not in READ_CACHE_MODES:
+        raise SystemExit("--read-cache must be one of: " + ", ".join(READ_CACHE_MODES))
+    if args.resume_partial_iteration not in RESUME_PARTIAL_MODES:
+        raise SystemExit(
+            "--resume-partial-iteration must be one of: " + ", ".join(RESUME_PARTIAL_MODES)
+        )
+    os.environ[READ_CACHE_ENV] = args.read_cache
+    if args.profile not in PROFILE_MODES:
+        raise SystemExit("--profile must be one of: " + ", ".join(PROFILE_MODES))
+    if args.profile_interval <= 0:
+        raise SystemExit("--profile-interval must be > 0")
+    if args.profile_top < 1:
+        raise SystemExit("--profile-top must be >= 1")
 
     if args.require_chain_destabilization:
         # Prompt-coupled destabilization is required by default in destabilization mode.
@@ -6590,42 +8064,75 @@ def _main_impl() -> int:
 
     project_root = Path(args.project_root)
 
-    if args.run_chain_once:
-        setattr(args, "require_prompt_satisfaction", require_prompt_satisfaction)
-        return run_chain_once(args)
-
-    if args.request_stability:
-        setattr(args, "require_prompt_satisfaction", require_prompt_satisfaction)
-        return request_stability(args)
+    if args.write_prompt_model:
+        prompt_path = project_root / "prompt.txt"
+        if not prompt_path.is_file():
+            raise SystemExit(f"prompt not found: {prompt_path}")
+        print(f"wrote {write_prompt_model(prompt_path)}")
+        return 0
 
-    iterations_arg = Path(args.iterations_dir)
-    iterations_dir = iterations_arg if iterations_arg.is_absolute() else (project_root / iterations_arg)
-    records = collect_records(iterations_dir)
-    depth = resolve_depth(args.depth, records, project_root / "rubrics")
-    result = compute_stability(
-        records,
-        args.required_streak,
-        depth,
-        require_chain_destabilization=args.require_chain_destabilization,
-        min_destabilization_defects=args.min_destabilization_defects,
-        min_destabilization_baseline_mean=args.min_destabilization_baseline_mean,
-        max_destabilization_baseline_mean=args.max_destabilization_baseline_mean,
-        min_recovery_iteration_gap=args.min_recovery_iteration_gap,
-        require_prompt_linkage=args.require_prompt_linkage,
-        require_prompt_satisfaction=require_prompt_satisfaction,
-    )
+    profile = None
+    if args.profile != "off":
+        profile = configure_profiler(args.profile, "stabilizer", interval=args.profile_interval)
+    try:
+        if args.run_chain_once or args.request_stability:
+            configure_from_env("stabilizer", project_root.resolve() / TRACES_DIR)
+
+        if args.run_chain_once:
+            setattr(args, "require_prompt_satisfaction", require_prompt_satisfaction)
+            with tracer().span("run_chain_once", chain=args.run_chain_once):
+                return run_chain_once(args)
+
+        if args.request_stability:
+            setattr(args, "require_prompt_satisfaction", require_prompt_satisfaction)
+            with tracer().span("request_stability"):
+                return request_stability(args)
+
+        iterations_arg = Path(args.iterations_dir)
+        iterations_dir = iterations_arg if iterations_arg.is_absolute() else (project_root / iterations_arg)
+        records = collect_records(iterations_dir)
+        depth = resolve_depth(args.depth, records, project_root / "rubrics")
+        result = compute_stability_incremental(
+            records,
+            args.required_streak,
+            depth,
+            fold_path=iterations_dir.parent / STABILITY_FOLD_FILE,
+            require_chain_destabilization=args.require_chain_destabilization,
+            min_destabilization_defects=args.min_destabilization_defects,
+            min_destabilization_baseline_mean=args.min_destabilization_baseline_mean,
+            max_destabilization_baseline_mean=args.max_destabilization_baseline_mean,
+            min_recovery_iteration_gap=args.min_recovery_iteration_gap,
+            require_prompt_linkage=args.require_prompt_linkage,
+            require_prompt_satisfaction=require_prompt_satisfaction,
+        )
 
-    output_arg = Path(args.output)
-    output_md = output_arg if output_arg.is_absolute() else (project_root / output_arg)
-    json_output: Path | None = None
-    if args.json_output:
-        json_arg = Path(args.json_output)
-        json_output = json_arg if json_arg.is_absolute() else (project_root / json_arg)
-    write_outputs(result, iterations_dir, output_md, json_output)
-    if args.fail_if_unstable and not result.stable:
-        return 2
-    return 0
+        output_arg = Path(args.output)
+        output_md = output_arg if output_arg.is_absolute() else (project_root / output_arg)
+        json_output: Path | None = None
+        if args.json_output:
+            json_arg = Path(args.json_output)
+            json_output = json_arg if json_arg.is_absolute() else (project_root / json_arg)
+        write_outputs(result, iterations_dir, output_md, json_output)
+        print("read_cache=" + json.dumps(FILE_READ_CACHE.stats()))
+        if args.fail_if_unstable and not result.stable:
+            return 2
+        return 0
 
+    finally:
+        if profile is not None:
+            profile.stop()
+            profiles_dir = project_root.resolve() / PROFILES_DIR
+            hotspots = profile.write(profiles_dir, args.profile_top)
+            print(
+                "profile_hotspots="
+                + json.dumps(
+                    {
+                        "mode": profile.mode,
+                        "dir": str(profiles_dir),
+                        "top": [f"{row['phase']}:{row['function']}" for row in hotspots[:5]],
+                    }
+                )
+            )
 
 def main() -> int:
     try:
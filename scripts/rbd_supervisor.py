@@ -0,0 +1,305 @@
+#!/usr/bin/env python3
+"""Asyncio process supervision over pipes for the orchestrator.
+
+`SupervisorLoop` runs one event loop on a daemon thread. Every worker thread
+hands its subprocess to that loop through `run()`, so all concurrent sessions
+share a single loop instead of one blocking `wait()` each. `supervise()` reads
+stdout and stderr through pipes in bounded chunks, tees the raw bytes to the
+log files and parses each complete line into a `StreamEvent` as it arrives:
+
+- `marker`: `key=value` status lines (`autonomous_exec_rc=0 ...`),
+- `note`: `[autonomous-stability] ...` supervisor notes,
+- `command`: codex `... -lc '<command>'` shell invocations.
+
+Cancellation, the optional deadline and the kill grace period are coroutines
+on the same loop.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import concurrent.futures
+import dataclasses
+import os
+import re
+import signal
+import threading
+import time
+from pathlib import Path
+from typing import Any, Callable, Coroutine
+
+READ_CHUNK_BYTES = 64 * 1024
+MAX_LINE_BYTES = 64 * 1024
+KILL_GRACE_SECONDS = 60.0
+MARKER_RE = re.compile(r"^([a-z][a-z0-9_]*)=(.*)$")
+NOTE_PREFIX = "[autonomous-stability] "
+INLINE_SHELL_MARKER = "-lc "
+
+
+@dataclasses.dataclass
+class StreamEvent:
+    kind: str
+    stream: str
+    key: str
+    value: str
+    at: float
+
+
+@dataclasses.dataclass
+class SupervisedResult:
+    rc: int
+    seconds: float
+    timed_out: bool = False
+    cancelled: bool = False
+    markers: dict[str, str] = dataclasses.field(default_factory=dict)
+    notes: list[str] = dataclasses.field(default_factory=list)
+    commands: int = 0
+    bytes_read: dict[str, int] = dataclasses.field(default_factory=dict)
+
+
+def parse_stream_line(stream: str, line: str) -> StreamEvent | None:
+    text = line.strip()
+    if not text:
+        return None
+    now = time.monotonic()
+    if text.startswith(NOTE_PREFIX):
+        return StreamEvent("note", stream, "", text[len(NOTE_PREFIX):], now)
+    idx = text.find(INLINE_SHELL_MARKER)
+    if idx != -1:
+        return StreamEvent("command", stream, "", text[idx + len(INLINE_SHELL_MARKER):].strip(), now)
+    match = MARKER_RE.match(text)
+    if match is not None:
+        return StreamEvent("marker", stream, match.group(1), match.group(2), now)
+    return None
+
+
+class SupervisedProcess:
+    """Thread-safe, Popen-like handle on a process owned by the supervisor loop."""
+
+    def __init__(self) -> None:
+        self.cancel_event = threading.Event()
+        self.pid: int | None = None
+        self.returncode: int | None = None
+        self._loop: asyncio.AbstractEventLoop | None = None
+        self._proc: asyncio.subprocess.Process | None = None
+        self._wakeup: asyncio.Event | None = None
+
+    def _attach(self, loop: asyncio.AbstractEventLoop, proc: asyncio.subprocess.Process) -> None:
+        self._loop = loop
+        self._proc = proc
+        self._wakeup = asyncio.Event()
+        self.pid = proc.pid
+        if self.cancel_event.is_set():
+            self._wakeup.set()
+
+    def poll(self) -> int | None:
+        return self.returncode
+
+    def _signal(self, sig: int) -> None:
+        proc = self._proc
+        if proc is None or proc.returncode is not None:
+            return
+        try:
+            proc.send_signal(sig)
+        except ProcessLookupError:
+            pass
+
+    def _call(self, fn: Callable[..., None], *args: Any) -> None:
+        loop = self._loop
+        if loop is None or loop.is_closed():
+            return
+        try:
+            loop.call_soon_threadsafe(fn, *args)
+        except RuntimeError:
+            pass
+
+    def terminate(self) -> None:
+        """Request cancellation: SIGTERM now, SIGKILL after the grace period."""
+        self.cancel_event.set()
+        if self._wakeup is not None:
+            self._call(self._wakeup.set)
+
+    def kill(self) -> None:
+        self.cancel_event.set()
+        self._call(self._signal, signal.SIGKILL)
+
+
+async def _pump(
+    reader: asyncio.StreamReader,
+    sink: Any,
+    stream: str,
+    result: SupervisedResult,
+    on_event: Callable[[StreamEvent], None] | None,
+) -> None:
+    partial = b""
+    discarding = False
+    total = 0
+    while True:
+        data = await reader.read(READ_CHUNK_BYTES)
+        if not data:
+            break
+        total += len(data)
+        sink.write(data)
+        sink.flush()
+        parts = (partial + data).split(b"\n")
+        partial = parts.pop()
+        lines: list[bytes] = []
+        for part in parts:
+            if discarding:
+                discarding = False
+                continue
+            lines.append(part)
+        if len(partial) > MAX_LINE_BYTES:
+            if not discarding:
+                lines.append(partial[:MAX_LINE_BYTES])
+            discarding = True
+            partial = b""
+        for raw in lines:
+            _record(stream, raw, result, on_event)
+    if partial and not discarding:
+        _record(stream, partial, result, on_event)
+    result.bytes_read[stream] = total
+
+
+def _record(
+    stream: str,
+    raw: bytes,
+    result: SupervisedResult,
+    on_event: Callable[[StreamEvent], None] | None,
+) -> None:
+    event = parse_stream_line(stream, raw.decode("utf-8", errors="ignore"))
+    if event is None:
+        return
+    if event.kind == "marker":
+        result.markers[event.key] = event.value
+    elif event.kind == "note":
+        result.notes.append(event.value)
+    elif event.kind == "command":
+        result.commands += 1
+    if on_event is not None:
+        on_event(event)
+
+
+async def supervise(
+    cmd: list[str],
+    *,
+    cwd: Path,
+    stdout_log: Path,
+    stderr_log: Path,
+    handle: SupervisedProcess | None = None,
+    env: dict[str, str] | None = None,
+    timeout_seconds: float = 0.0,
+    kill_grace_seconds: float = KILL_GRACE_SECONDS,
+    on_event: Callable[[StreamEvent], None] | None = None,
+) -> SupervisedResult:
+    """Run `cmd` to completion, teeing both pipes to the logs."""
+    handle = handle or SupervisedProcess()
+    start = time.monotonic()
+    result = SupervisedResult(rc=-1, seconds=0.0)
+    with stdout_log.open("wb") as out_f, stderr_log.open("wb") as err_f:
+        proc = await asyncio.create_subprocess_exec(
+            *cmd,
+            cwd=str(cwd),
+            env=env,
+            stdin=asyncio.subprocess.DEVNULL,
+            stdout=asyncio.subprocess.PIPE,
+            stderr=asyncio.subprocess.PIPE,
+            limit=READ_CHUNK_BYTES,
+        )
+        handle._attach(asyncio.get_running_loop(), proc)
+        assert proc.stdout is not None and proc.stderr is not None
+        pumps = asyncio.gather(
+            _pump(proc.stdout, out_f, "stdout", result, on_event),
+            _pump(proc.stderr, err_f, "stderr", result, on_event),
+        )
+        waiter = asyncio.ensure_future(proc.wait())
+        assert handle._wakeup is not None
+        wakeup = asyncio.ensure_future(handle._wakeup.wait())
+        deadline = timeout_seconds if timeout_seconds > 0 else None
+        try:
+            done, _ = await asyncio.wait(
+                {waiter, wakeup}, timeout=deadline, return_when=asyncio.FIRST_COMPLETED
+            )
+            if waiter not in done:
+                result.timed_out = wakeup not in done
+                result.cancelled = not result.timed_out
+                handle._signal(signal.SIGTERM)
+                try:
+                    await asyncio.wait_for(asyncio.shield(waiter), timeout=kill_grace_seconds)
+                except asyncio.TimeoutError:
+                    handle._signal(signal.SIGKILL)
+            await waiter
+            # Drain what the child wrote before exiting; a grandchild still
+            # holding the pipes open must not keep the worker alive.
+            try:
+                await asyncio.wait_for(asyncio.shield(pumps), timeout=kill_grace_seconds)
+            except asyncio.TimeoutError:
+                pumps.cancel()
+        finally:
+            wakeup.cancel()
+            if not waiter.done():
+                handle._signal(signal.SIGKILL)
+                waiter.cancel()
+    result.rc = 124 if result.timed_out else int(proc.returncode if proc.returncode is not None else -1)
+    handle.returncode = result.rc
+    result.seconds = round(time.monotonic() - start, 3)
+    return result
+
+
+class SupervisorLoop:
+    """One asyncio event loop on a daemon thread, shared by all worker threads."""
+
+    def __init__(self) -> None:
+        self._lock = threading.Lock()
+        self._loop: asyncio.AbstractEventLoop | None = None
+        self._thread: threading.Thread | None = None
+
+    def _ensure_loop(self) -> asyncio.AbstractEventLoop:
+        with self._lock:
+            if self._loop is None:
+                loop = asyncio.new_event_loop()
+                ready = threading.Event()
+
+                def _run() -> None:
+                    asyncio.set_event_loop(loop)
+                    loop.call_soon(ready.set)
+                    loop.run_forever()
+
+                self._thread = threading.Thread(target=_run, name="rbd-supervisor", daemon=True)
+                self._thread.start()
+                ready.wait()
+                self._loop = loop
+            return self._loop
+
+    def submit(self, coro: Coroutine[Any, Any, Any]) -> concurrent.futures.Future[Any]:
+        return asyncio.run_coroutine_threadsafe(coro, self._ensure_loop())
+
+    def run(self, coro: Coroutine[Any, Any, Any]) -> Any:
+        """Run `coro` on the shared loop and block the calling thread for its result."""
+        return self.submit(coro).result()
+
+    def close(self) -> None:
+        with self._lock:
+            loop, thread = self._loop, self._thread
+            self._loop = self._thread = None
+        if loop is None:
+            return
+        loop.call_soon_threadsafe(loop.stop)
+        if thread is not None:
+            thread.join(timeout=5.0)
+        if not loop.is_running():
+            loop.close()
+
+
+_SHARED_LOOP = SupervisorLoop()
+
+
+def shared_loop() -> SupervisorLoop:
+    return _SHARED_LOOP
+
+
+def unbuffered_env(base: dict[str, str] | None = None) -> dict[str, str]:
+    """Environment that keeps a Python child's status lines flowing through pipes."""
+    env = dict(os.environ if base is None else base)
+    env["PYTHONUNBUFFERED"] = "1"
+    return env
@@ -0,0 +1,235 @@
+#!/usr/bin/env python3
+"""Lightweight span tracing to `<run>/traces/<service>-<pid>.jsonl`.
+
+Each finished span is one JSON line: trace/span/parent ids, name, service,
+pid, thread, wall-clock start/end, duration and attributes. `chain` and
+`epoch` are inherited from the parent span. A process hands its trace
+context to a subprocess through `RBD_TRACE_CONTEXT`, so the stabilizer's
+`--run-chain-once` spans nest under the orchestrator's worker span.
+
+Tracing is off unless `configure()` (or `configure_from_env()` with
+`RBD_TRACE=on` or a propagated context) installs a tracer; the disabled
+tracer's spans are no-ops.
+"""
+
+from __future__ import annotations
+
+import functools
+import json
+import os
+import threading
+import time
+from pathlib import Path
+from typing import Any, Callable, TypeVar
+
+TRACE_ENV = "RBD_TRACE"
+TRACE_CONTEXT_ENV = "RBD_TRACE_CONTEXT"
+TRACE_MODES = ("off", "on")
+TRACES_DIR = "traces"
+INHERITED_ATTRS = ("chain", "epoch")
+
+F = TypeVar("F", bound=Callable[..., Any])
+
+
+def new_id(nbytes: int = 8) -> str:
+    return os.urandom(nbytes).hex()
+
+
+class Span:
+    def __init__(
+        self,
+        tracer: Tracer,
+        name: str,
+        parent_id: str | None,
+        attrs: dict[str, Any],
+    ) -> None:
+        self.tracer = tracer
+        self.name = name
+        self.span_id = new_id()
+        self.parent_id = parent_id
+        self.attrs = attrs
+        self.start = time.time()
+        self._t0 = time.perf_counter()
+        self.seconds: float | None = None
+
+    def set(self, **attrs: Any) -> Span:
+        self.attrs.update(attrs)
+        return self
+
+    def end(self) -> float:
+        if self.seconds is None:
+            self.seconds = time.perf_counter() - self._t0
+            self.tracer._finish(self)
+        return self.seconds
+
+    def __enter__(self) -> Span:
+        return self
+
+    def __exit__(self, exc_type: Any, exc: Any, tb: Any) -> None:
+        if exc_type is not None:
+            self.attrs.setdefault("error", exc_type.__name__)
+        self.end()
+
+
+class _NullSpan:
+    span_id = ""
+    seconds = None
+
+    def set(self, **attrs: Any) -> _NullSpan:
+        return self
+
+    def end(self) -> float:
+        return 0.0
+
+    def __enter__(self) -> _NullSpan:
+        return self
+
+    def __exit__(self, exc_type: Any, exc: Any, tb: Any) -> None:
+        return None
+
+
+NULL_SPAN = _NullSpan()
+
+
+class Tracer:
+    def __init__(
+        self,
+        trace_dir: Path | None,
+        service: str,
+        *,
+        trace_id: str | None = None,
+        parent_id: str | None = None,
+        attrs: dict[str, Any] | None = None,
+    ) -> None:
+        self.trace_dir = trace_dir
+        self.service = service
+        self.trace_id = trace_id or new_id(16)
+        self.root_parent_id = parent_id
+        self.root_attrs = dict(attrs or {})
+        self._local = threading.local()
+        self._lock = threading.Lock()
+        self._fd: int | None = None
+
+    @property
+    def enabled(self) -> bool:
+        return self.trace_dir is not None
+
+    def _stack(self) -> list[Span]:
+        stack = getattr(self._local, "stack", None)
+        if stack is None:
+            stack = self._local.stack = []
+        return stack
+
+    def current(self) -> Span | None:
+        stack = self._stack()
+        return stack[-1] if stack else None
+
+    def span(self, name: str, *, parent: Span | None = None, **attrs: Any) -> Span | _NullSpan:
+        """Start a span (also a context manager); `parent` defaults to this thread's current span."""
+        if not self.enabled:
+            return NULL_SPAN
+        parent = parent or self.current()
+        inherited = parent.attrs if parent is not None else self.root_attrs
+        merged = {k: inherited[k] for k in INHERITED_ATTRS if k in inherited}
+        merged.update(attrs)
+        span = Span(
+            self, name, parent.span_id if parent is not None else self.root_parent_id, merged
+        )
+        self._stack().append(span)
+        return span
+
+    def child_env(self, env: dict[str, str], span: Span | _NullSpan | None = None) -> dict[str, str]:
+        """`env` plus the context that parents a subprocess's spans under `span`."""
+        if not self.enabled:
+            return env
+        parent = span if isinstance(span, Span) else self.current()
+        attrs = parent.attrs if parent is not None else self.root_attrs
+        out = dict(env)
+        out[TRACE_CONTEXT_ENV] = json.dumps(
+            {
+                "trace_id": self.trace_id,
+                "parent_id": parent.span_id if parent is not None else self.root_parent_id,
+                "dir": str(self.trace_dir),
+                "attrs": {k: attrs[k] for k in INHERITED_ATTRS if k in attrs},
+            }
+        )
+        return out
+
+    def _finish(self, span: Span) -> None:
+        stack = self._stack()
+        if span in stack:
+            stack.remove(span)
+        record = {
+            "trace_id": self.trace_id,
+            "span_id": span.span_id,
+            "parent_id": span.parent_id,
+            "name": span.name,
+            "service": self.service,
+            "pid": os.getpid(),
+            "thread": threading.current_thread().name,
+            "start": round(span.start, 6),
+            "end": round(span.start + (span.seconds or 0.0), 6),
+            "duration_ms": round((span.seconds or 0.0) * 1000.0, 3),
+            "attrs": span.attrs,
+        }
+        line = (json.dumps(record, default=str, separators=(",", ":")) + "\n").encode("utf-8")
+        with self._lock:
+            try:
+                if self._fd is None:
+                    assert self.trace_dir is not None
+                    self.trace_dir.mkdir(parents=True, exist_ok=True)
+                    path = self.trace_dir / f"{self.service}-{os.getpid()}.jsonl"
+                    self._fd = os.open(path, os.O_WRONLY | os.O_APPEND | os.O_CREAT, 0o644)
+                os.write(self._fd, line)
+            except OSError:
+                # Tracing must never fail the run.
+                pass
+
+
+_TRACER = Tracer(None, "disabled")
+
+
+def tracer() -> Tracer:
+    return _TRACER
+
+
+def configure(trace_dir: Path | None, service: str, **kwargs: Any) -> Tracer:
+    global _TRACER
+    _TRACER = Tracer(trace_dir, service, **kwargs)
+    return _TRACER
+
+
+def configure_from_env(service: str, default_dir: Path | None = None) -> Tracer:
+    """Join a propagated trace, else start one under `default_dir` when RBD_TRACE=on."""
+    raw = os.environ.get(TRACE_CONTEXT_ENV, "")
+    if raw:
+        try:
+            ctx = json.loads(raw)
+            return configure(
+                Path(ctx["dir"]),
+                service,
+                trace_id=str(ctx["trace_id"]),
+                parent_id=ctx.get("parent_id"),
+                attrs=ctx.get("attrs") or {},
+            )
+        except (ValueError, KeyError, TypeError):
+            pass
+    if os.environ.get(TRACE_ENV, "off") == "on" and default_dir is not None:
+        return configure(default_dir, service)
+    return _TRACER
+
+
+def traced(name: str) -> Callable[[F], F]:
+    """Decorator recording each call as a `name` span when tracing is enabled."""
+
+    def decorate(fn: F) -> F:
+        @functools.wraps(fn)
+        def wrapper(*args: Any, **kwargs: Any) -> Any:
+            if not _TRACER.enabled:
+                return fn(*args, **kwargs)
+            with _TRACER.span(name):
+                return fn(*args, **kwargs)
+
+        return wrapper  # type: ignore[return-value]
+
+    return decorate
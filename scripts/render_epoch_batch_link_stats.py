@@ -10,6 +10,7 @@ from dataclasses import dataclass
 from pathlib import Path
 from typing import Any
 
+from rbd_epoch_index import load_epoch_index
 
 EPOCH_DIR_RE = re.compile(r"^epoch_(\d+)$")
 RESUME_DIR_RE = re.compile(r"^parallel_epochs_resume_(\d+)$")
@@ -238,6 +239,55 @@ def latest_worker_decision(epoch_dir: Path, chain: str) -> tuple[str, dict[str,
     return f"iteration_{iter_num:03d}", parse_decision_file(decision_path)
 
 
+def legacy_epoch_record(ref: EpochRef) -> dict[str, Any]:
+    """Index-shaped record parsed from SUMMARY.md and worker decision files."""
+    summary_lines = ref.summary_path.read_text(encoding="utf-8").splitlines()
+    head_kv = parse_md_kv(summary_lines)
+    merged_chain, merged_src, merged_dst = parse_merged(summary_lines, head_kv)
+    active = head_kv.get("active_chains", "none")
+    workers: list[dict[str, Any]] = []
+    for worker in parse_workers(summary_lines):
+        chain = str(worker["chain"])
+        iter_label, decision_kv = latest_worker_decision(ref.summary_path.parent, chain)
+        workers.append(
+            {
+                **worker,
+                "worker_iteration": iter_label,
+                "final_decision": decision_kv,
+            }
+        )
+    return {
+        "next_chain_before_batch": (
+            head_kv.get("next_chain_before_batch") or head_kv.get("pre_next_chain") or "none"
+        ),
+        "next_chain_after_batch": (
+            head_kv.get("next_chain_after_batch") or head_kv.get("post_next_chain") or "none"
+        ),
+        "active_chains": [] if active == "none" else active.split(" ; "),
+        "merged": (
+            []
+            if merged_chain == "none"
+            else [
+                {
+                    "chain": merged_chain,
+                    "source_iteration": merged_src,
+                    "destination_iteration": merged_dst,
+                }
+            ]
+        ),
+        "workers": workers,
+    }
+
+
+def load_epoch_records(run_dir: Path, epochs: list[EpochRef]) -> list[dict[str, Any]]:
+    index = load_epoch_index(run_dir) or {}
+    records: list[dict[str, Any]] = []
+    for ref in epochs:
+        record = index.get(ref.summary_path.parent.relative_to(run_dir).as_posix())
+        records.append(record if record is not None else legacy_epoch_record(ref))
+    return records
+
+
 def fmt_float(value: float | None) -> str:
     if value is None:
         return "N/A"
@@ -313,18 +363,19 @@ def main() -> int:
     global_epoch = 0
     merged_total = 0
     prior_merged_phase = "START"
-    for ref in epochs:
+    for ref, record in zip(epochs, load_epoch_records(run_dir, epochs), strict=True):
         global_epoch += 1
-        summary_lines = ref.summary_path.read_text(encoding="utf-8").splitlines()
-        head_kv = parse_md_kv(summary_lines)
-        workers = parse_workers(summary_lines)
-        merged_chain, merged_src, merged_dst = parse_merged(summary_lines, head_kv)
-        if merged_chain != "none":
+        merged = record.get("merged") or []
+        merged_chain, merged_src, merged_dst = "none", "none", "none"
+        if merged:
+            merged_chain = str(merged[-1].get("chain", "none"))
+            merged_src = str(merged[-1].get("source_iteration", "none"))
+            merged_dst = str(merged[-1].get("destination_iteration", "none"))
             merged_total += 1
 
-        next_before = head_kv.get("next_chain_before_batch") or head_kv.get("pre_next_chain") or "none"
-        next_after = head_kv.get("next_chain_after_batch") or head_kv.get("post_next_chain") or "none"
-        active_chains = head_kv.get("active_chains", "none").replace(" ; ", ", ")
+        next_before = str(record.get("next_chain_before_batch") or "none")
+        next_after = str(record.get("next_chain_after_batch") or "none")
+        active_chains = ", ".join(record.get("active_chains") or []) or "none"
 
         body_lines.extend(
             [
@@ -343,9 +394,10 @@ def main() -> int:
 
         table_rows: list[list[str]] = []
         worker_row_objs: dict[str, WorkerRow] = {}
-        for worker in workers:
+        for worker in record.get("workers", []):
             chain = str(worker["chain"])
-            iter_label, decision_kv = latest_worker_decision(ref.summary_path.parent, chain)
+            iter_label = str(worker.get("worker_iteration", "missing"))
+            decision_kv: dict[str, str] = worker.get("final_decision") or {}
 
             baseline_mean = parse_float(decision_kv.get("baseline_mean", ""))
             recheck_mean = parse_float(decision_kv.get("recheck_mean", ""))
@@ -5,10 +5,14 @@ from __future__ import annotations
 
 import argparse
 import json
+import os
 import re
+import time
 from dataclasses import dataclass
 from pathlib import Path
+from typing import Any
 
+from rbd_epoch_index import EPOCH_INDEX_FILE, INDEX_SCHEMA
 
 EPOCH_DIR_RE = re.compile(r"^epoch_(\d+)$")
 RESUME_DIR_RE = re.compile(r"^parallel_epochs_resume_(\d+)$")
@@ -52,6 +56,17 @@ def parse_args() -> argparse.Namespace:
         default="scorecards/LSM_DASHBOARD.md",
         help="Output markdown path",
     )
+    parser.add_argument(
+        "--watch",
+        action="store_true",
+        help="Keep running and re-render when new epochs or STABILITY_STATUS.json changes appear.",
+    )
+    parser.add_argument(
+        "--interval",
+        type=float,
+        default=2.0,
+        help="Seconds between --watch polls (default: 2.0).",
+    )
     return parser.parse_args()
 
 
@@ -212,6 +227,27 @@ def parse_merged(lines: list[str], head_kv: dict[str, str]) -> str:
     return "none"
 
 
+def legacy_epoch_record(ref: EpochRef) -> dict[str, Any]:
+    """Index-shaped record parsed from SUMMARY.md and worker decision files."""
+    lines = ref.summary_path.read_text(encoding="utf-8").splitlines()
+    head_kv = parse_md_kv(lines)
+    merged_chain = parse_merged(lines, head_kv)
+    workers: list[dict[str, Any]] = []
+    for worker in parse_workers(lines):
+        chain = worker.get("chain", "")
+        workers.append(
+            {
+                "chain": chain,
+                "decision": worker.get("decision", "UNKNOWN"),
+                "final_decision": latest_worker_decision(ref.summary_path.parent, chain),
+            }
+        )
+    return {
+        "merged": [] if merged_chain == "none" else [{"chain": merged_chain}],
+        "workers": workers,
+    }
+
+
 def chain_order(chains: list[str]) -> list[str]:
     scored: list[tuple[int, int, str]] = []
     for chain in chains:
@@ -311,65 +347,9 @@ def build_ascii_table(headers: list[str], rows: list[list[str]]) -> str:
     return "\n".join(out)
 
 
-def main() -> int:
-    args = parse_args()
-    run_dir = Path(args.run_dir).resolve()
-    output = Path(args.output).resolve()
-    output.parent.mkdir(parents=True, exist_ok=True)
-
-    status_path = run_dir / "STABILITY_STATUS.json"
-    status = json.loads(status_path.read_text(encoding="utf-8")) if status_path.exists() else {}
-
-    epochs = discover_epochs(run_dir)
-    chain_set: set[str] = set()
-    per_epoch_cells: list[dict[str, Cell]] = []
-    merged_chains: list[str] = []
-
-    for ref in epochs:
-        lines = ref.summary_path.read_text(encoding="utf-8").splitlines()
-        head_kv = parse_md_kv(lines)
-        workers = parse_workers(lines)
-        merged_chain = parse_merged(lines, head_kv)
-        merged_chains.append(merged_chain)
-
-        cells: dict[str, Cell] = {}
-        for worker in workers:
-            chain = worker.get("chain", "")
-            chain_set.add(chain)
-            decision_kv = latest_worker_decision(ref.summary_path.parent, chain)
-            baseline = parse_float(decision_kv.get("baseline_mean"))
-            after = parse_float(decision_kv.get("recheck_mean"))
-            delta = (after - baseline) if (after is not None and baseline is not None) else None
-            blk = parse_int(decision_kv.get("recheck_blocking_defects"))
-            defects = parse_int(decision_kv.get("recheck_total_defects"))
-            phase = normalize_scalar(decision_kv.get("liquid_state_phase", "UNK"))
-            prompt_ok = parse_bool(decision_kv.get("prompt_satisfaction"))
-            id_lock = parse_bool(decision_kv.get("identity_lock"))
-            perfect = (
-                after is not None
-                and after >= 100.0
-                and (defects or 0) == 0
-                and (blk or 0) == 0
-            )
-            cells[chain] = Cell(
-                chain=chain,
-                decision=worker.get("decision", "UNKNOWN"),
-                baseline=baseline,
-                after=after,
-                delta=delta,
-                blocking=blk,
-                defects=defects,
-                prompt_ok=prompt_ok,
-                id_lock=id_lock,
-                phase=phase,
-                perfect=perfect,
-            )
-        per_epoch_cells.append(cells)
-
-    ordered_chains = chain_order(list(chain_set))
-
-    legend_headers = ["TOKEN", "KIND", "D1", "D2", "D3", "D4"]
-    legend_rows = [
+LEGEND_TABLE = build_ascii_table(
+    ["TOKEN", "KIND", "D1", "D2", "D3", "D4"],
+    [
         ["[S][D][M]", "cell", "chain code triplet", "", "", ""],
         ["S", "phase", "3 = edge", "4 = train", "5 = reconv", "6 = stable"],
         ["D", "decision", "A = accept", "P = prov", "R = reject", ""],
@@ -380,130 +360,338 @@ def main() -> int:
         ["B", "merged", "merged-link", "blocking defects", "", ""],
         ["D", "merged", "merged-link", "total defects", "", ""],
         ["EX", "example", "5A* = ideal", "4P! = blocked", "4Px = prompt-miss", ""],
-    ]
-    legend_table = build_ascii_table(legend_headers, legend_rows)
-
-    header_lines: list[str] = [
-        "# LSM Dashboard (Narrow)",
-        "",
-        f"- run: `{run_dir.name}`",
-        f"- epochs: `{len(epochs)}`",
-        f"- final_phase: `{status.get('liquid_state_phase', 'unknown')}`",
-        f"- stable: `{'yes' if bool(status.get('stable', False)) else 'no'}`",
-        "",
-        "Legend (fixed-width):",
-        "```text",
-        legend_table,
-        "```",
-        "",
-    ]
-
-    # Chain bottleneck summary stats for footer rows.
-    chain_seen: dict[str, int] = {}
-    chain_avg_after: dict[str, str] = {}
-    chain_perfect: dict[str, int] = {}
-    chain_blk_epochs: dict[str, int] = {}
-    chain_prompt_no: dict[str, int] = {}
-    for chain in ordered_chains:
-        chain_cells = [epoch[chain] for epoch in per_epoch_cells if chain in epoch]
-        seen = len(chain_cells)
-        afters = [c.after for c in chain_cells if c.after is not None]
-        avg_after = sum(afters) / len(afters) if afters else None
-        perfect_cnt = sum(1 for c in chain_cells if c.perfect)
-        blk_epochs = sum(1 for c in chain_cells if (c.blocking or 0) > 0)
-        prompt_no = sum(1 for c in chain_cells if c.prompt_ok is False)
-        chain_seen[chain] = seen
-        chain_avg_after[chain] = fmt(avg_after)
-        chain_perfect[chain] = perfect_cnt
-        chain_blk_epochs[chain] = blk_epochs
-        chain_prompt_no[chain] = prompt_no
-
-    # Unified dashboard table: per-epoch + merged trajectory + bottleneck footer.
-    unified_headers = ["ROW"] + [short_chain(c) for c in ordered_chains] + [
-        "MG",
-        "AFT",
-        "Δ",
-        "B",
-        "D",
-    ]
-    unified_rows: list[list[str]] = []
-    for i, (cells, merged) in enumerate(zip(per_epoch_cells, merged_chains, strict=True), start=1):
-        row = [f"E{i:02d}"]
-        for chain in ordered_chains:
-            cell = cells.get(chain)
-            row.append(state_code(cell) if cell is not None else "...")
-
-        merged_cell = cells.get(merged)
-        if merged_cell is None:
-            row.extend(
-                [
-                    short_chain(merged) if merged != "none" else "none",
-                    "N/A",
-                    "NA",
-                    "NA",
-                    "N/A",
-                    "N/A",
-                ]
-            )
-        else:
-            row.extend(
-                [
-                    short_chain(merged),
-                    fmt_int(merged_cell.after),
-                    fmt_delta_short(merged_cell.delta),
-                    str(merged_cell.blocking if merged_cell.blocking is not None else "N/A"),
-                    str(merged_cell.defects if merged_cell.defects is not None else "N/A"),
-                ]
-            )
-        unified_rows.append(row)
+    ],
+)
+
+
+def build_cells(record: dict[str, Any]) -> tuple[dict[str, Cell], str]:
+    merged = record.get("merged") or []
+    merged_chain = str(merged[-1]["chain"]) if merged else "none"
+    cells: dict[str, Cell] = {}
+    for worker in record.get("workers", []):
+        chain = str(worker.get("chain", ""))
+        decision_kv: dict[str, str] = worker.get("final_decision") or {}
+        baseline = parse_float(decision_kv.get("baseline_mean"))
+        after = parse_float(decision_kv.get("recheck_mean"))
+        delta = (after - baseline) if (after is not None and baseline is not None) else None
+        blk = parse_int(decision_kv.get("recheck_blocking_defects"))
+        defects = parse_int(decision_kv.get("recheck_total_defects"))
+        phase = normalize_scalar(decision_kv.get("liquid_state_phase", "UNK"))
+        prompt_ok = parse_bool(decision_kv.get("prompt_satisfaction"))
+        id_lock = parse_bool(decision_kv.get("identity_lock"))
+        perfect = (
+            after is not None
+            and after >= 100.0
+            and (defects or 0) == 0
+            and (blk or 0) == 0
+        )
+        cells[chain] = Cell(
+            chain=chain,
+            decision=str(worker.get("decision", "UNKNOWN")),
+            baseline=baseline,
+            after=after,
+            delta=delta,
+            blocking=blk,
+            defects=defects,
+            prompt_ok=prompt_ok,
+            id_lock=id_lock,
+            phase=phase,
+            perfect=perfect,
+        )
+    return cells, merged_chain
+
+
+@dataclass
+class ChainTotals:
+    seen: int = 0
+    after_sum: float = 0.0
+    after_count: int = 0
+    perfect: int = 0
+    blk_epochs: int = 0
+    prompt_no: int = 0
+
+    def add(self, cell: Cell, sign: int) -> None:
+        self.seen += sign
+        if cell.after is not None:
+            self.after_sum += sign * cell.after
+            self.after_count += sign
+        self.perfect += sign * int(cell.perfect)
+        self.blk_epochs += sign * int((cell.blocking or 0) > 0)
+        self.prompt_no += sign * int(cell.prompt_ok is False)
+
+    def avg_after(self) -> str:
+        return fmt(self.after_sum / self.after_count if self.after_count else None)
 
-    unified_rows.append(
-        ["Σ_AVG_AFTER"]
-        + [chain_avg_after[c] for c in ordered_chains]
-        + ["-", "-", "-", "-", "-"]
-    )
-    unified_rows.append(
-        ["Σ_PERFECT"]
-        + [str(chain_perfect[c]) for c in ordered_chains]
-        + ["-", "-", "-", "-", "-"]
-    )
-    unified_rows.append(
-        ["Σ_BLK_EPOCHS"]
-        + [str(chain_blk_epochs[c]) for c in ordered_chains]
-        + ["-", "-", "-", "-", "-"]
-    )
-    unified_rows.append(
-        ["Σ_PROMPT_NO"]
-        + [str(chain_prompt_no[c]) for c in ordered_chains]
-        + ["-", "-", "-", "-", "-"]
-    )
-    unified_rows.append(
-        ["Σ_SEEN"]
-        + [str(chain_seen[c]) for c in ordered_chains]
-        + ["-", "-", "-", "-", "-"]
-    )
 
-    table_text = build_ascii_table(unified_headers, unified_rows)
-    max_line = max(len(line) for line in table_text.splitlines()) if table_text else 0
+@dataclass
+class EpochRow:
+    sort_key: tuple[tuple[int, int], int]
+    signature: Any
+    cells: dict[str, Cell]
+    merged: str
+    rendered: list[str] | None = None
+
+
+class DashboardModel:
+    """Parsed epoch rows and per-chain Σ totals, refreshed incrementally.
+
+    `refresh()` reads only what changed since the last call: new bytes of
+    EPOCH_INDEX.jsonl, SUMMARY.md files whose stat changed (runs without an
+    index) and STABILITY_STATUS.json. Rows are re-rendered only when their
+    epoch changed or a new chain adds a column.
+    """
+
+    def __init__(self, run_dir: Path) -> None:
+        self.run_dir = run_dir
+        self.status: dict[str, Any] = {}
+        self.epochs: dict[str, EpochRow] = {}
+        self.totals: dict[str, ChainTotals] = {}
+        self.ordered_chains: list[str] = []
+        self.rows_rendered = 0
+        self._status_sig: tuple[int, int] | None = None
+        self._index_offset = 0
+        self._index_sig: tuple[int, int] | None = None
+        self._legacy_scanned = False
+
+    def set_epoch(self, key: str, row: EpochRow) -> None:
+        old = self.epochs.get(key)
+        if old is not None:
+            for cell in old.cells.values():
+                self.totals[cell.chain].add(cell, -1)
+        for cell in row.cells.values():
+            self.totals.setdefault(cell.chain, ChainTotals()).add(cell, 1)
+        self.epochs[key] = row
+        chains = chain_order([c for c, t in self.totals.items() if t.seen > 0])
+        if chains != self.ordered_chains:
+            self.ordered_chains = chains
+            for other in self.epochs.values():
+                other.rendered = None
+
+    def refresh_status(self) -> bool:
+        path = self.run_dir / "STABILITY_STATUS.json"
+        try:
+            st = path.stat()
+        except FileNotFoundError:
+            sig = None
+        else:
+            sig = (st.st_mtime_ns, st.st_size)
+        if sig == self._status_sig:
+            return False
+        self._status_sig = sig
+        try:
+            self.status = json.loads(path.read_text(encoding="utf-8")) if sig else {}
+        except (OSError, json.JSONDecodeError):
+            # Mid-write; retry on the next refresh.
+            self._status_sig = None
+        return True
 
-    out: list[str] = []
-    out.extend(header_lines)
-    out.append(f"- max_table_line_chars: `{max_line}`")
-    out.append("")
-    out.extend(
-        [
-            "## Unified LSM Table",
+    def refresh_index(self) -> bool:
+        path = self.run_dir / EPOCH_INDEX_FILE
+        try:
+            st = path.stat()
+        except FileNotFoundError:
+            return False
+        sig = (st.st_mtime_ns, st.st_size)
+        if sig == self._index_sig:
+            return False
+        self._index_sig = sig
+        if st.st_size < self._index_offset:
+            self._index_offset = 0
+        with path.open("rb") as fh:
+            fh.seek(self._index_offset)
+            data = fh.read()
+        end = data.rfind(b"\n") + 1
+        self._index_offset += end
+        changed = False
+        for line in data[:end].splitlines():
+            try:
+                record = json.loads(line)
+            except json.JSONDecodeError:
+                continue
+            if not isinstance(record, dict) or record.get("schema") != INDEX_SCHEMA:
+                continue
+            key = str(record.get("epoch_dir", ""))
+            sort_key = epoch_sort_key(key)
+            if sort_key is None:
+                continue
+            cells, merged = build_cells(record)
+            self.set_epoch(key, EpochRow(sort_key, ("index", self._index_offset), cells, merged))
+            changed = True
+        return changed
+
+    def refresh_legacy(self, indexed: bool) -> bool:
+        # With an index, only epochs that predate it need markdown parsing, and
+        # those do not change any more: scan once.
+        if indexed and self._legacy_scanned:
+            return False
+        self._legacy_scanned = True
+        changed = False
+        for ref in discover_epochs(self.run_dir):
+            key = ref.summary_path.parent.relative_to(self.run_dir).as_posix()
+            current = self.epochs.get(key)
+            if current is not None and current.signature[0] == "index":
+                continue
+            try:
+                st = ref.summary_path.stat()
+            except FileNotFoundError:
+                continue
+            sig = ("md", st.st_mtime_ns, st.st_size)
+            if current is not None and current.signature == sig:
+                continue
+            cells, merged = build_cells(legacy_epoch_record(ref))
+            self.set_epoch(key, EpochRow((ref.phase_sort, ref.phase_epoch), sig, cells, merged))
+            changed = True
+        return changed
+
+    def refresh(self) -> bool:
+        changed = self.refresh_status()
+        changed = self.refresh_index() or changed
+        indexed = self._index_sig is not None
+        changed = self.refresh_legacy(indexed) or changed
+        return changed
+
+    def epoch_row(self, row: EpochRow) -> list[str]:
+        if row.rendered is None:
+            self.rows_rendered += 1
+            cells = row.cells
+            merged = row.merged
+            rendered: list[str] = []
+            for chain in self.ordered_chains:
+                cell = cells.get(chain)
+                rendered.append(state_code(cell) if cell is not None else "...")
+            merged_cell = cells.get(merged)
+            if merged_cell is None:
+                rendered.extend(
+                    [
+                        short_chain(merged) if merged != "none" else "none",
+                        "NA",
+                        "NA",
+                        "N/A",
+                        "N/A",
+                    ]
+                )
+            else:
+                rendered.extend(
+                    [
+                        short_chain(merged),
+                        fmt_int(merged_cell.after),
+                        fmt_delta_short(merged_cell.delta),
+                        str(merged_cell.blocking if merged_cell.blocking is not None else "N/A"),
+                        str(merged_cell.defects if merged_cell.defects is not None else "N/A"),
+                    ]
+                )
+            row.rendered = rendered
+        return row.rendered
+
+    def render(self) -> str:
+        ordered_chains = self.ordered_chains
+        rows = sorted(self.epochs.values(), key=lambda r: r.sort_key)
+        status = self.status
+        header_lines: list[str] = [
+            "# LSM Dashboard (Narrow)",
+            "",
+            f"- run: `{self.run_dir.name}`",
+            f"- epochs: `{len(rows)}`",
+            f"- final_phase: `{status.get('liquid_state_phase', 'unknown')}`",
+            f"- stable: `{'yes' if bool(status.get('stable', False)) else 'no'}`",
             "",
+            "Legend (fixed-width):",
             "```text",
-            table_text,
+            LEGEND_TABLE,
             "```",
             "",
         ]
-    )
 
-    output.write_text("\n".join(out), encoding="utf-8")
+        # Unified dashboard table: per-epoch + merged trajectory + bottleneck footer.
+        unified_headers = ["ROW"] + [short_chain(c) for c in ordered_chains] + [
+            "MG",
+            "AFT",
+            "Δ",
+            "B",
+            "D",
+        ]
+        unified_rows: list[list[str]] = [
+            [f"E{i:02d}"] + self.epoch_row(row) for i, row in enumerate(rows, start=1)
+        ]
+        totals = [self.totals[c] for c in ordered_chains]
+        tail = ["-", "-", "-", "-", "-"]
+        unified_rows.append(["Σ_AVG_AFTER"] + [t.avg_after() for t in totals] + tail)
+        unified_rows.append(["Σ_PERFECT"] + [str(t.perfect) for t in totals] + tail)
+        unified_rows.append(["Σ_BLK_EPOCHS"] + [str(t.blk_epochs) for t in totals] + tail)
+        unified_rows.append(["Σ_PROMPT_NO"] + [str(t.prompt_no) for t in totals] + tail)
+        unified_rows.append(["Σ_SEEN"] + [str(t.seen) for t in totals] + tail)
+
+        table_text = build_ascii_table(unified_headers, unified_rows)
+        max_line = max(len(line) for line in table_text.splitlines()) if table_text else 0
+
+        out: list[str] = []
+        out.extend(header_lines)
+        out.append(f"- max_table_line_chars: `{max_line}`")
+        out.append("")
+        out.extend(
+            [
+                "## Unified LSM Table",
+                "",
+                "```text",
+                table_text,
+                "```",
+                "",
+            ]
+        )
+        return "\n".join(out)
+
+
+def epoch_sort_key(key: str) -> tuple[tuple[int, int], int] | None:
+    parts = key.split("/")
+    if len(parts) != 2 or not parts[0].startswith("parallel_epochs"):
+        return None
+    match = EPOCH_DIR_RE.match(parts[1])
+    if match is None:
+        return None
+    return parse_phase(parts[0])[1], int(match.group(1))
+
+
+def write_atomic(path: Path, text: str) -> None:
+    tmp = path.with_name(f".{path.name}.tmp")
+    tmp.write_text(text, encoding="utf-8")
+    os.replace(tmp, path)
+
+
+def main() -> int:
+    args = parse_args()
+    if args.interval <= 0:
+        raise SystemExit("--interval must be > 0")
+    run_dir = Path(args.run_dir).resolve()
+    output = Path(args.output).resolve()
+    output.parent.mkdir(parents=True, exist_ok=True)
+
+    model = DashboardModel(run_dir)
+    model.refresh()
+    write_atomic(output, model.render())
     print(f"wrote {output}")
-    return 0
+    if not args.watch:
+        return 0
+    try:
+        while True:
+            time.sleep(args.interval)
+            start = time.perf_counter()
+            rows_before = model.rows_rendered
+            if not model.refresh():
+                continue
+            write_atomic(output, model.render())
+            print(
+                "dashboard_refresh="
+                + json.dumps(
+                    {
+                        "epochs": len(model.epochs),
+                        "rows_rendered": model.rows_rendered - rows_before,
+                        "ms": round((time.perf_counter() - start) * 1000.0, 2),
+                    }
+                ),
+                flush=True,
+            )
+    except KeyboardInterrupt:
+        return 0
 
 
 if __name__ == "__main__":
@@ -6,6 +6,7 @@ from __future__ import annotations
 import argparse
 import datetime as dt
 import json
+import os
 import re
 import textwrap
 from dataclasses import dataclass
@@ -338,102 +339,169 @@ def load_rubric_json(path: Path) -> LayerRubric:
     )
 
 
-def pick_iteration_files(files: list[Path], iteration: str) -> list[Path]:
-    iteration_map: dict[str, list[Path]] = {}
-    for file in files:
-        it = extract_iteration(file)
-        if it is None:
-            continue
-        iteration_map.setdefault(it, []).append(file)
-    if not iteration_map:
-        raise ValueError("no iteration-tagged files found")
+class LayerIndex:
+    """Per-layer candidate files for one requested iteration.
+
+    Only the files that can still be selected are kept: for "latest", those of
+    the highest iteration seen so far; otherwise those tagged with the
+    requested id (as given or zero-padded).
+    """
+
+    def __init__(self, iteration: str) -> None:
+        self.iteration = iteration
+        self.normalized = iteration.zfill(3)
+        self.available: dict[int, set[str]] = {}
+        self.files: dict[int, dict[str, list[Path]]] = {}
+
+    def add(self, path: Path) -> None:
+        layer = extract_layer(path)
+        it = extract_iteration(path)
+        if layer is None or it is None:
+            return
+        self.available.setdefault(layer, set()).add(it)
+        by_iteration = self.files.setdefault(layer, {})
+        if self.iteration == "latest":
+            current = next(iter(by_iteration), None)
+            if current is not None and int(it) < int(current):
+                return
+            if current is not None and int(it) > int(current):
+                by_iteration.clear()
+        elif it not in {self.iteration, self.normalized}:
+            return
+        by_iteration.setdefault(it, []).append(path)
+
+    def layers(self) -> list[int]:
+        return sorted(self.available)
+
+    def candidates(self, layer: int) -> list[Path]:
+        by_iteration = self.files.get(layer, {})
+        if self.iteration == "latest":
+            files = next(iter(by_iteration.values()), [])
+        else:
+            files = by_iteration.get(self.iteration) or by_iteration.get(self.normalized) or []
+        if not files:
+            raise ValueError(
+                f"iteration {self.iteration} not present; available={sorted(self.available.get(layer, ()))}"
+            )
+        return sorted(files, key=lambda p: p.as_posix())
+
+
+# Per-epoch snapshots and worker workspaces hold copies of the run's rubrics;
+# the directory walk never descends into them.
+PRUNED_DIR_NAMES = frozenset({"snapshot", "workers", ".cas", ".git", "__pycache__"})
+PRUNED_DIR_PREFIXES = ("parallel_epochs",)
+
 
-    if iteration == "latest":
-        selected_iteration = max(iteration_map, key=lambda c: int(c))
-        return sorted(iteration_map[selected_iteration], key=lambda p: p.as_posix())
+def find_named_dirs(run_dir: Path, names: frozenset[str]) -> dict[str, list[Path]]:
+    found: dict[str, list[Path]] = {name: [] for name in names}
+    for dirpath, dirnames, _ in os.walk(run_dir):
+        dirnames[:] = sorted(
+            d
+            for d in dirnames
+            if d not in PRUNED_DIR_NAMES and not d.startswith(PRUNED_DIR_PREFIXES)
+        )
+        for d in dirnames:
+            if d in names:
+                found[d].append(Path(dirpath) / d)
+    return found
+
+
+def worker_named_dirs(run_dir: Path, name: str) -> list[Path]:
+    """`parallel_epochs*/epoch_*/workers/*/<name>` at their fixed depth, without walking the trees.
+
+    Until a worker result is merged, the run root has no rubric files of its own.
+    """
+    found: list[Path] = []
+    for phase_root in scan_entries(run_dir):
+        if not phase_root.name.startswith(PRUNED_DIR_PREFIXES) or not phase_root.is_dir():
+            continue
+        for epoch_dir in scan_entries(Path(phase_root.path)):
+            if not epoch_dir.name.startswith("epoch_"):
+                continue
+            for worker in scan_entries(Path(epoch_dir.path) / "workers"):
+                candidate = Path(worker.path) / name
+                if candidate.is_dir():
+                    found.append(candidate)
+    return found
+
+
+def scan_entries(directory: Path) -> list[os.DirEntry[str]]:
+    try:
+        with os.scandir(directory) as it:
+            return list(it)
+    except OSError:
+        return []
 
-    if iteration in iteration_map:
-        return sorted(iteration_map[iteration], key=lambda p: p.as_posix())
 
-    normalized = iteration.zfill(3)
-    if normalized in iteration_map:
-        return sorted(iteration_map[normalized], key=lambda p: p.as_posix())
-    raise ValueError(f"iteration {iteration} not present; available={sorted(iteration_map)}")
+def rubric_json_files(rubrics_dir: Path) -> list[Path]:
+    """`<rubrics_dir>/R*/{iteration,cycle}_*.json` (covers legacy `R<n>` dirs)."""
+    files: list[Path] = []
+    for layer_dir in scan_entries(rubrics_dir):
+        if not layer_dir.name.startswith("R") or not layer_dir.is_dir():
+            continue
+        for entry in scan_entries(Path(layer_dir.path)):
+            if entry.name.endswith(".json") and entry.name.startswith(("iteration_", "cycle_")):
+                files.append(Path(entry.path))
+    return files
+
+
+def scorecard_files(scorecards_dir: Path) -> list[Path]:
+    """`<scorecards_dir>/R*_grid_{iteration,cycle}_*.md`."""
+    return [
+        Path(entry.path)
+        for entry in scan_entries(scorecards_dir)
+        if entry.name.startswith("R")
+        and entry.name.endswith(".md")
+        and ("_grid_iteration_" in entry.name or "_grid_cycle_" in entry.name)
+    ]
 
 
 def discover_layers(run_dir: Path, iteration: str) -> list[LayerRubric]:
-    root_json_files = {
-        *run_dir.glob("rubrics/Rubric_*/iteration_*.json"),
-        *run_dir.glob("rubrics/R*/iteration_*.json"),  # legacy compatibility
-        *run_dir.glob("rubrics/Rubric_*/cycle_*.json"),
-        *run_dir.glob("rubrics/R*/cycle_*.json"),  # legacy compatibility
-    }
-    if root_json_files:
-        json_files = sorted(root_json_files, key=lambda p: p.as_posix())
-    else:
-        json_files = sorted(
-            {
-                *run_dir.glob("**/rubrics/Rubric_*/iteration_*.json"),
-                *run_dir.glob("**/rubrics/R*/iteration_*.json"),
-                *run_dir.glob("**/rubrics/Rubric_*/cycle_*.json"),
-                *run_dir.glob("**/rubrics/R*/cycle_*.json"),
-            },
-            key=lambda p: p.as_posix(),
-        )
-        json_files = [p for p in json_files if "snapshot" not in p.parts]
+    nested: dict[str, list[Path]] | None = None
+
+    def nested_dirs(name: str) -> list[Path]:
+        nonlocal nested
+        if nested is None:
+            nested = find_named_dirs(run_dir, frozenset({"rubrics", "scorecards"}))
+        return nested[name]
+
+    json_files = rubric_json_files(run_dir / "rubrics")
+    if not json_files:
+        json_files = [f for d in nested_dirs("rubrics") for f in rubric_json_files(d)]
+    if not json_files:
+        json_files = [f for d in worker_named_dirs(run_dir, "rubrics") for f in rubric_json_files(d)]
+    json_index = LayerIndex(iteration)
+    for file in json_files:
+        json_index.add(file)
+
     layers_by_index: dict[int, LayerRubric] = {}
-    if json_files:
-        per_layer_json: dict[int, list[Path]] = {}
-        for file in json_files:
-            layer = extract_layer(file)
-            if layer is None:
+    for layer in json_index.layers():
+        loaded: LayerRubric | None = None
+        for candidate in json_index.candidates(layer):
+            try:
+                loaded = load_rubric_json(candidate)
+                break
+            except Exception:
                 continue
-            per_layer_json.setdefault(layer, []).append(file)
-
-        for layer in sorted(per_layer_json):
-            candidates = pick_iteration_files(per_layer_json[layer], iteration)
-            loaded: LayerRubric | None = None
-            for candidate in candidates:
-                try:
-                    loaded = load_rubric_json(candidate)
-                    break
-                except Exception:
-                    continue
-            if loaded is not None:
-                layers_by_index[layer] = loaded
-
-    root_scorecards = {
-        *run_dir.glob("scorecards/Rubric_*_grid_iteration_*.md"),
-        *run_dir.glob("scorecards/R*_grid_iteration_*.md"),  # legacy compatibility
-        *run_dir.glob("scorecards/Rubric_*_grid_cycle_*.md"),
-        *run_dir.glob("scorecards/R*_grid_cycle_*.md"),  # legacy compatibility
-    }
-    if root_scorecards:
-        scorecards = sorted(root_scorecards, key=lambda p: p.as_posix())
-    else:
-        scorecards = sorted(
-            {
-                *run_dir.glob("**/scorecards/Rubric_*_grid_iteration_*.md"),
-                *run_dir.glob("**/scorecards/R*_grid_iteration_*.md"),
-                *run_dir.glob("**/scorecards/Rubric_*_grid_cycle_*.md"),
-                *run_dir.glob("**/scorecards/R*_grid_cycle_*.md"),
-            },
-            key=lambda p: p.as_posix(),
-        )
-        scorecards = [p for p in scorecards if "snapshot" not in p.parts]
-    per_layer: dict[int, list[Path]] = {}
+        if loaded is not None:
+            layers_by_index[layer] = loaded
+
+    scorecards = scorecard_files(run_dir / "scorecards")
+    if not scorecards:
+        scorecards = [f for d in nested_dirs("scorecards") for f in scorecard_files(d)]
+    if not scorecards:
+        scorecards = [
+            f for d in worker_named_dirs(run_dir, "scorecards") for f in scorecard_files(d)
+        ]
+    scorecard_index = LayerIndex(iteration)
     for file in scorecards:
-        layer = extract_layer(file)
-        if layer is None:
-            continue
-        per_layer.setdefault(layer, []).append(file)
+        scorecard_index.add(file)
 
-    for layer in sorted(per_layer):
+    for layer in scorecard_index.layers():
         if layer in layers_by_index:
             continue
-        candidates = pick_iteration_files(per_layer[layer], iteration)
-        loaded: LayerRubric | None = None
-        for candidate in candidates:
+        loaded = None
+        for candidate in scorecard_index.candidates(layer):
             try:
                 loaded = load_scorecard(candidate)
                 break
@@ -0,0 +1,203 @@
+#!/usr/bin/env python3
+"""Render per-phase timing percentiles and per-epoch critical paths from a run's traces."""
+
+from __future__ import annotations
+
+import argparse
+import json
+import math
+from collections import defaultdict
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Any
+
+from rbd_trace import TRACES_DIR
+
+REPORT_NAME = "TRACE_REPORT.md"
+TOP_SEGMENTS = 3
+
+
+@dataclass
+class SpanRecord:
+    span_id: str
+    parent_id: str | None
+    name: str
+    service: str
+    start: float
+    end: float
+    attrs: dict[str, Any] = field(default_factory=dict)
+
+    @property
+    def seconds(self) -> float:
+        return max(0.0, self.end - self.start)
+
+
+def parse_args() -> argparse.Namespace:
+    parser = argparse.ArgumentParser(
+        description="Render span percentiles and per-epoch critical paths from <run-dir>/traces."
+    )
+    parser.add_argument("--run-dir", required=True, help="Run directory")
+    parser.add_argument(
+        "--output",
+        default="",
+        help=f"Output markdown path (default: <run-dir>/{TRACES_DIR}/{REPORT_NAME})",
+    )
+    return parser.parse_args()
+
+
+def load_spans(trace_dir: Path) -> list[SpanRecord]:
+    spans: list[SpanRecord] = []
+    for path in sorted(trace_dir.glob("*.jsonl")):
+        for line in path.read_text(encoding="utf-8", errors="ignore").splitlines():
+            try:
+                raw = json.loads(line)
+                spans.append(
+                    SpanRecord(
+                        span_id=str(raw["span_id"]),
+                        parent_id=raw.get("parent_id"),
+                        name=str(raw["name"]),
+                        service=str(raw.get("service", "")),
+                        start=float(raw["start"]),
+                        end=float(raw["end"]),
+                        attrs=raw.get("attrs") or {},
+                    )
+                )
+            except (ValueError, KeyError, TypeError):
+                # A process killed mid-write leaves at most one partial line.
+                continue
+    return spans
+
+
+def percentile(sorted_values: list[float], pct: float) -> float:
+    """Nearest-rank percentile of an ascending list."""
+    if not sorted_values:
+        return 0.0
+    rank = max(1, math.ceil(pct / 100.0 * len(sorted_values)))
+    return sorted_values[rank - 1]
+
+
+def critical_path(
+    span: SpanRecord,
+    children: dict[str, list[SpanRecord]],
+    lo: float,
+    hi: float,
+    out: dict[str, float],
+) -> None:
+    """Walk back from `hi`: the child ending last is on the path; gaps are the span's own time."""
+    cursor = hi
+    kids = children.get(span.span_id, [])
+    while cursor > lo:
+        best: SpanRecord | None = None
+        best_end = lo
+        for kid in kids:
+            if kid.start >= cursor or kid.end <= lo:
+                continue
+            kid_end = min(kid.end, cursor)
+            if best is None or kid_end > best_end:
+                best, best_end = kid, kid_end
+        if best is None:
+            out[f"{span.name} (self)"] += cursor - lo
+            return
+        if best_end < cursor:
+            out[f"{span.name} (self)"] += cursor - best_end
+        kid_start = max(best.start, lo)
+        critical_path(best, children, kid_start, best_end, out)
+        cursor = kid_start
+
+
+def fmt_seconds(value: float) -> str:
+    return f"{value:.3f}"
+
+
+def render_report(run_dir: Path, spans: list[SpanRecord]) -> str:
+    lines = [
+        "# Trace Report",
+        "",
+        f"- run_dir: `{run_dir}`",
+        f"- spans: `{len(spans)}`",
+        f"- services: `{', '.join(sorted({s.service for s in spans})) or 'none'}`",
+        "",
+        "## Phases",
+        "",
+        "| span | count | p50_s | p90_s | p99_s | max_s | total_s |",
+        "|---|---:|---:|---:|---:|---:|---:|",
+    ]
+    by_name: dict[str, list[float]] = defaultdict(list)
+    for span in spans:
+        by_name[span.name].append(span.seconds)
+    for name, values in sorted(by_name.items(), key=lambda item: -sum(item[1])):
+        values.sort()
+        lines.append(
+            f"| {name} | {len(values)} | {fmt_seconds(percentile(values, 50))} | "
+            f"{fmt_seconds(percentile(values, 90))} | {fmt_seconds(percentile(values, 99))} | "
+            f"{fmt_seconds(values[-1])} | {fmt_seconds(sum(values))} |"
+        )
+
+    children: dict[str, list[SpanRecord]] = defaultdict(list)
+    for span in spans:
+        if span.parent_id:
+            children[span.parent_id].append(span)
+    epochs = sorted(
+        (s for s in spans if s.name == "epoch"),
+        key=lambda s: (s.start, str(s.attrs.get("epoch", ""))),
+    )
+    totals: dict[str, float] = defaultdict(float)
+    epoch_rows: list[str] = []
+    for span in epochs:
+        path: dict[str, float] = defaultdict(float)
+        critical_path(span, children, span.start, span.end, path)
+        for name, seconds in path.items():
+            totals[name] += seconds
+        top = sorted(path.items(), key=lambda item: -item[1])[:TOP_SEGMENTS]
+        segments = ", ".join(
+            f"{name} {fmt_seconds(seconds)}s ({100.0 * seconds / span.seconds:.0f}%)"
+            if span.seconds > 0
+            else f"{name} {fmt_seconds(seconds)}s"
+            for name, seconds in top
+        )
+        epoch_rows.append(
+            f"| {span.attrs.get('epoch', 'n/a')} | {fmt_seconds(span.seconds)} | {segments or 'n/a'} |"
+        )
+
+    lines.extend(["", "## Critical Path (all epochs)", ""])
+    if not epochs:
+        lines.append("- no `epoch` spans recorded")
+    else:
+        grand = sum(totals.values())
+        lines.extend(["| segment | seconds | share |", "|---|---:|---:|"])
+        for name, seconds in sorted(totals.items(), key=lambda item: -item[1]):
+            share = 100.0 * seconds / grand if grand > 0 else 0.0
+            lines.append(f"| {name} | {fmt_seconds(seconds)} | {share:.1f}% |")
+        lines.extend(
+            [
+                "",
+                "## Critical Path per Epoch",
+                "",
+                f"| epoch | seconds | top {TOP_SEGMENTS} segments |",
+                "|---:|---:|---|",
+                *epoch_rows,
+            ]
+        )
+    lines.append("")
+    return "\n".join(lines)
+
+
+def main() -> int:
+    args = parse_args()
+    run_dir = Path(args.run_dir).resolve()
+    if not run_dir.is_dir():
+        raise SystemExit(f"error: run dir not found: {run_dir}")
+    trace_dir = run_dir / TRACES_DIR
+    spans = load_spans(trace_dir) if trace_dir.is_dir() else []
+    if not spans:
+        raise SystemExit(f"error: no spans under {trace_dir} (run with --trace on)")
+
+    out_path = Path(args.output) if args.output else trace_dir / REPORT_NAME
+    out_path.parent.mkdir(parents=True, exist_ok=True)
+    out_path.write_text(render_report(run_dir, spans), encoding="utf-8")
+    print(f"wrote {out_path}")
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -8,11 +8,18 @@ cannot pass with generic or copy-pasted rubric content.
 from __future__ import annotations
 
 import argparse
+import concurrent.futures
+import functools
+import hashlib
 import json
 import math
+import os
 import re
+import sys
 from dataclasses import dataclass, field
+from datetime import datetime
 from pathlib import Path
+from typing import Iterator
 
 
 GENERIC_UNQUALIFIED = {
@@ -80,6 +87,8 @@ MECHANICAL_NAME_RE = re.compile(r"^(?:r|rubric)[ _-]?\d+\b", re.IGNORECASE)
 SNAKE_CASE_RE = re.compile(r"^[a-z0-9_]+$")
 PROMPT_NUMBERED_REQ_RE = re.compile(r"^\s*(\d+)\.\s+(.+?)\s*$")
 PROMPT_ACCEPTANCE_HEADER_RE = re.compile(r"^\s*acceptance criteria\s*:\s*$", re.IGNORECASE)
+PROMPT_MODEL_FILE = "prompt.model.json"
+PROMPT_MODEL_VERSION = 1
 ADAPTATION_VERB_RE = re.compile(
     r"\b(adapt|reshape|refine|tighten|split|merge|reframe|reweight|prioritize|"
     r"transmogrif|evolve|recompose|retune|correct|strengthen)\b",
@@ -125,6 +134,8 @@ MIN_ROLE_ARRAY_ITEM_LEN = 16
 MIN_ROLE_SECTION_INTENT_LEN = 24
 MIN_ROLE_SECTION_SCORING_FOCUS_LEN = 24
 MIN_ROLE_SECTION_ITEM_LEN = 16
+RESULT_CACHE_FILE = ".rubric_excellence_cache.json"
+RESULT_CACHE_VERSION = 1
 
 
 @dataclass
@@ -139,6 +150,16 @@ class ValidationReport:
         self.warnings.append(message)
 
 
+@dataclass
+class FileResult:
+    rel: str
+    sha256: str
+    errors: list[str]
+    warnings: list[str]
+    manifest_files: dict[str, bool] = field(default_factory=dict)
+    cached: bool = False
+
+
 def parse_args() -> argparse.Namespace:
     p = argparse.ArgumentParser(description="Validate nested rubric excellence quality.")
     p.add_argument("--run-dir", required=True, help="Run directory")
@@ -147,6 +168,34 @@ def parse_args() -> argparse.Namespace:
         default="",
         help="Optional JSON output path for report details",
     )
+    p.add_argument(
+        "--jobs",
+        type=int,
+        default=1,
+        help="Validate rubric files in N worker processes (default: 1, in-process)",
+    )
+    p.add_argument(
+        "--cache",
+        choices=("on", "off"),
+        default="on",
+        help=(
+            f"Reuse results for unchanged rubric files from <run-dir>/{RESULT_CACHE_FILE}, "
+            "keyed by file, prompt, and validator content hashes (default: on)"
+        ),
+    )
+    p.add_argument(
+        "--changed-since",
+        default="",
+        help=(
+            "Only validate rubric files modified after this point: an ISO-8601 timestamp, "
+            "epoch seconds, or a path whose mtime is used"
+        ),
+    )
+    p.add_argument(
+        "--stream",
+        action="store_true",
+        help="Print each file's result as soon as it finishes instead of one combined listing",
+    )
     return p.parse_args()
 
 
@@ -194,6 +243,23 @@ def parse_prompt_requirements(prompt_text: str) -> list[str]:
     return requirements
 
 
+def load_prompt_model(run_dir: Path, prompt_bytes: bytes) -> dict | None:
+    """Return prompt.model.json (written by rbd_run.sh) when it matches prompt.txt."""
+    try:
+        data = json.loads((run_dir / PROMPT_MODEL_FILE).read_text(encoding="utf-8"))
+    except (OSError, json.JSONDecodeError):
+        return None
+    if not isinstance(data, dict) or data.get("version") != PROMPT_MODEL_VERSION:
+        return None
+    if data.get("prompt_sha256") != hashlib.sha256(prompt_bytes).hexdigest():
+        return None
+    if not isinstance(data.get("prompt_words"), list):
+        return None
+    if not isinstance(data.get("declared_requirements"), list):
+        return None
+    return data
+
+
 def requirement_matches_trace(requirement: str, trace_text: str) -> bool:
     req_norm = norm(requirement)
     trace_norm = norm(trace_text)
@@ -307,6 +373,7 @@ def manifest_ref_resolves(ref: str, manifest_set: set[str]) -> bool:
     return resolve_manifest_ref(ref, manifest_set) is not None
 
 
+@functools.lru_cache(maxsize=4096)
 def manifest_member_path(run_dir: Path, manifest_member: str) -> Path | None:
     cleaned = normalize_spaces(manifest_member)
     if not cleaned:
@@ -334,11 +401,17 @@ def manifest_ref_points_to_existing_file(
     if manifest_member is None:
         return False
     path = manifest_member_path(run_dir, manifest_member)
-    return bool(path is not None and path.exists() and path.is_file())
+    return path is not None and path_is_file(path)
+
+
+@functools.lru_cache(maxsize=4096)
+def path_is_file(path: Path) -> bool:
+    return path.exists() and path.is_file()
 
 
+@functools.lru_cache(maxsize=256)
 def build_cell_ref_lookup(
-    cell_pairs: set[tuple[str, str]],
+    cell_pairs: frozenset[tuple[str, str]],
 ) -> tuple[dict[str, tuple[str, str]], dict[tuple[str, str], tuple[str, str]]]:
     ref_lookup: dict[str, tuple[str, str]] = {}
     pair_lookup: dict[tuple[str, str], tuple[str, str]] = {}
@@ -496,7 +569,7 @@ def validate_rubric_file(
                 f"{rel}: target_collateral_manifest[{idx}] `{manifest_member}` is invalid or escapes run scope"
             )
             continue
-        if not resolved_member.exists() or not resolved_member.is_file():
+        if not path_is_file(resolved_member):
             report.error(
                 f"{rel}: target_collateral_manifest[{idx}] `{manifest_member}` does not exist as a file"
             )
@@ -1273,7 +1346,7 @@ def validate_rubric_file(
     if len(seen_pairs) != expected:
         report.error(f"{rel}: incomplete or duplicate cell coverage for XxY grid")
 
-    cell_ref_lookup, cell_pair_lookup = build_cell_ref_lookup(seen_pairs)
+    cell_ref_lookup, cell_pair_lookup = build_cell_ref_lookup(frozenset(seen_pairs))
     total_cells_for_guard = max(1, expected)
     for section_idx, role_id, scoring_focus, covered_cells in role_sections_for_cell_validation:
         resolved_pairs: set[tuple[str, str]] = set()
@@ -1380,8 +1453,149 @@ def validate_rubric_file(
             )
 
 
+def sha256_hex(data: bytes) -> str:
+    return hashlib.sha256(data).hexdigest()
+
+
+def manifest_file_states(data: object, run_dir: Path) -> dict[str, bool]:
+    """Existence of every manifest member the validator checked for `data`."""
+    if not isinstance(data, dict):
+        return {}
+    members = data.get("target_collateral_manifest", [])
+    if not isinstance(members, list):
+        return {}
+    states: dict[str, bool] = {}
+    for member in members:
+        path = manifest_member_path(run_dir, str(member).strip())
+        if path is not None:
+            states[str(path.relative_to(run_dir))] = path_is_file(path)
+    return states
+
+
+def validate_one_file(
+    path: Path,
+    run_dir: Path,
+    prompt_words: set[str],
+    prompt_requirements: list[str],
+) -> FileResult:
+    report = ValidationReport()
+    validate_rubric_file(path, run_dir, prompt_words, prompt_requirements, report)
+    raw = path.read_bytes()
+    try:
+        data = json.loads(raw.decode("utf-8"))
+    except ValueError:
+        data = None
+    return FileResult(
+        rel=pretty_path(path, run_dir),
+        sha256=sha256_hex(raw),
+        errors=report.errors,
+        warnings=report.warnings,
+        manifest_files=manifest_file_states(data, run_dir),
+    )
+
+
+def load_result_cache(path: Path, context: str) -> dict[str, dict]:
+    try:
+        data = json.loads(path.read_text(encoding="utf-8"))
+    except (OSError, ValueError):
+        return {}
+    if not isinstance(data, dict) or data.get("version") != RESULT_CACHE_VERSION:
+        return {}
+    if data.get("context") != context or not isinstance(data.get("files"), dict):
+        return {}
+    return data["files"]
+
+
+def store_result_cache(path: Path, context: str, files: dict[str, dict]) -> None:
+    tmp = path.with_name(path.name + ".tmp")
+    tmp.write_text(
+        json.dumps(
+            {"version": RESULT_CACHE_VERSION, "context": context, "files": files},
+            sort_keys=True,
+        )
+        + "\n",
+        encoding="utf-8",
+    )
+    os.replace(tmp, path)
+
+
+def cached_file_result(entry: object, path: Path, run_dir: Path) -> FileResult | None:
+    if not isinstance(entry, dict):
+        return None
+    try:
+        sha = sha256_hex(path.read_bytes())
+    except OSError:
+        return None
+    if entry.get("sha256") != sha:
+        return None
+    manifest_files = entry.get("manifest_files", {})
+    for rel, was_file in manifest_files.items():
+        if path_is_file(run_dir / rel) != was_file:
+            return None
+    return FileResult(
+        rel=pretty_path(path, run_dir),
+        sha256=sha,
+        errors=list(entry.get("errors", [])),
+        warnings=list(entry.get("warnings", [])),
+        manifest_files=dict(manifest_files),
+        cached=True,
+    )
+
+
+def parse_changed_since(value: str) -> float:
+    candidate = Path(value)
+    if candidate.exists():
+        return candidate.stat().st_mtime
+    try:
+        return float(value)
+    except ValueError:
+        pass
+    try:
+        stamp = datetime.fromisoformat(value.replace("Z", "+00:00"))
+    except ValueError:
+        raise SystemExit(
+            "--changed-since must be an ISO-8601 timestamp, epoch seconds, or an existing path"
+        ) from None
+    return stamp.timestamp()
+
+
+def iter_file_results(
+    rubric_files: list[Path],
+    run_dir: Path,
+    prompt_words: set[str],
+    prompt_requirements: list[str],
+    *,
+    jobs: int,
+    cache: dict[str, dict] | None,
+) -> Iterator[FileResult]:
+    """Yield per-file results as they finish; cache hits come first."""
+    pending: list[Path] = []
+    for path in rubric_files:
+        hit = None
+        if cache is not None:
+            hit = cached_file_result(cache.get(pretty_path(path, run_dir)), path, run_dir)
+        if hit is not None:
+            yield hit
+        else:
+            pending.append(path)
+
+    if jobs <= 1 or len(pending) <= 1:
+        for path in pending:
+            yield validate_one_file(path, run_dir, prompt_words, prompt_requirements)
+        return
+    with concurrent.futures.ProcessPoolExecutor(max_workers=min(jobs, len(pending))) as pool:
+        futures = [
+            pool.submit(validate_one_file, path, run_dir, prompt_words, prompt_requirements)
+            for path in pending
+        ]
+        for future in concurrent.futures.as_completed(futures):
+            yield future.result()
+
+
 def main() -> int:
     args = parse_args()
+    if args.jobs < 1:
+        raise SystemExit("--jobs must be >= 1")
     run_dir = Path(args.run_dir).resolve()
     if not run_dir.is_dir():
         raise SystemExit(f"error: run dir not found: {run_dir}")
@@ -1400,22 +1614,81 @@ def main() -> int:
         report.error(
             "no rubric JSON files found under rubrics/Rubric_*/iteration_*.json (or legacy cycle_*.json)"
         )
+    total_files = len(rubric_files)
+    if args.changed_since:
+        threshold = parse_changed_since(args.changed_since)
+        rubric_files = [p for p in rubric_files if p.stat().st_mtime > threshold]
     prompt_path = run_dir / "prompt.txt"
     prompt_words = set()
     prompt_requirements: list[str] = []
+    prompt_text = ""
     if prompt_path.exists():
         prompt_text = prompt_path.read_text(encoding="utf-8")
-        prompt_words = token_set(prompt_text, min_len=4)
-        prompt_requirements = parse_prompt_requirements(prompt_text)
-
-    for rubric_path in rubric_files:
-        validate_rubric_file(
-            rubric_path,
-            run_dir,
-            prompt_words,
-            prompt_requirements,
-            report,
-        )
+        prompt_model = load_prompt_model(run_dir, prompt_path.read_bytes())
+        if prompt_model is not None:
+            # Model words are unfiltered 4+ character tokens; apply our stopwords.
+            prompt_words = set(prompt_model["prompt_words"]) - STOPWORDS
+            prompt_requirements = list(prompt_model["declared_requirements"])
+        else:
+            prompt_words = token_set(prompt_text, min_len=4)
+            prompt_requirements = parse_prompt_requirements(prompt_text)
+
+    cache_path = run_dir / RESULT_CACHE_FILE
+    # A change to the prompt or to this validator invalidates every cached result.
+    cache_context = sha256_hex(
+        prompt_text.encode("utf-8") + b"\0" + Path(__file__).read_bytes()
+    )
+    cache = load_result_cache(cache_path, cache_context) if args.cache == "on" else None
+
+    order = {pretty_path(path, run_dir): idx for idx, path in enumerate(rubric_files)}
+    results: list[FileResult] = []
+    for result in iter_file_results(
+        rubric_files,
+        run_dir,
+        prompt_words,
+        prompt_requirements,
+        jobs=args.jobs,
+        cache=cache,
+    ):
+        results.append(result)
+        if cache is not None and not result.cached:
+            cache[result.rel] = {
+                "sha256": result.sha256,
+                "errors": result.errors,
+                "warnings": result.warnings,
+                "manifest_files": result.manifest_files,
+            }
+        if args.stream:
+            print(
+                "rubric_excellence_file="
+                + json.dumps(
+                    {
+                        "file": result.rel,
+                        "status": "PASS" if not result.errors else "FAIL",
+                        "error_count": len(result.errors),
+                        "warning_count": len(result.warnings),
+                        "cached": result.cached,
+                    }
+                )
+            )
+            for err in result.errors:
+                print(f"- {err}")
+            sys.stdout.flush()
+    if cache is not None:
+        store_result_cache(cache_path, cache_context, cache)
+
+    results.sort(key=lambda r: order.get(r.rel, len(order)))
+    for result in results:
+        report.errors.extend(result.errors)
+        report.warnings.extend(result.warnings)
+    cache_hits = sum(1 for r in results if r.cached)
+    file_counts = {
+        "total": total_files,
+        "checked": len(results),
+        "cache_hits": cache_hits,
+        "validated": len(results) - cache_hits,
+        "jobs": args.jobs,
+    }
 
     output = {
         "status": "PASS" if not report.errors else "FAIL",
@@ -1423,6 +1696,7 @@ def main() -> int:
         "warning_count": len(report.warnings),
         "errors": report.errors,
         "warnings": report.warnings,
+        "files": file_counts,
     }
 
     if args.json_out:
@@ -1430,22 +1704,20 @@ def main() -> int:
         out_path.parent.mkdir(parents=True, exist_ok=True)
         out_path.write_text(json.dumps(output, indent=2) + "\n", encoding="utf-8")
 
+    # Streamed runs already printed each error next to its file.
+    listed_errors = [] if args.stream else report.errors
     if report.errors:
         print("rubric_excellence_check: FAIL")
-        for err in report.errors:
+        for err in listed_errors:
             print(f"- {err}")
-        if report.warnings:
-            print("warnings:")
-            for warning in report.warnings:
-                print(f"- {warning}")
-        return 1
-
-    print("rubric_excellence_check: PASS")
+    else:
+        print("rubric_excellence_check: PASS")
     if report.warnings:
         print("warnings:")
         for warning in report.warnings:
             print(f"- {warning}")
-    return 0
+    print("rubric_excellence_files=" + json.dumps(file_counts))
+    return 1 if report.errors else 0
 
 
 if __name__ == "__main__":